@@ -2,6 +2,7 @@
 
 import streamlit as st
 import os
+import hashlib
 from io import BytesIO
 
 # Import your core modules here
@@ -41,16 +42,24 @@ if st.button("Tailor Resume"):
         st.stop()
 
     with st.spinner("Processing..."):
-        # 1. Convert files to text
-        resume_converter = DocumentConverter(uploaded_resume)
-        resume_text = resume_converter.to_text()
-
-        jd_converter = DocumentConverter(uploaded_jd)
-        jd_text = jd_converter.to_text()
-
-        # 2. Extract resume data
-        extractor = GroqResumeExtractor(api_key=groq_api_key, model=model_name)
-        resume_data = extractor.extract(resume_text)
+        # 1. Convert files to text (cached per file content, so re-clicking
+        #    e.g. to switch output format does not re-parse the uploads)
+        resume_key = hashlib.md5(uploaded_resume.getvalue()).hexdigest()
+        if f"text:{resume_key}" not in st.session_state:
+            st.session_state[f"text:{resume_key}"] = DocumentConverter(uploaded_resume).to_text()
+        resume_text = st.session_state[f"text:{resume_key}"]
+
+        jd_key = hashlib.md5(uploaded_jd.getvalue()).hexdigest()
+        if f"text:{jd_key}" not in st.session_state:
+            st.session_state[f"text:{jd_key}"] = DocumentConverter(uploaded_jd).to_text()
+        jd_text = st.session_state[f"text:{jd_key}"]
+
+        # 2. Extract resume data (cached per resume content and model)
+        extraction_key = f"extract:{resume_key}:{model_name}"
+        if extraction_key not in st.session_state:
+            extractor = GroqResumeExtractor(api_key=groq_api_key, model=model_name)
+            st.session_state[extraction_key] = extractor.extract(resume_text)
+        resume_data = st.session_state[extraction_key]
 
         # 3. Parse job description
         parser = JobDescriptionParser()
@@ -72,9 +81,11 @@ if st.button("Tailor Resume"):
             output_ext = "pdf"
 
         st.success("Resume tailored successfully!")
+        # Hand Streamlit the buffer itself rather than a getvalue() copy of it
+        output_buffer.seek(0)
         st.download_button(
             label="Download Tailored Resume",
-            data=output_buffer.getvalue(),
+            data=output_buffer,
             file_name=f"tailored_resume.{output_ext}",
             mime=output_mime
         )
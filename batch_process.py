@@ -10,12 +10,23 @@ python batch_process.py --cvs-dir ./cvs --jobs-dir ./jobs --output-dir ./outputs
 
 import os
 import sys
+import shutil
+import asyncio
+import hashlib
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict
+import json
 import logging
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import the main system
 try:
     from main import ResumeCustomizationSystem
@@ -27,30 +38,135 @@ except ImportError:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Retry settings for rate-limited (429) or timed-out Groq calls
+MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 2.0
+
 class BatchProcessor:
     """Batch process multiple resumes and job descriptions"""
     
     def __init__(self, api_key: str = None):
+        self.api_key = api_key
         self.system = ResumeCustomizationSystem(api_key=api_key)
         self.results = []
     
     def find_files(self, directory: str, extensions: List[str]) -> List[Path]:
         """Find all files with specified extensions in directory"""
-        files = []
-        dir_path = Path(directory)
-        
-        if not dir_path.exists():
+        # One directory scan filtered by suffix; DirEntry.is_file() uses the
+        # type info returned by the scan instead of a stat() per file
+        ext_set = {ext.lower() for ext in extensions}
+        try:
+            with os.scandir(directory) as entries:
+                files = [
+                    Path(entry.path) for entry in entries
+                    if os.path.splitext(entry.name)[1].lower() in ext_set and entry.is_file()
+                ]
+        except FileNotFoundError:
             logger.warning(f"Directory not found: {directory}")
-            return files
-        
-        for ext in extensions:
-            pattern = f"*{ext}"
-            found = list(dir_path.glob(pattern))
-            files.extend(found)
+            return []
         
         return sorted(files)
     
-    def process_batch(self, cvs_dir: str, jobs_dir: str, output_dir: str, format_type: str = "docx") -> Dict:
+    def _execute(self, combinations: List[tuple], format_type: str, concurrency: int, workers: int) -> List:
+        """Run all combinations, spreading them over worker processes when workers > 1"""
+        if workers <= 1 or len(combinations) <= 1:
+            return asyncio.run(self._run_all(combinations, format_type, concurrency))
+        
+        # Each CV's combinations stay in one chunk (so its jobs are still tailored
+        # together); CVs go to the chunk with the fewest combinations so far
+        groups = {}
+        for position, combination in enumerate(combinations):
+            groups.setdefault(combination[0], []).append(position)
+        workers = min(workers, len(groups))
+        chunk_positions = [[] for _ in range(workers)]
+        for positions in sorted(groups.values(), key=len, reverse=True):
+            min(chunk_positions, key=len).extend(positions)
+        chunks = [
+            (self.api_key, [combinations[position] for position in positions], format_type, concurrency)
+            for positions in chunk_positions
+        ]
+        
+        # Every worker process has its own rate limiter, so each gets a share of GROQ_RPM
+        outcomes = [None] * len(combinations)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(workers,)) as executor:
+            for positions, chunk_outcomes in zip(chunk_positions, executor.map(_run_chunk, chunks)):
+                for position, outcome in zip(positions, chunk_outcomes):
+                    outcomes[position] = outcome
+        return outcomes
+    
+    async def _run_all(self, combinations: List[tuple], format_type: str, concurrency: int) -> List:
+        """Run all combinations grouped by CV, at most `concurrency` CVs at a time"""
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        # One group per CV so its resume is sent to Groq once for all of its jobs
+        groups = {}
+        for position, (cv_file, job_file, output_path) in enumerate(combinations):
+            groups.setdefault(cv_file, []).append((position, job_file, output_path))
+        
+        group_outcomes = await asyncio.gather(*[
+            self._run_cv_group(semaphore, cv_file, [(job_file, output_path) for _, job_file, output_path in jobs],
+                               format_type)
+            for cv_file, jobs in groups.items()
+        ], return_exceptions=True)
+        
+        outcomes = [None] * len(combinations)
+        for jobs, group_outcome in zip(groups.values(), group_outcomes):
+            for k, (position, _, _) in enumerate(jobs):
+                outcomes[position] = group_outcome if isinstance(group_outcome, Exception) else group_outcome[k]
+        return outcomes
+    
+    async def _run_cv_group(self, semaphore: asyncio.Semaphore, cv_file: Path, jobs: List[tuple],
+                            format_type: str) -> List[Dict]:
+        """Tailor one CV to its jobs, retrying failed jobs with exponential backoff on 429s and timeouts"""
+        async with semaphore:
+            results = [None] * len(jobs)
+            pending = list(range(len(jobs)))
+            
+            for attempt in range(1, MAX_ATTEMPTS + 1):
+                batch_results = await self.system.run_batch_async(
+                    cv_file=str(cv_file),
+                    job_files=[str(jobs[k][0]) for k in pending],
+                    output_names=[str(jobs[k][1]) for k in pending],
+                    format_type=format_type
+                )
+                
+                retry = []
+                for k, result in zip(pending, batch_results):
+                    results[k] = result
+                    if not result["success"] and self._is_retryable(result):
+                        retry.append(k)
+                
+                if not retry or attempt == MAX_ATTEMPTS:
+                    return results
+                
+                pending = retry
+                delay = RETRY_BASE_DELAY * 2 ** (attempt - 1)
+                logger.warning(f"Retrying {len(pending)} job(s) for {cv_file.name} in {delay:.0f}s "
+                               f"(attempt {attempt}/{MAX_ATTEMPTS}): {results[pending[0]].get('error')}")
+                await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _reuse_outcome(outcome, output_path: Path, format_type: str):
+        """Copy a duplicate combination's output file to this combination's path"""
+        if isinstance(outcome, Exception) or not outcome["success"]:
+            return outcome
+        
+        reused_file = f"{output_path}.{format_type.lower()}"
+        try:
+            shutil.copyfile(outcome["output_file"], reused_file)
+        except OSError as e:
+            # Only this combination fails; the rest of the batch is unaffected
+            return {"success": False, "error": f"Could not copy {outcome['output_file']}: {e}"}
+        return {**outcome, "output_file": reused_file}
+    
+    @staticmethod
+    def _is_retryable(result: Dict) -> bool:
+        """Check whether a failed result was caused by rate limiting or a timeout"""
+        error = str(result.get("error", "")).lower()
+        return "429" in error or "timed out" in error or "timeout" in error
+    
+    def process_batch(self, cvs_dir: str, jobs_dir: str, output_dir: str, format_type: str = "docx",
+                      concurrency: int = 4, workers: int = 1) -> Dict:
         """Process all CV and job combinations"""
         print("🔄 BATCH RESUME TAILORING")
         print("=" * 40)
@@ -72,71 +188,110 @@ class BatchProcessor:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         
         total_combinations = len(cv_files) * len(job_files)
-        print(f"🎯 Processing {total_combinations} combinations...")
+        print(f"🎯 Processing {total_combinations} combinations "
+              f"({workers} worker process(es), {concurrency} CV(s) at a time each)...")
         print()
         
+        # Extract each CV once up front; every combination then hits the converter cache.
+        # Hash CV text and job file contents so duplicate inputs are tailored only once.
+        # A file that cannot be read fails only its own combinations.
+        converter = self.system.resume_processor.doc_converter
+        cv_hashes = {}
+        job_hashes = {}
+        input_errors = {}
+        for cv_file in cv_files:
+            try:
+                extraction = converter.extract_from_file(str(cv_file))
+                cv_hashes[cv_file] = _content_hash(extraction.get("text") or cv_file.read_bytes())
+            except Exception as e:
+                input_errors[cv_file] = f"Could not read {cv_file}: {e}"
+        for job_file in job_files:
+            try:
+                job_hashes[job_file] = _content_hash(job_file.read_bytes())
+            except OSError as e:
+                input_errors[job_file] = f"Could not read {job_file}: {e}"
+        
+        # Build every combination up front so they can run concurrently; one
+        # batch timestamp plus the (i, j) indices keeps output names unique
+        batch_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        combinations = []
+        for i, cv_file in enumerate(cv_files, 1):
+            for j, job_file in enumerate(job_files, 1):
+                output_name = f"{cv_file.stem}_for_{job_file.stem}_{batch_ts}_{i}_{j}"
+                combinations.append((cv_file, job_file, Path(output_dir) / output_name))
+        
+        # Dispatch only the first combination of each (CV content, job content) pair
+        unique_combinations = []
+        first_index = {}
+        dispatch_index = []
+        for combination in combinations:
+            cv_file, job_file, _ = combination
+            if cv_file in input_errors or job_file in input_errors:
+                dispatch_index.append(None)
+                continue
+            key = (cv_hashes[cv_file], job_hashes[job_file])
+            if key not in first_index:
+                first_index[key] = len(unique_combinations)
+                unique_combinations.append(combination)
+            dispatch_index.append(first_index[key])
+        
+        duplicates = len(combinations) - len(unique_combinations)
+        if duplicates:
+            print(f"♻️ Skipping {duplicates} duplicate combination(s)")
+        
+        unique_outcomes = self._execute(unique_combinations, format_type, concurrency, workers)
+        outcomes = []
+        for k, combination in zip(dispatch_index, combinations):
+            cv_file, job_file, output_path = combination
+            if k is None:
+                outcomes.append({"success": False, "error": input_errors.get(cv_file) or input_errors[job_file]})
+            elif unique_combinations[k] is combination:
+                outcomes.append(unique_outcomes[k])
+            else:
+                outcomes.append(self._reuse_outcome(unique_outcomes[k], output_path, format_type))
+        
         successful = 0
         failed = 0
         
-        # Process each combination
-        for i, cv_file in enumerate(cv_files, 1):
-            cv_name = cv_file.stem
-            print(f"👤 CV {i}/{len(cv_files)}: {cv_name}")
+        # Collect results in submission order
+        for (cv_file, job_file, _), result in zip(combinations, outcomes):
+            print(f"👤 {cv_file.stem} × 💼 {job_file.stem}")
             
-            for j, job_file in enumerate(job_files, 1):
-                job_name = job_file.stem
-                print(f"  💼 Job {j}/{len(job_files)}: {job_name}")
+            if isinstance(result, Exception):
+                failed += 1
+                print(f"    💥 Exception: {str(result)}")
+                
+                self.results.append({
+                    "status": "exception",
+                    "cv_file": str(cv_file),
+                    "job_file": str(job_file),
+                    "error": str(result)
+                })
+            elif result["success"]:
+                successful += 1
+                print(f"    ✅ Created: {result['output_file']}")
                 
-                # Generate output filename
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_name = f"{cv_name}_for_{job_name}_{timestamp}"
-                output_path = Path(output_dir) / output_name
+                # Store result info
+                self.results.append({
+                    "status": "success",
+                    "cv_file": str(cv_file),
+                    "job_file": str(job_file),
+                    "output_file": result["output_file"],
+                    "candidate": result.get("candidate_name", "Unknown"),
+                    "job_title": result.get("job_title", "Unknown"),
+                    "company": result.get("company", "Unknown")
+                })
+            else:
+                failed += 1
+                error_msg = result.get("error", "Unknown error")
+                print(f"    ❌ Failed: {error_msg}")
                 
-                try:
-                    # Process this combination
-                    result = self.system.run(
-                        cv_file=str(cv_file),
-                        job_file=str(job_file),
-                        output_name=str(output_path),
-                        format_type=format_type
-                    )
-                    
-                    if result["success"]:
-                        successful += 1
-                        print(f"    ✅ Created: {result['output_file']}")
-                        
-                        # Store result info
-                        self.results.append({
-                            "status": "success",
-                            "cv_file": str(cv_file),
-                            "job_file": str(job_file),
-                            "output_file": result["output_file"],
-                            "candidate": result.get("candidate_name", "Unknown"),
-                            "job_title": result.get("job_title", "Unknown"),
-                            "company": result.get("company", "Unknown")
-                        })
-                    else:
-                        failed += 1
-                        error_msg = result.get("error", "Unknown error")
-                        print(f"    ❌ Failed: {error_msg}")
-                        
-                        self.results.append({
-                            "status": "failed",
-                            "cv_file": str(cv_file),
-                            "job_file": str(job_file),
-                            "error": error_msg
-                        })
-                        
-                except Exception as e:
-                    failed += 1
-                    print(f"    💥 Exception: {str(e)}")
-                    
-                    self.results.append({
-                        "status": "exception",
-                        "cv_file": str(cv_file),
-                        "job_file": str(job_file),
-                        "error": str(e)
-                    })
+                self.results.append({
+                    "status": "failed",
+                    "cv_file": str(cv_file),
+                    "job_file": str(job_file),
+                    "error": error_msg
+                })
         
         # Final summary
         print()
@@ -155,37 +310,69 @@ class BatchProcessor:
             "output_directory": output_dir
         }
     
-    def save_report(self, output_dir: str):
-        """Save detailed processing report"""
-        report_file = Path(output_dir) / f"batch_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+    def save_report(self, output_dir: str, json_report: bool = False):
+        """Save detailed processing report (plus the raw results as JSON if requested)"""
+        report_stem = f"batch_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        report_file = Path(output_dir) / f"{report_stem}.txt"
         
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write("BATCH RESUME TAILORING REPORT\n")
-            f.write("=" * 50 + "\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total combinations: {len(self.results)}\n\n")
-            
-            successful_count = sum(1 for r in self.results if r["status"] == "success")
-            f.write(f"Successful: {successful_count}\n")
-            f.write(f"Failed: {len(self.results) - successful_count}\n\n")
-            
-            f.write("DETAILED RESULTS:\n")
-            f.write("-" * 30 + "\n")
+        successful_count = sum(1 for r in self.results if r["status"] == "success")
+        
+        # Build the whole report in memory and write it in one call
+        lines = [
+            "BATCH RESUME TAILORING REPORT",
+            "=" * 50,
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Total combinations: {len(self.results)}",
+            "",
+            f"Successful: {successful_count}",
+            f"Failed: {len(self.results) - successful_count}",
+            "",
+            "DETAILED RESULTS:",
+            "-" * 30,
+        ]
+        
+        for i, result in enumerate(self.results, 1):
+            lines.append(f"\n{i}. {result['status'].upper()}")
+            lines.append(f"   CV: {Path(result['cv_file']).name}")
+            lines.append(f"   Job: {Path(result['job_file']).name}")
             
-            for i, result in enumerate(self.results, 1):
-                f.write(f"\n{i}. {result['status'].upper()}\n")
-                f.write(f"   CV: {Path(result['cv_file']).name}\n")
-                f.write(f"   Job: {Path(result['job_file']).name}\n")
-                
-                if result["status"] == "success":
-                    f.write(f"   Candidate: {result.get('candidate', 'Unknown')}\n")
-                    f.write(f"   Position: {result.get('job_title', 'Unknown')}\n")
-                    f.write(f"   Company: {result.get('company', 'Unknown')}\n")
-                    f.write(f"   Output: {Path(result['output_file']).name}\n")
-                else:
-                    f.write(f"   Error: {result.get('error', 'Unknown error')}\n")
+            if result["status"] == "success":
+                lines.append(f"   Candidate: {result.get('candidate', 'Unknown')}")
+                lines.append(f"   Position: {result.get('job_title', 'Unknown')}")
+                lines.append(f"   Company: {result.get('company', 'Unknown')}")
+                lines.append(f"   Output: {Path(result['output_file']).name}")
+            else:
+                lines.append(f"   Error: {result.get('error', 'Unknown error')}")
+        
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
         
         print(f"📋 Detailed report saved: {report_file}")
+        
+        if json_report:
+            json_file = Path(output_dir) / f"{report_stem}.json"
+            if ORJSON_AVAILABLE:
+                json_file.write_bytes(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+            else:
+                json_file.write_text(json.dumps(self.results, indent=2, ensure_ascii=False), encoding='utf-8')
+            print(f"📋 JSON report saved: {json_file}")
+
+def _content_hash(content) -> str:
+    """SHA-256 of text or bytes content"""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+def _init_worker(workers: int) -> None:
+    """Give a worker process its share of the Groq rate limit"""
+    from groq_resume_extractor import _rate_limiter
+    _rate_limiter.share(workers)
+
+def _run_chunk(args: tuple) -> List:
+    """Run a chunk of combinations in a worker process with its own event loop"""
+    api_key, combinations, format_type, concurrency = args
+    processor = BatchProcessor(api_key=api_key)
+    return asyncio.run(processor._run_all(combinations, format_type, concurrency))
 
 def main():
     """Main function for batch processing"""
@@ -195,7 +382,13 @@ def main():
     parser.add_argument("--output-dir", required=True, help="Output directory for generated resumes")
     parser.add_argument("--format", default="docx", choices=["docx", "pdf"], help="Output format")
     parser.add_argument("--api-key", help="Groq API key")
+    parser.add_argument("--concurrency", type=int, default=4,
+                       help="Number of CVs to process in parallel per worker (default: 4)")
+    parser.add_argument("--workers", type=int, default=1,
+                       help="Number of worker processes for CPU-bound parsing/rendering (default: 1)")
     parser.add_argument("--report", action="store_true", help="Save detailed processing report")
+    parser.add_argument("--json-report", action="store_true",
+                       help="Also save the per-combination results as JSON (implies --report)")
     
     args = parser.parse_args()
     
@@ -214,15 +407,17 @@ def main():
             cvs_dir=args.cvs_dir,
             jobs_dir=args.jobs_dir,
             output_dir=args.output_dir,
-            format_type=args.format
+            format_type=args.format,
+            concurrency=args.concurrency,
+            workers=args.workers
         )
         
         if result["success"]:
             print("\n🎉 Batch processing completed successfully!")
             
             # Save report if requested
-            if args.report:
-                processor.save_report(args.output_dir)
+            if args.report or args.json_report:
+                processor.save_report(args.output_dir, json_report=args.json_report)
         else:
             print(f"\n❌ Batch processing failed: {result['error']}")
             sys.exit(1)
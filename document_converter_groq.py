@@ -3,47 +3,205 @@ Resume Data Extraction System - Document Converter Module
 Converts PDF and Word documents to structured text for resume parsing
 """
 
-import pdfplumber
-import docx2txt
-from docx import Document
 import json
 import re
-from typing import Dict, Any, Optional
+import os
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 import tempfile
+import zipfile
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cache entries are read and written as bytes; orjson does both several times faster
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a cache entry to UTF-8 JSON bytes"""
+    return orjson.dumps(obj) if ORJSON_AVAILABLE else json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+# Bump when extraction or cleaning changes so stale cache entries are ignored
+CACHE_VERSION = "9"
+
+# PDF cleanup: one pass that collapses whitespace and inserts missing spaces
+# (camelCase, word/number boundaries, emails, phone numbers) using a plain
+# replacement string, so no Python callback runs per match. Single spaces are
+# not matched at all since they are already normalized. Its zero-width rules put
+# a space at every such boundary; the chained re.sub passes it replaced consumed
+# the characters they matched and so skipped some ("X12X" was "X 1 2X", now "X 1 2 X").
+_PDF_SPACING_RE = re.compile(
+    r" \s+|[^\S ]\s*"
+    r"|(?<=[a-z])(?=[A-Z])|(?<=[a-zA-Z])(?=@)|(?<=\w)(?=\d)|(?<=\d)(?=[-+()\w])"
+)
+
+# Section headers glued to the following word get a newline after them. This runs
+# after the spacing pass, so a header glued to a preceding lowercase letter or digit
+# is also split from it ("aEXPERIENCES" -> "a EXPERIENCE\nS")
+_PDF_SECTION_RE = re.compile(r"(?:EXPERIENCE|EDUCATION|SKILLS|PROJECTS|CERTIFICATIONS|SUMMARY)(?=[A-Z])")
+
+# DOCX cleanup pattern (also the whitespace-only PDF cleanup)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Pages whose space-to-character ratio reaches this were laid out with proper
+# word spacing; the space-insertion rules are skipped for them since they only
+# mangle already clean text (e.g. "iPhone7" -> "i Phone 7")
+PDF_CLEAN_SPACE_RATIO = 0.12
+
+# Set to True to always run the full space-insertion cleanup
+FORCE_FULL_PDF_CLEANING = False
+
+# PDFs with more pages than this are extracted in a process pool; below it
+# the cost of starting worker processes outweighs the per-page savings
+PARALLEL_PAGE_THRESHOLD = 2
+
+def _extract_page(filepath: str, page_index: int) -> str:
+    """Extract the text of a single PDF page (runs in a worker process)"""
+    import pdfplumber
+    
+    with pdfplumber.open(filepath) as pdf:
+        return pdf.pages[page_index].extract_text(x_tolerance=3, y_tolerance=3) or ""
+
+# Below this many extracted characters the PDFium result is treated as a miss
+# (scanned or oddly encoded PDFs) and pdfplumber gets a try instead
+PDFIUM_MIN_TEXT_LENGTH = 50
+
+def _pdfium_page_texts(filepath: str) -> Optional[List[str]]:
+    """Extract per-page text with pypdfium2, or None if it is not installed"""
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        return None
+    
+    pdf = pdfium.PdfDocument(filepath)
+    try:
+        page_texts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            page_texts.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+        return page_texts
+    finally:
+        pdf.close()
+
+# WordprocessingML namespace and the tags that carry text inside a paragraph
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_DOCX_TEXT_TAGS = {_W + 't': None, _W + 'tab': '\t', _W + 'br': '\n', _W + 'cr': '\n'}
+_DOCX_HEADER_RE = re.compile(r'word/header\d*\.xml')
+_DOCX_FOOTER_RE = re.compile(r'word/footer\d*\.xml')
+# Text boxes put paragraphs inside paragraphs, usually twice: a DrawingML copy and,
+# inside mc:Fallback, a VML copy for older readers
+_MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+def _raw_pdf_text(page_texts: List[str]) -> str:
+    """Page texts as extracted, before cleaning (contact details are matched in this,
+    since spacing cleanup can split an email or URL apart)"""
+    return "\n".join(page_text for page_text in page_texts if page_text).strip()
+
+def _fast_docx_text(filepath: str) -> str:
+    """Extract paragraph text from a DOCX (headers, body, then footers) using lxml"""
+    from lxml import etree
+    
+    with zipfile.ZipFile(filepath) as archive:
+        names = archive.namelist()
+        parts = ([n for n in names if _DOCX_HEADER_RE.fullmatch(n)]
+                 + ["word/document.xml"]
+                 + [n for n in names if _DOCX_FOOTER_RE.fullmatch(n)])
+        
+        paragraphs = []
+        for part in parts:
+            xml = archive.read(part)
+            nested = b'txbxContent' in xml
+            root = etree.fromstring(xml)
+            for paragraph in root.iter(_W + 'p'):
+                # With text boxes, each paragraph keeps only its own text and the
+                # fallback copies are skipped, so no text is emitted twice
+                if nested and next(paragraph.iterancestors(_MC_FALLBACK), None) is not None:
+                    continue
+                chunks = []
+                for node in paragraph.iter(*_DOCX_TEXT_TAGS):
+                    if nested and next(node.iterancestors(_W + 'p')) is not paragraph:
+                        continue
+                    replacement = _DOCX_TEXT_TAGS[node.tag]
+                    chunks.append((node.text or "") if replacement is None else replacement)
+                text = "".join(chunks)
+                if text.strip():
+                    paragraphs.append(text)
+    
+    return "\n".join(paragraphs)
+
 class DocumentConverter:
     """Convert PDF/Word documents to structured text for resume parsing"""
     
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = ".doc_cache"):
+        """
+        Args:
+            cache_dir: Directory for cached extractions keyed by file content hash
+                       (None disables caching)
+        """
         self.supported_formats = [".pdf", ".docx", ".doc"]
+        self.cache_dir = Path(cache_dir) if cache_dir else None
     
     def extract_from_pdf(self, filepath: str) -> Dict[str, Any]:
-        """Extract text from PDF using pdfplumber"""
+        """Extract text from PDF using pypdfium2, falling back to pdfplumber"""
         try:
-            with pdfplumber.open(filepath) as pdf:
-                text_content = ""
-                metadata = {
-                    "total_pages": len(pdf.pages)
-                }
-                
-                for page in pdf.pages:
-                    page_text = page.extract_text(x_tolerance=3, y_tolerance=3)
-                    if page_text:
-                        cleaned_text = self.clean_pdf_text(page_text)
-                        text_content += cleaned_text
-                
+            # Fast path: PDFium's native text extraction
+            try:
+                page_texts = _pdfium_page_texts(filepath)
+            except Exception as e:
+                logger.warning(f"pypdfium2 extraction failed for {filepath}, using pdfplumber: {e}")
+                page_texts = None
+            
+            if page_texts is not None and sum(len(t.strip()) for t in page_texts) >= PDFIUM_MIN_TEXT_LENGTH:
+                cleaned_pages = [self.clean_pdf_text(page_text) for page_text in page_texts if page_text]
                 return {
-                    "text": text_content.strip(),
+                    "text": "".join(cleaned_pages).strip(),
+                    "raw_text": _raw_pdf_text(page_texts),
                     "format": "pdf",
-                    "metadata": metadata,
-                    "extraction_method": "pdfplumber"
+                    "metadata": {
+                        "total_pages": len(page_texts)
+                    },
+                    "extraction_method": "pypdfium2"
                 }
+            
+            import pdfplumber
+            
+            with pdfplumber.open(filepath) as pdf:
+                total_pages = len(pdf.pages)
+                if total_pages <= PARALLEL_PAGE_THRESHOLD:
+                    page_texts = [
+                        page.extract_text(x_tolerance=3, y_tolerance=3) for page in pdf.pages
+                    ]
+            
+            # Larger documents: lay out pages in parallel worker processes
+            if total_pages > PARALLEL_PAGE_THRESHOLD:
+                max_workers = min(os.cpu_count() or 1, total_pages)
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    page_texts = list(executor.map(partial(_extract_page, filepath), range(total_pages)))
+            
+            cleaned_pages = [self.clean_pdf_text(page_text) for page_text in page_texts if page_text]
+            
+            return {
+                "text": "".join(cleaned_pages).strip(),
+                "raw_text": _raw_pdf_text(page_texts),
+                "format": "pdf",
+                "metadata": {
+                    "total_pages": total_pages
+                },
+                "extraction_method": "pdfplumber"
+            }
                 
         except Exception as e:
             logger.error(f"PDF extraction failed for {filepath}: {str(e)}")
@@ -54,19 +212,23 @@ class DocumentConverter:
             }
     
     def extract_from_docx(self, filepath: str) -> Dict[str, Any]:
-        """Extract text from DOCX using python-docx and docx2txt"""
+        """Extract text from DOCX by reading the WordprocessingML parts directly"""
         try:
-            # Method 1: Try docx2txt (simpler, preserves formatting better)
-            text_content = docx2txt.process(filepath)
-            
-            if not text_content or len(text_content.strip()) < 50:
+            try:
+                # Method 1: Pull paragraph text straight from the XML with lxml
+                text_content = _fast_docx_text(filepath)
+                extraction_method = "zipfile + lxml"
+            except Exception as e:
                 # Method 2: Fallback to python-docx
+                logger.warning(f"Fast DOCX extraction failed for {filepath}, using python-docx: {e}")
+                from docx import Document
                 doc = Document(filepath)
                 paragraphs = []
                 for paragraph in doc.paragraphs:
                     if paragraph.text.strip():
                         paragraphs.append(paragraph.text.strip())
                 text_content = "\n".join(paragraphs)
+                extraction_method = "python-docx"
             
             # Clean and structure the text
             cleaned_text = self.clean_docx_text(text_content)
@@ -75,7 +237,7 @@ class DocumentConverter:
                 "text": cleaned_text,
                 "format": "docx",
                 "metadata": {
-                    "extraction_method": "docx2txt + python-docx"
+                    "extraction_method": extraction_method
                 }
             }
             
@@ -105,42 +267,69 @@ class DocumentConverter:
                 "error": f"Unsupported file format: {file_ext}. Supported: {self.supported_formats}"
             }
         
+        # Reuse a previous extraction of identical file contents
+        cache_file = None
+        if self.cache_dir is not None:
+            cache_file = self._cache_path(path, file_ext)
+            cached = self._load_cached(cache_file)
+            if cached is not None:
+                logger.info(f"Using cached extraction for {path.name}")
+                return cached
+        
         logger.info(f"Extracting text from {file_ext.upper()}: {path.name}")
         
         if file_ext == ".pdf":
-            return self.extract_from_pdf(filepath)
+            result = self.extract_from_pdf(filepath)
         elif file_ext in [".docx", ".doc"]:
-            return self.extract_from_docx(filepath)
+            result = self.extract_from_docx(filepath)
         else:
             return {
                 "text": "",
                 "error": f"Handler not implemented for {file_ext}"
             }
+        
+        if cache_file is not None and "error" not in result:
+            self._store_cached(cache_file, result)
+        
+        return result
+    
+    def _cache_path(self, path: Path, file_ext: str) -> Path:
+        """Build the cache file path from the SHA-256 of the file contents"""
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        return self.cache_dir / f"{digest}_v{CACHE_VERSION}{file_ext}.json"
+    
+    def _load_cached(self, cache_file: Path) -> Optional[Dict[str, Any]]:
+        """Load a cached extraction result, if present"""
+        try:
+            with open(cache_file, 'rb') as f:
+                return _json_loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {cache_file}: {e}")
+            return None
+    
+    def _store_cached(self, cache_file: Path, result: Dict[str, Any]) -> None:
+        """Write an extraction result to the cache (atomically, safe for concurrent runs)"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile('wb', dir=self.cache_dir, suffix=".tmp", delete=False) as f:
+                f.write(_json_dumps(result))
+            os.replace(f.name, cache_file)
+        except Exception as e:
+            logger.warning(f"Could not cache extraction: {e}")
     
     def clean_pdf_text(self, text: str) -> str:
         """Clean and normalize PDF extracted text"""
         if not text:
             return ""
         
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Fix common PDF extraction issues
-        text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)  # Add space between camelCase
-        text = re.sub(r'(\w)(\d)', r'\1 \2', text)  # Space between word and number
-        text = re.sub(r'(\d)(\w)', r'\1 \2', text)  # Space between number and word
-        
-        # Clean email and phone patterns
-        text = re.sub(r'([a-zA-Z])(@)', r'\1 \2', text)  # Space before @
-        text = re.sub(r'(\d)([-+()])', r'\1 \2', text)  # Space in phone numbers
-        
-        # Ensure newlines after common section headers
-        section_patterns = [
-            r'(EXPERIENCE|EDUCATION|SKILLS|PROJECTS|CERTIFICATIONS|SUMMARY)'
-        ]
-        for pattern in section_patterns:
-            text = re.sub(f'({pattern})([A-Z])', r'\1\n\2', text)
-        
+        space_ratio = text.count(' ') / len(text)
+        if space_ratio >= PDF_CLEAN_SPACE_RATIO and not FORCE_FULL_PDF_CLEANING:
+            text = _WHITESPACE_RE.sub(' ', text)
+        else:
+            text = _PDF_SPACING_RE.sub(' ', text)
+        text = _PDF_SECTION_RE.sub(r'\g<0>\n', text)
         return text.strip()
     
     def clean_docx_text(self, text: str) -> str:
@@ -151,13 +340,12 @@ class DocumentConverter:
         # Normalize line breaks
         text = text.replace('\r\n', '\n').replace('\r', '\n')
         
-        # Remove excessive empty lines (keep max 2 consecutive)
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        
-        # Clean up spacing
+        # Clean up spacing; runs of empty lines collapse to a single separator here,
+        # so no separate pass over the text is needed for excessive newlines
+        collapse_whitespace = _WHITESPACE_RE.sub
         lines = []
         for line in text.split('\n'):
-            cleaned_line = re.sub(r'\s+', ' ', line).strip()
+            cleaned_line = collapse_whitespace(' ', line).strip()
             if cleaned_line:  # Only keep non-empty lines
                 lines.append(cleaned_line)
             elif lines and lines[-1]:  # Keep one empty line as separator
@@ -194,7 +382,10 @@ def main():
     if args.info:
         # Show document info
         info = converter.get_document_info(args.file)
-        print(json.dumps(info, indent=2))
+        if ORJSON_AVAILABLE:
+            print(orjson.dumps(info, option=orjson.OPT_INDENT_2).decode())
+        else:
+            print(json.dumps(info, indent=2))
     else:
         # Extract text
         result = converter.extract_from_file(args.file)
@@ -5,39 +5,225 @@ Uses Groq API with openai/gpt-oss-20b model and embedded API key
 
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, List, Optional
 import re
 import os
+import time
+import sqlite3
+import hashlib
+import zlib
+import threading
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson parses LLM output, streamed events and cache entries several times faster
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+def _json_dumps(obj: Any) -> bytes:
+    """Compact UTF-8 encoded JSON, via orjson when available"""
+    return orjson.dumps(obj) if ORJSON_AVAILABLE else json.dumps(obj).encode("utf-8")
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class GroqResumeExtractor:
-    """Extract structured data from resume text using Groq API with custom model"""
+# Bump when the extraction prompt, request parameters or post-processing change
+# so cached responses are not reused
+PROMPT_VERSION = "v5"
+
+# Cached Groq extractions, keyed by input hash, prompt version and model
+DEFAULT_CACHE_PATH = os.path.join("~", ".cache", "groq_resume", "llm_cache.sqlite3")
+CACHE_TTL_SECONDS = 7 * 86400
+
+# Groq requests per minute allowed per process (0 disables the local limit; pauses
+# requested by Groq's rate-limit headers still apply)
+GROQ_RPM = int(os.environ.get("GROQ_RPM", 30))
+
+# Prompt plus completion tokens a request may need before it is rejected locally
+# (the context window of openai/gpt-oss-20b)
+MAX_REQUEST_TOKENS = int(os.environ.get("GROQ_MAX_REQUEST_TOKENS", 131072))
+
+@functools.lru_cache(maxsize=None)
+def _token_encoding():
+    """tiktoken encoding shared by all extractors (slow to build), or None to estimate"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, estimating token counts: {e}")
+        return None
+
+def count_tokens(text: str) -> int:
+    """Token count of `text` (tiktoken when installed, otherwise about 4 characters a token)"""
+    encoding = _token_encoding()
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+class RateLimiter:
+    """Thread-safe token bucket: allows short bursts, then `per_minute` requests a minute"""
     
-    def __init__(self, api_key: str = None):
-        # ⚠️ REPLACE WITH YOUR ACTUAL GROQ API KEY
-        self.api_key = api_key or "YOUR_GROQ_API_KEY_HERE"  # PUT YOUR KEY HERE
-        # Specific model requested
-        self.model = "openai/gpt-oss-20b"
-        # Groq API endpoint
-        self.base_url = "https://api.groq.com/openai/v1/chat/completions"
-        logger.info(f"Groq extractor initialized with model: {self.model}")
+    def __init__(self, per_minute: int, burst: int = 5):
+        self.interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
     
-    def create_extraction_prompt(self, resume_text: str) -> str:
-        """Create a structured prompt for resume extraction"""
-        prompt = f"""
-You are an expert resume parser. Extract structured information from the following resume text and return it as valid JSON.
+    def acquire(self) -> None:
+        """Block until a request may be sent"""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._paused_until - now)
+            if self.interval:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) / self.interval)
+                self._updated = now
+                # Reserve a token now; if the bucket is empty, wait until it refills
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens * self.interval)
+        if wait:
+            time.sleep(wait)
+    
+    def share(self, parts: int) -> None:
+        """Keep to 1/parts of the rate and burst, for one of `parts` processes sharing the quota"""
+        with self._lock:
+            self.interval *= parts
+            self.capacity = float(max(1, int(self.capacity) // parts))
+            self._tokens = min(self._tokens, self.capacity)
+    
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for `seconds`, e.g. when Groq reports its limit is used up"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
 
-RESUME TEXT:
-{resume_text}
+# Groq reports limit resets as durations such as "7.66s" or "2m59.56s"
+_DURATION_RE = re.compile(r"(?:(\d+)h)?(?:(\d+)m(?!s))?(?:(\d+(?:\.\d+)?)s)?(?:(\d+)ms)?")
 
-Extract and structure the information into this exact JSON format:
+def _parse_duration(value: str) -> float:
+    """Seconds in a Groq rate-limit duration (0 if it cannot be parsed)"""
+    match = _DURATION_RE.fullmatch(value.strip())
+    if not match:
+        return 0.0
+    hours, minutes, seconds, millis = (float(group) if group else 0.0 for group in match.groups())
+    return hours * 3600 + minutes * 60 + seconds + millis / 1000
 
-{{
-  "personal_details": {{
+def _rate_limit_pause(headers) -> float:
+    """How long to hold back requests according to Groq's rate-limit response headers"""
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            return 0.0
+    for kind in ("requests", "tokens"):
+        if headers.get(f"x-ratelimit-remaining-{kind}") == "0":
+            return _parse_duration(headers.get(f"x-ratelimit-reset-{kind}", ""))
+    return 0.0
+
+# Shared by every extractor in the process so parallel batch threads respect one limit
+_rate_limiter = RateLimiter(GROQ_RPM)
+
+def create_groq_session(pool_maxsize: int = 16, backoff_factor: float = 0.3) -> requests.Session:
+    """
+    HTTP session with pooled keep-alive connections that retries transient Groq
+    errors with backoff. One session can be shared by the extractor, the job
+    parser and the resume generator so they reuse the same connections.
+    """
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=backoff_factor, status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=frozenset(["POST"]), raise_on_status=False)
+    session.mount("https://", HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize,
+                                          max_retries=retries))
+    return session
+
+# zlib level for cached responses; repetitive resume JSON shrinks several-fold even at
+# fast levels, and decompressing is far cheaper than the request it replaces
+CACHE_COMPRESSION_LEVEL = 6
+
+class LLMResponseCache:
+    """SQLite cache of successful LLM extractions (safe to share between threads and processes)"""
+    
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: int = CACHE_TTL_SECONDS):
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "input_hash TEXT NOT NULL, prompt_version TEXT NOT NULL, model_id TEXT NOT NULL, "
+                "response TEXT NOT NULL, expires_at REAL NOT NULL, "
+                "PRIMARY KEY (input_hash, prompt_version, model_id))"
+            )
+    
+    def get(self, input_hash: str, prompt_version: str, model_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response, or None if missing or expired"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM llm_cache WHERE input_hash = ? AND prompt_version = ? "
+                "AND model_id = ? AND expires_at > ?",
+                (input_hash, prompt_version, model_id, time.time())
+            ).fetchone()
+        if not row:
+            return None
+        # Entries are stored zlib-compressed; older uncompressed rows come back as text
+        response = row[0]
+        return _json_loads(zlib.decompress(response) if isinstance(response, bytes) else response)
+    
+    def set(self, input_hash: str, prompt_version: str, model_id: str, response: Dict[str, Any]) -> None:
+        """Store a response, replacing any previous entry for the same key"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?)",
+                (input_hash, prompt_version, model_id,
+                 sqlite3.Binary(zlib.compress(_json_dumps(response), CACHE_COMPRESSION_LEVEL)),
+                 time.time() + self.ttl)
+            )
+    
+    def invalidate(self, input_hash: Optional[str] = None, prompt_version: Optional[str] = None) -> int:
+        """Delete entries for one input and/or prompt version (everything if neither is given)"""
+        conditions, params = [], []
+        if input_hash is not None:
+            conditions.append("input_hash = ?")
+            params.append(input_hash)
+        if prompt_version is not None:
+            conditions.append("prompt_version = ?")
+            params.append(prompt_version)
+        
+        query = "DELETE FROM llm_cache"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        with self._lock, self._conn:
+            return self._conn.execute(query, params).rowcount
+
+# JSON schema of each top-level field in the extraction result, in prompt order
+_SCHEMA_FIELDS = {
+    "personal_details": """  "personal_details": {
     "name": "Full name of the person",
     "email": "Email address",
     "phone": "Phone number",
@@ -45,18 +231,18 @@ Extract and structure the information into this exact JSON format:
     "linkedin": "LinkedIn profile URL",
     "github": "GitHub profile URL",
     "website": "Personal website URL"
-  }},
-  "education": [
-    {{
+  }""",
+    "education": """  "education": [
+    {
       "degree": "Degree type and field",
       "institution": "School/University name",
       "graduation_year": "Year of graduation",
       "gpa": "GPA if mentioned",
       "location": "Location of institution"
-    }}
-  ],
-  "work_experience": [
-    {{
+    }
+  ]""",
+    "work_experience": """  "work_experience": [
+    {
       "position": "Job title",
       "company": "Company name",
       "start_date": "Start date",
@@ -64,51 +250,280 @@ Extract and structure the information into this exact JSON format:
       "location": "Work location",
       "description": "Job responsibilities and achievements",
       "technologies": ["List of technologies used"]
-    }}
-  ],
-  "skills": {{
+    }
+  ]""",
+    "skills": """  "skills": {
     "technical_skills": ["Programming languages, tools, frameworks"],
     "soft_skills": ["Communication, leadership, etc."],
     "languages": ["Spoken languages with proficiency level"]
-  }},
-  "achievements": [
-    {{
+  }""",
+    "achievements": """  "achievements": [
+    {
       "title": "Achievement title",
       "description": "Description of achievement",
       "date": "Date or year"
-    }}
-  ],
-  "projects": [
-    {{
+    }
+  ]""",
+    "projects": """  "projects": [
+    {
       "name": "Project name",
       "description": "Project description",
       "technologies": ["Technologies used"],
       "url": "Project URL if available",
       "date": "Project date"
-    }}
-  ],
-  "certifications": [
-    {{
+    }
+  ]""",
+    "certifications": """  "certifications": [
+    {
       "name": "Certification name",
       "issuer": "Issuing organization",
       "date": "Issue date",
       "expiry": "Expiry date if applicable"
-    }}
-  ],
-  "summary": "Brief professional summary"
-}}
+    }
+  ]""",
+    "summary": '  "summary": "Brief professional summary"',
+}
+
+# Fields requested together in sectioned extraction, with each request's output token budget
+_EXTRACTION_SECTIONS = {
+    "personal_details": (("personal_details", "summary"), 400),
+    "education": (("education",), 600),
+    "work_experience": (("work_experience",), 1200),
+    "skills": (("skills",), 400),
+    "projects": (("projects", "achievements"), 800),
+    "certifications": (("certifications",), 400),
+}
+
+# Contact details found deterministically, used for fields the LLM left empty. They are
+# matched in the uncleaned document text: PDF spacing cleanup splits digits from letters
+# (john2024@x.com would become "john 2024@x.com")
+_PERSONAL_REGEXES = {
+    "email": re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+"),
+    "phone": re.compile(r"[+(]?\d[\d \t().-]{7,}\d"),
+    "linkedin": re.compile(r"(?:https?://)?(?:[\w-]+\.)?linkedin\.com/in/[\w%-]+", re.IGNORECASE),
+    "github": re.compile(r"(?:https?://)?(?:www\.)?github\.com/[\w-]+", re.IGNORECASE),
+    "website": re.compile(r"(?:https?://|www\.)[^\s,;|()<>]+", re.IGNORECASE),
+}
+
+# Literal substrings at least one of which must occur for a field's regex to match;
+# checking them with a substring search first skips full regex scans for absent fields
+_PERSONAL_LITERALS = {
+    "email": ("@",),
+    "linkedin": ("linkedin.com/in/",),
+    "github": ("github.com/",),
+    "website": ("http://", "https://", "www."),
+}
+
+# Profile hosts reported as linkedin/github rather than as a personal website
+_PROFILE_HOST_RE = re.compile(r"linkedin\.com|github\.com", re.IGNORECASE)
 
-IMPORTANT RULES:
+# URLs are only taken from the contact block at the top of the resume (its first lines,
+# within the first characters); further down they are employers' and projects' sites
+_PROFILE_FIELDS = ("linkedin", "github", "website")
+CONTACT_BLOCK_LINES = 15
+CONTACT_BLOCK_CHARS = 800
+
+def _extract_personal_details(text: str) -> Dict[str, str]:
+    """Find email and phone in resume text, and LinkedIn, GitHub and website in its
+    contact block, with regexes"""
+    contact_block = "\n".join(text[:CONTACT_BLOCK_CHARS].splitlines()[:CONTACT_BLOCK_LINES])
+    lowered_text, lowered_block = text.lower(), contact_block.lower()
+    details = {}
+    for field, pattern in _PERSONAL_REGEXES.items():
+        in_block = field in _PROFILE_FIELDS
+        searched = contact_block if in_block else text
+        literals = _PERSONAL_LITERALS.get(field)
+        if literals and not any(literal in (lowered_block if in_block else lowered_text) for literal in literals):
+            continue
+        for match in pattern.finditer(searched):
+            value = match.group(0).rstrip(".,:")
+            if field == "phone" and not 10 <= sum(c.isdigit() for c in value) <= 15:
+                continue  # dates and ID numbers, not a phone number
+            if field == "website" and _PROFILE_HOST_RE.search(value):
+                continue
+            details[field] = value.strip()
+            break
+    return details
+
+_EXTRACTION_RULES = """IMPORTANT RULES:
 1. Return ONLY valid JSON
 2. Use empty string "" for missing text fields
 3. Use empty array [] for missing lists
 4. Do not include any explanatory text outside the JSON
 5. Ensure all JSON brackets are properly closed
 """
-        return prompt
+
+# The only characters that affect JSON nesting; everything between them is skipped in C
+_JSON_STRUCTURAL_RE = re.compile(r'[{}"\\]')
+
+def _prompt_prefix(task: str, schema_fields: Dict[str, str]) -> str:
+    """Static part of an extraction prompt; the resume text is appended last so every
+    request with the same schema shares a byte-identical prefix (Groq prompt caching)"""
+    schema = ",\n".join(schema_fields.values())
+    return f"""
+You are an expert resume parser. {task}
+
+Extract and structure the information into this exact JSON format:
+
+{{
+{schema}
+}}
+
+{_EXTRACTION_RULES}
+RESUME TEXT:
+"""
+
+# Prompts are built once at import; per request only the resume text is appended
+_EXTRACTION_PROMPT_PREFIX = _prompt_prefix(
+    "Extract structured information from the resume text below and return it as valid JSON.",
+    _SCHEMA_FIELDS
+)
+_SECTION_PROMPT_PREFIXES = {
+    section: _prompt_prefix(
+        f"Extract only the {' and '.join(fields)} information from the resume text below and return it as valid JSON.",
+        {field: _SCHEMA_FIELDS[field] for field in fields}
+    )
+    for section, (fields, _) in _EXTRACTION_SECTIONS.items()
+}
+
+if MSGSPEC_AVAILABLE:
+    # Only the fields read from a streamed chunk; msgspec skips the rest
+    # (id, model, x_groq, ...) without building objects for them
+    class _StreamDelta(msgspec.Struct):
+        content: Optional[str] = None
+    
+    class _StreamChoice(msgspec.Struct):
+        delta: Optional[_StreamDelta] = None
+    
+    class _StreamChunk(msgspec.Struct):
+        choices: Optional[List[_StreamChoice]] = None
+    
+    _stream_chunk_decoder = msgspec.json.Decoder(_StreamChunk)
+
+def stream_delta_content(data) -> Optional[str]:
+    """Content piece of one streamed chat completion chunk (the bytes or str after
+    "data: "); decoded per token, so msgspec's typed decoder is used when available"""
+    if MSGSPEC_AVAILABLE:
+        choices = _stream_chunk_decoder.decode(data).choices
+        delta = choices[0].delta if choices else None
+        return delta.content if delta is not None else None
+    choices = _json_loads(data).get("choices")
+    return choices[0].get("delta", {}).get("content") if choices else None
+
+class JSONObjectScanner:
+    """Finds the first complete top-level JSON object in text that arrives in pieces"""
+    
+    def __init__(self):
+        self.buffer = ""
+        self.start = -1
+        self.end = -1
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped_pos = -1
+    
+    def feed(self, chunk: str) -> bool:
+        """Append text; returns True once the outer object has been closed"""
+        self.buffer += chunk
+        if self.end >= 0:
+            return True
+        
+        for match in _JSON_STRUCTURAL_RE.finditer(self.buffer, self._pos):
+            pos = match.start()
+            char = match.group()
+            if pos == self._escaped_pos:
+                continue  # character escaped by the preceding backslash
+            if self.start < 0:
+                if char == "{":
+                    self.start = pos
+                    self._depth = 1
+            elif self._in_string:
+                if char == "\\":
+                    self._escaped_pos = pos + 1
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.end = pos + 1
+                    return True
+        
+        self._pos = len(self.buffer)
+        return False
+    
+    @property
+    def json_text(self) -> str:
+        """The completed JSON object, or "" if none has closed yet"""
+        return self.buffer[self.start:self.end] if self.end >= 0 else ""
+
+class GroqResumeExtractor:
+    """Extract structured data from resume text using Groq API with custom model"""
+    
+    def __init__(self, api_key: str = None, cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+                 sectioned: bool = False, session: Optional[requests.Session] = None):
+        """
+        Args:
+            api_key: Groq API key
+            cache_path: SQLite file for cached extractions (None disables caching)
+            sectioned: Extract each resume section with its own small parallel request
+                       (lower latency and per-section caching, but more requests per resume)
+            session: HTTP session to send requests on (see create_groq_session);
+                     a private one is created if not given
+        """
+        # ⚠️ REPLACE WITH YOUR ACTUAL GROQ API KEY
+        self.api_key = api_key or "YOUR_GROQ_API_KEY_HERE"  # PUT YOUR KEY HERE
+        # Specific model requested
+        self.model = "openai/gpt-oss-20b"
+        # Groq API endpoint
+        self.base_url = "https://api.groq.com/openai/v1/chat/completions"
+        self.sectioned = sectioned
+        # Cleared if the model rejects response_format, so later requests skip it
+        self._json_mode = True
+        # Pooled keep-alive connections (shared by batch threads)
+        self._session = session if session is not None else create_groq_session()
+        # Response cache (None disables it)
+        self._cache = None
+        if cache_path:
+            try:
+                self._cache = LLMResponseCache(cache_path)
+            except Exception as e:
+                logger.warning(f"LLM response cache disabled: {e}")
+        logger.info(f"Groq extractor initialized with model: {self.model}")
+    
+    def _input_hash(self, resume_text: str) -> str:
+        """Hash of the resume text used as the response cache key"""
+        return hashlib.sha256(resume_text.encode("utf-8")).hexdigest()
+    
+    def _normalized_hash(self, resume_text: str) -> str:
+        """Hash of the resume text with whitespace collapsed, so re-uploads that only
+        differ in spacing or line breaks share a cache entry. Case is kept: text that
+        differs in capitalization (names, acronyms) may extract differently."""
+        normalized = " ".join(resume_text.split())
+        return "ws:" + hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    
+    def invalidate(self, input_hash: Optional[str] = None, prompt_version: Optional[str] = None) -> int:
+        """Drop cached extractions for one input hash (exact or "ws:" key) and/or
+        prompt version (all if neither given)"""
+        if self._cache is None:
+            return 0
+        return self._cache.invalidate(input_hash=input_hash, prompt_version=prompt_version)
+    
+    def create_extraction_prompt(self, resume_text: str) -> str:
+        """Create a structured prompt for resume extraction"""
+        return _EXTRACTION_PROMPT_PREFIX + resume_text + "\n"
     
-    def extract_with_groq(self, resume_text: str) -> Dict[str, Any]:
-        """Extract resume data using Groq API with openai/gpt-oss-20b model"""
+    def create_section_prompt(self, section: str, resume_text: str) -> str:
+        """Create a prompt that extracts only the fields of one resume section"""
+        return _SECTION_PROMPT_PREFIXES[section] + resume_text + "\n"
+    
+    def extract_with_groq(self, resume_text: str, contact_text: Optional[str] = None) -> Dict[str, Any]:
+        """Extract resume data using Groq API with openai/gpt-oss-20b model
+        (contact details missing from the reply are looked up in contact_text,
+        the uncleaned document text, or else in resume_text)"""
         try:
             if self.api_key == "YOUR_GROQ_API_KEY_HERE":
                 return {
@@ -116,12 +531,110 @@ IMPORTANT RULES:
                     "error": "Please replace 'YOUR_GROQ_API_KEY_HERE' with your actual Groq API key in the code"
                 }
             
+            # Same resume text (exactly, or up to whitespace and case) with the same
+            # prompt and model: reuse the earlier response
+            input_hash = self._input_hash(resume_text)
+            normalized_hash = self._normalized_hash(resume_text)
+            if self._cache is not None:
+                for cache_key in (input_hash, normalized_hash):
+                    cached = self._cache.get(cache_key, PROMPT_VERSION, self.model)
+                    if cached is not None:
+                        logger.info(f"Using cached Groq extraction ({cache_key[:17]})")
+                        return {**cached, "cache_hit": True}
+            
+            if self.sectioned:
+                response = self._extract_sections(resume_text, input_hash)
+            else:
+                response = self._request_json(self.create_extraction_prompt(resume_text), max_tokens=2500)
+            if not response["success"]:
+                return response
+            
+            data = response["data"]
+            personal_details = data.get("personal_details")
+            if not isinstance(personal_details, dict):
+                personal_details = data["personal_details"] = {}
+            for field, value in _extract_personal_details(contact_text or resume_text).items():
+                if not personal_details.get(field):
+                    personal_details[field] = value
+            
+            logger.info(f"✅ Groq extraction completed successfully with {self.model}")
+            extraction = {
+                "success": True,
+                "data": data,
+                "provider": f"groq-{self.model}",
+                "raw_response": response["raw_response"]
+            }
+            self._cache_set(input_hash, PROMPT_VERSION, extraction)
+            self._cache_set(normalized_hash, PROMPT_VERSION, extraction)
+            return extraction
+            
+        except Exception as e:
+            logger.error(f"Groq extraction failed: {str(e)}")
+            return {"success": False, "error": f"Groq extraction failed: {str(e)}"}
+    
+    def extract_section(self, section: str, resume_text: str, input_hash: Optional[str] = None) -> Dict[str, Any]:
+        """Extract the fields of one section (see _EXTRACTION_SECTIONS) with its own small request"""
+        input_hash = input_hash or self._input_hash(resume_text)
+        section_version = f"{PROMPT_VERSION}/{section}"
+        if self._cache is not None:
+            cached = self._cache.get(input_hash, section_version, self.model)
+            if cached is not None:
+                return cached
+        
+        fields, max_tokens = _EXTRACTION_SECTIONS[section]
+        response = self._request_json(self.create_section_prompt(section, resume_text), max_tokens=max_tokens)
+        if response["success"]:
+            self._cache_set(input_hash, section_version, response)
+        return response
+    
+    def _extract_sections(self, resume_text: str, input_hash: str) -> Dict[str, Any]:
+        """Extract all sections with parallel requests and merge them into one result"""
+        sections = list(_EXTRACTION_SECTIONS)
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            responses = list(executor.map(
+                lambda section: self.extract_section(section, resume_text, input_hash), sections
+            ))
+        
+        data = {}
+        for section, response in zip(sections, responses):
+            if not response["success"]:
+                return {**response, "error": f"{section}: {response['error']}"}
+            fields, _ = _EXTRACTION_SECTIONS[section]
+            for field in fields:
+                data[field] = response["data"].get(field, "" if field == "summary" else [])
+        
+        # Keep the prompt's field order
+        data = {field: data[field] for field in _SCHEMA_FIELDS}
+        raw_response = " | ".join(response["raw_response"] for response in responses)
+        return {"success": True, "data": data, "raw_response": raw_response[:200]}
+    
+    def _cache_set(self, input_hash: str, prompt_version: str, response: Dict[str, Any]) -> None:
+        """Store a successful response in the cache, if enabled"""
+        if self._cache is None:
+            return
+        try:
+            self._cache.set(input_hash, prompt_version, self.model, response)
+        except Exception as e:
+            logger.warning(f"Could not cache Groq extraction: {e}")
+    
+    def _request_json(self, prompt: str, max_tokens: int) -> Dict[str, Any]:
+        """Send one extraction prompt to Groq and parse the JSON in its reply"""
+        try:
+            # A request that cannot fit the context window would only fail after the round trip
+            prompt_tokens = count_tokens(prompt)
+            if prompt_tokens + max_tokens > MAX_REQUEST_TOKENS:
+                return {
+                    "success": False,
+                    "error": f"Input too long: about {prompt_tokens} prompt tokens, "
+                             f"limit is {MAX_REQUEST_TOKENS - max_tokens}",
+                    "tokens": prompt_tokens
+                }
+            
             headers = {
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json"
             }
             
-            prompt = self.create_extraction_prompt(resume_text)
             payload = {
                 "model": self.model,
                 "messages": [
@@ -134,94 +647,101 @@ IMPORTANT RULES:
                         "content": prompt
                     }
                 ],
-                "temperature": 0.1,
-                "max_tokens": 2500,
-                "stream": False
+                "temperature": 0,
+                "top_p": 1,
+                "max_tokens": max_tokens,
+                "stream": True
             }
             
-            logger.info(f"Sending request to Groq API with model: {self.model}")
-            response = requests.post(self.base_url, headers=headers, json=payload, timeout=30)
+            while True:
+                if self._json_mode:
+                    payload["response_format"] = {"type": "json_object"}
+                else:
+                    payload.pop("response_format", None)
+                
+                _rate_limiter.acquire()
+                logger.info(f"Sending request to Groq API with model: {self.model}")
+                response = self._session.post(self.base_url, headers=headers, data=_json_dumps(payload),
+                                              timeout=30, stream=True)
+                # Out of quota (or told to back off): pause every thread sharing the limiter
+                pause = _rate_limit_pause(response.headers)
+                if pause:
+                    logger.warning(f"Groq rate limit reached, pausing requests for {pause:.1f}s")
+                    _rate_limiter.pause(pause)
+                if (response.status_code == 400 and self._json_mode
+                        and "response_format" in response.text):
+                    logger.warning(f"{self.model} does not support JSON mode, retrying without it")
+                    self._json_mode = False
+                    response.close()
+                    continue
+                break
             
-            if response.status_code == 200:
-                response_data = response.json()
-                content = response_data["choices"][0]["message"]["content"]
-                logger.info(f"Groq API response received, content length: {len(content)}")
+            with response:
+                if response.status_code != 200:
+                    error_msg = f"Groq API error: {response.status_code} - {response.text}"
+                    logger.error(error_msg)
+                    return {"success": False, "error": error_msg}
                 
-                # Extract JSON from response
-                json_text = self._extract_json_from_response(content)
-                if json_text:
-                    try:
-                        result = json.loads(json_text)
-                        logger.info(f"✅ Groq extraction completed successfully with {self.model}")
-                        return {
-                            "success": True,
-                            "data": result,
-                            "provider": f"groq-{self.model}",
-                            "raw_response": content[:200] + "..." if len(content) > 200 else content
-                        }
-                    except json.JSONDecodeError as e:
-                        logger.error(f"JSON decode error: {str(e)}")
-                        logger.error(f"Problematic JSON: {json_text[:500]}...")
-                        return {
-                            "success": False,
-                            "error": f"Invalid JSON response from Groq: {str(e)}",
-                            "raw_response": content
-                        }
-                else:
-                    return {
-                        "success": False,
-                        "error": "Could not extract valid JSON from Groq response",
-                        "raw_response": content
-                    }
-            else:
-                error_msg = f"Groq API error: {response.status_code} - {response.text}"
-                logger.error(error_msg)
-                return {"success": False, "error": error_msg}
+                # Read server-sent events (parsed straight from bytes). Without JSON mode
+                # the reply is scanned as it arrives so reading stops once the object is
+                # complete; in JSON mode the reply is the object and needs no scanning.
+                pieces = []
+                scanner = None if "response_format" in payload else JSONObjectScanner()
+                for line in response.iter_lines():
+                    if not line.startswith(b"data: "):
+                        continue
+                    data = line[len(b"data: "):]
+                    if data == b"[DONE]":
+                        break
+                    piece = stream_delta_content(data)
+                    if piece:
+                        pieces.append(piece)
+                        if scanner is not None and scanner.feed(piece):
+                            break
+            
+            content = "".join(pieces)
+            logger.info(f"Groq API response received, content length: {len(content)}")
+            
+            json_text = content if scanner is None else scanner.json_text
+            try:
+                data = _json_loads(json_text)
+            except json.JSONDecodeError:
+                # Fall back to locating the object within the reply
+                scanner = JSONObjectScanner()
+                scanner.feed(content)
+                json_text = scanner.json_text
+                data = None
+            
+            if data is None and not json_text:
+                return {
+                    "success": False,
+                    "error": "Could not extract valid JSON from Groq response",
+                    "raw_response": content
+                }
+            
+            try:
+                return {
+                    "success": True,
+                    "data": data if data is not None else _json_loads(json_text),
+                    "raw_response": content[:200] + "..." if len(content) > 200 else content
+                }
+            except json.JSONDecodeError as e:
+                logger.error(f"JSON decode error: {str(e)}")
+                logger.error(f"Problematic JSON: {json_text[:500]}...")
+                return {
+                    "success": False,
+                    "error": f"Invalid JSON response from Groq: {str(e)}",
+                    "raw_response": content
+                }
                 
         except requests.exceptions.Timeout:
             return {"success": False, "error": "Groq API request timed out"}
         except requests.exceptions.RequestException as e:
             return {"success": False, "error": f"Groq API request failed: {str(e)}"}
-        except Exception as e:
-            logger.error(f"Groq extraction failed: {str(e)}")
-            return {"success": False, "error": f"Groq extraction failed: {str(e)}"}
-    
-    def _extract_json_from_response(self, content: str) -> str:
-        """Extract JSON from the response content"""
-        # Try different patterns to find JSON
-        
-        # Pattern 1: JSON wrapped in code blocks
-        if "```json" in content:
-            json_start = content.find("```json") + 7
-            json_end = content.find("```", json_start)
-            if json_end != -1:
-                return content[json_start:json_end].strip()
-        
-        # Pattern 2: JSON wrapped in code blocks without language
-        if "```" in content:
-            first_code_block = content.find("```") + 3
-            second_code_block = content.find("```", first_code_block)
-            if second_code_block != -1:
-                potential_json = content[first_code_block:second_code_block].strip()
-                if potential_json.startswith("{") and potential_json.endswith("}"):
-                    return potential_json
-        
-        # Pattern 3: Find JSON between first { and last }
-        json_start = content.find('{')
-        json_end = content.rfind('}') + 1
-        if json_start != -1 and json_end > json_start:
-            return content[json_start:json_end]
-        
-        # Pattern 4: Try the entire content if it looks like JSON
-        content = content.strip()
-        if content.startswith("{") and content.endswith("}"):
-            return content
-        
-        return ""
     
-    def extract_resume_data(self, resume_text: str) -> Dict[str, Any]:
+    def extract_resume_data(self, resume_text: str, contact_text: Optional[str] = None) -> Dict[str, Any]:
         """Main method to extract resume data"""
-        return self.extract_with_groq(resume_text)
+        return self.extract_with_groq(resume_text, contact_text)
 
 if __name__ == "__main__":
     # Test the Groq extractor
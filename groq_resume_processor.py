@@ -3,38 +3,68 @@ Resume Data Extraction System - Main Processor with Custom Groq
 Uses Groq API with openai/gpt-oss-20b model and embedded API key
 """
 
+import os
 import json
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any
 import logging
 from datetime import datetime
 
-# Import our modules
-from document_converter_groq import DocumentConverter
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Import our modules (DocumentConverter is imported on first use, see doc_converter)
 from groq_resume_extractor import GroqResumeExtractor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Resumes processed in parallel by batch_process (each is mostly waiting on Groq)
+GROQ_WORKERS = int(os.environ.get("GROQ_WORKERS", 8))
+
+# Resume text beyond this many characters is dropped before extraction
+MAX_RESUME_CHARS = 50_000
+
+@functools.lru_cache(maxsize=None)
+def _ensure_output_dir(output_dir: str) -> None:
+    """Create an output directory once per process (batch runs save many results to it)"""
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
 class GroqResumeProcessor:
     """Complete Resume Data Extraction System using Custom Groq"""
     
-    def __init__(self, groq_api_key: str = None):
+    def __init__(self, groq_api_key: str = None, session=None):
         """
         Initialize the resume processor with custom Groq extractor
         
         Args:
             groq_api_key: Your Groq API key (will be embedded in code if not provided)
+            session: HTTP session for the extractor's Groq requests (optional)
         """
-        self.doc_converter = DocumentConverter()
-        self.groq_extractor = GroqResumeExtractor(api_key=groq_api_key)
+        self._doc_converter = None
+        self.groq_extractor = GroqResumeExtractor(api_key=groq_api_key, session=session)
         logger.info("Resume processor initialized with custom Groq openai/gpt-oss-20b model")
     
+    @property
+    def doc_converter(self):
+        """Document converter, created on first use (text-only and cached runs never need it)"""
+        if self._doc_converter is None:
+            from document_converter_groq import DocumentConverter
+            self._doc_converter = DocumentConverter()
+        return self._doc_converter
+    
     def process_resume(self, 
                       file_path: str, 
                       output_dir: str = "outputs",
-                      save_json: bool = True) -> Dict[str, Any]:
+                      save_json: bool = True,
+                      timestamp: str = None) -> Dict[str, Any]:
         """
         Complete resume processing pipeline
         
@@ -42,6 +72,8 @@ class GroqResumeProcessor:
             file_path: Path to resume file (PDF/DOCX)
             output_dir: Directory to save outputs
             save_json: Whether to save extracted data as JSON
+            timestamp: Timestamp for the output filename (batch runs pass one
+                       shared value; defaults to the processing time)
             
         Returns:
             Dict with success status, extracted data, and metadata
@@ -58,40 +90,48 @@ class GroqResumeProcessor:
                     "file_path": file_path
                 }
             
-            resume_text = doc_result["text"]
-            if not resume_text or len(resume_text.strip()) < 50:
+            resume_text = doc_result["text"] or ""
+            text_length = len(resume_text)
+            if text_length < 50 or len(resume_text.strip()) < 50:
                 return {
                     "success": False,
                     "error": "Extracted text is too short or empty",
                     "file_path": file_path,
-                    "text_length": len(resume_text) if resume_text else 0
+                    "text_length": text_length
                 }
             
-            logger.info(f"✅ Document converted - {len(resume_text)} characters extracted")
+            logger.info(f"✅ Document converted - {text_length} characters extracted")
+            
+            # Anything longer is OCR noise rather than a resume and would overflow the model context
+            if text_length > MAX_RESUME_CHARS:
+                logger.warning(f"Resume text is {text_length} characters, truncating to {MAX_RESUME_CHARS}")
+                resume_text = resume_text[:MAX_RESUME_CHARS]
             
             # Step 2: Extract structured data using Groq
-            extraction_result = self.groq_extractor.extract_resume_data(resume_text)
+            # PDF cleanup can split contact details, so they are looked up in the raw text
+            extraction_result = self.groq_extractor.extract_resume_data(resume_text, doc_result.get("raw_text"))
             
             if not extraction_result["success"]:
                 return {
                     "success": False,
                     "error": f"Data extraction failed: {extraction_result['error']}",
                     "file_path": file_path,
-                    "raw_text": resume_text[:500] + "..." if len(resume_text) > 500 else resume_text
+                    "raw_text": resume_text[:500] + "..." if text_length > 500 else resume_text
                 }
             
             extracted_data = extraction_result["data"]
             logger.info("✅ Structured data extracted successfully")
             
             # Step 3: Prepare results
+            processed_at = datetime.now()
             result = {
                 "success": True,
                 "file_path": file_path,
                 "extracted_data": extracted_data,
                 "extraction_metadata": {
-                    "processing_timestamp": datetime.now().isoformat(),
+                    "processing_timestamp": processed_at.isoformat(),
                     "file_format": doc_result.get("format", "unknown"),
-                    "text_length": len(resume_text),
+                    "text_length": text_length,
                     "extraction_method": "groq_openai_gpt_oss_20b",
                     "model_used": self.groq_extractor.model
                 }
@@ -99,7 +139,7 @@ class GroqResumeProcessor:
             
             # Step 4: Save JSON if requested
             if save_json:
-                self._save_results(result, output_dir)
+                self._save_results(result, output_dir, timestamp or processed_at.strftime("%Y%m%d_%H%M%S"))
             
             logger.info("🎉 Resume processing completed successfully")
             return result
@@ -112,31 +152,54 @@ class GroqResumeProcessor:
                 "file_path": file_path
             }
     
-    def _save_results(self, result: Dict[str, Any], output_dir: str) -> None:
+    def _save_results(self, result: Dict[str, Any], output_dir: str, timestamp: str = None) -> None:
         """Save extraction results to JSON file"""
         try:
             # Create output directory
-            Path(output_dir).mkdir(parents=True, exist_ok=True)
+            _ensure_output_dir(str(output_dir))
             
             # Generate output filename
-            input_name = Path(result["file_path"]).stem
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = Path(output_dir) / f"{input_name}_extracted_{timestamp}.json"
+            input_name = os.path.splitext(os.path.basename(result["file_path"]))[0]
+            timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+            base_name = os.path.join(output_dir, f"{input_name}_extracted_{timestamp}")
+            
+            # Save results (orjson writes UTF-8 bytes directly, like ensure_ascii=False).
+            # Exclusive create, so e.g. cv.pdf and cv.docx in one batch never overwrite each other
+            if ORJSON_AVAILABLE:
+                content = orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                content = json.dumps(result, indent=2, ensure_ascii=False).encode('utf-8')
             
-            # Save results
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            output_file = f"{base_name}.json"
+            attempt = 1
+            while True:
+                try:
+                    with open(output_file, 'xb') as f:
+                        f.write(content)
+                    break
+                except FileExistsError:
+                    attempt += 1
+                    output_file = f"{base_name}_{attempt}.json"
             
             logger.info(f"📄 Results saved: {output_file}")
-            result["output_file"] = str(output_file)
+            result["output_file"] = output_file
             
         except Exception as e:
             logger.warning(f"Could not save results: {e}")
     
+    async def process_resume_async(self, file_path: str, output_dir: str = "outputs",
+                                   save_json: bool = True, timestamp: str = None) -> Dict[str, Any]:
+        """Run process_resume in a worker thread so several resumes can be awaited together"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.process_resume, file_path, output_dir, save_json, timestamp)
+        )
+    
     def batch_process(self, 
                      input_dir: str, 
                      output_dir: str = "batch_outputs",
-                     file_patterns: list = None) -> Dict[str, Any]:
+                     file_patterns: list = None,
+                     max_workers: int = GROQ_WORKERS) -> Dict[str, Any]:
         """
         Process multiple resume files in batch
         
@@ -144,10 +207,61 @@ class GroqResumeProcessor:
             input_dir: Directory containing resume files
             output_dir: Directory for outputs
             file_patterns: File extensions to process (default: ["*.pdf", "*.docx", "*.doc"])
+            max_workers: Number of resumes processed in parallel (Groq calls are
+                         rate limited by the extractor, see GROQ_RPM)
             
         Returns:
             Dict with batch processing results
         """
+        resume_files = self._find_resume_files(input_dir, file_patterns)
+        if isinstance(resume_files, dict):
+            return resume_files
+        
+        logger.info(f"🚀 Starting batch processing of {len(resume_files)} files")
+        
+        # Process files in parallel threads; map() yields results in file order.
+        # All files of one batch share the output timestamp.
+        batch_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        def process_file(file_path: Path) -> Dict[str, Any]:
+            logger.info(f"Processing: {file_path.name}")
+            return self.process_resume(str(file_path), output_dir, timestamp=batch_timestamp)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(resume_files)))) as executor:
+            file_results = list(executor.map(process_file, resume_files))
+        
+        return self._summarize_batch(resume_files, file_results)
+    
+    async def batch_process_async(self,
+                                  input_dir: str,
+                                  output_dir: str = "batch_outputs",
+                                  file_patterns: list = None,
+                                  concurrency: int = GROQ_WORKERS) -> Dict[str, Any]:
+        """
+        Process multiple resume files concurrently from an event loop
+        
+        Same arguments and result as batch_process, with at most `concurrency`
+        resumes in flight at once.
+        """
+        resume_files = self._find_resume_files(input_dir, file_patterns)
+        if isinstance(resume_files, dict):
+            return resume_files
+        
+        logger.info(f"🚀 Starting batch processing of {len(resume_files)} files")
+        
+        batch_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def process_file(file_path: Path) -> Dict[str, Any]:
+            async with semaphore:
+                logger.info(f"Processing: {file_path.name}")
+                return await self.process_resume_async(str(file_path), output_dir, timestamp=batch_timestamp)
+        
+        file_results = await asyncio.gather(*[process_file(file_path) for file_path in resume_files])
+        return self._summarize_batch(resume_files, file_results)
+    
+    def _find_resume_files(self, input_dir: str, file_patterns: list = None):
+        """Find the resume files of a batch, or return an error result"""
         if file_patterns is None:
             file_patterns = ["*.pdf", "*.docx", "*.doc"]
         
@@ -169,8 +283,10 @@ class GroqResumeProcessor:
                 "error": f"No resume files found in {input_dir}"
             }
         
-        logger.info(f"🚀 Starting batch processing of {len(resume_files)} files")
-        
+        return resume_files
+    
+    def _summarize_batch(self, resume_files: list, file_results: list) -> Dict[str, Any]:
+        """Build the batch result from per-file results (in file order)"""
         results = {
             "success": True,
             "total_files": len(resume_files),
@@ -179,12 +295,7 @@ class GroqResumeProcessor:
             "summary": {}
         }
         
-        # Process each file
-        for file_path in resume_files:
-            logger.info(f"Processing: {file_path.name}")
-            
-            result = self.process_resume(str(file_path), output_dir)
-            
+        for file_path, result in zip(resume_files, file_results):
             if result["success"]:
                 results["processed_files"].append({
                     "file": str(file_path),
@@ -4,158 +4,275 @@ Clean implementation for parsing job postings into structured data
 """
 
 import json
+import asyncio
+import hashlib
 import requests
 from typing import Dict, Any, Optional
 import logging
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Parsed job descriptions share the extractor's SQLite response cache
+# and its per-process Groq rate limiter; replies are streamed and scanned like its replies
+from groq_resume_extractor import (LLMResponseCache, DEFAULT_CACHE_PATH, JSONObjectScanner, MAX_REQUEST_TOKENS,
+                                   count_tokens, create_groq_session, stream_delta_content, _rate_limiter,
+                                   _rate_limit_pause)
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# orjson parses model replies several times faster than the json module
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+def _json_dumps(obj: Any) -> bytes:
+    """Compact UTF-8 encoded JSON, via orjson when available"""
+    return orjson.dumps(obj) if ORJSON_AVAILABLE else json.dumps(obj).encode("utf-8")
+
+# Completion tokens requested per parse
+PARSER_MAX_TOKENS = 2000
+
+# Bump when the parsing prompt or request parameters change so cached parses are not reused
+PARSER_PROMPT_VERSION = "jd-v2"
+
+# Instructions and output fields, sent once as the system message ahead of the job
+# text (JSON mode enforces the JSON object, so no schema literal is repeated)
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": """You are an expert job posting analyzer. Extract structured information from the job description and return only a JSON object with these fields:
+- job_title, company_name, location: strings
+- employment_type: Full-time/Part-time/Contract/Internship
+- remote_work: Remote/Hybrid/On-site/Not specified
+- salary_info: salary range or compensation if mentioned
+- required_skills: list of required technical skills, tools, technologies
+- preferred_skills: list of preferred/nice-to-have skills
+- education_requirements: list of education level and field requirements
+- experience_required: years of experience needed
+- key_responsibilities: list of main job responsibilities and duties
+- benefits: list of benefits, perks, and compensation details mentioned
+- application_info: object with deadline, contact, process (application deadline, contact information, application process details)
+Extract ALL technical skills, programming languages, frameworks, and tools mentioned. Be comprehensive but accurate."""
+}
+
+# Fixed-field part of display_parsed_job, filled in with one format_map call
+_JOB_DETAILS_TEMPLATE = """
+💼 JOB DETAILS:
+   Title: {job_title}
+   Company: {company_name}
+   Location: {location}
+   Type: {employment_type}
+   Remote: {remote_work}"""
+
+class _FieldsOrNA(dict):
+    """Parsed job fields for _JOB_DETAILS_TEMPLATE; missing fields show as N/A"""
+    
+    def __missing__(self, key: str) -> str:
+        return "N/A"
+
 class JobDescriptionParser:
     """Parse job descriptions using Groq API with openai/gpt-oss-20b model"""
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+                 session: Optional[requests.Session] = None):
+        """
+        Args:
+            api_key: Groq API key
+            cache_path: SQLite file for cached parses (None disables caching)
+            session: HTTP session to send requests on, left open by close();
+                     a private one is created if not given
+        """
         # Replace with your actual Groq API key
         self.api_key = api_key or "YOUR_GROQ_API_KEY_HERE"
         self.model = "openai/gpt-oss-20b"
         self.base_url = "https://api.groq.com/openai/v1/chat/completions"
-        logger.info(f"JobDescriptionParser initialized with model: {self.model}")
+        # Cleared if the model rejects response_format, so later requests skip it
+        self._json_mode = True
+        # Pooled keep-alive connections; the auth headers are built once and sent
+        # per request, since the session may be shared with other clients
+        self._owns_session = session is None
+        self._session = create_groq_session(pool_maxsize=20, backoff_factor=0.5) if session is None else session
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        # Response cache (None disables it) and its hit/miss counts
+        self._cache = None
+        if cache_path:
+            try:
+                self._cache = LLMResponseCache(cache_path)
+            except Exception as e:
+                logger.warning("Job description cache disabled: %s", e)
+        self.stats = {"hits": 0, "misses": 0}
+        logger.info("JobDescriptionParser initialized with model: %s", self.model)
+    
+    def close(self) -> None:
+        """Release the pooled HTTP connections (unless the session was passed in)"""
+        if self._owns_session:
+            self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
     
     def create_parsing_prompt(self, job_text: str) -> str:
         """Create prompt for extracting structured job data"""
-        return f"""
-You are an expert job posting analyzer. Extract structured information from this job description and return it as valid JSON.
-
-JOB DESCRIPTION:
-{job_text}
-
-Extract the following information and return as JSON:
-
-{{
-  "job_title": "exact job title",
-  "company_name": "company name",
-  "location": "job location",
-  "employment_type": "Full-time/Part-time/Contract/Internship",
-  "remote_work": "Remote/Hybrid/On-site/Not specified",
-  "salary_info": "salary range or compensation if mentioned",
-  "required_skills": [
-    "list of required technical skills, tools, technologies"
-  ],
-  "preferred_skills": [
-    "list of preferred/nice-to-have skills"
-  ],
-  "education_requirements": [
-    "education level and field requirements"
-  ],
-  "experience_required": "years of experience needed",
-  "key_responsibilities": [
-    "main job responsibilities and duties"
-  ],
-  "benefits": [
-    "benefits, perks, and compensation details mentioned"
-  ],
-  "application_info": {{
-    "deadline": "application deadline if mentioned",
-    "contact": "contact information if provided",
-    "process": "application process details"
-  }}
-}}
-
-IMPORTANT: Return ONLY valid JSON. Extract ALL technical skills, programming languages, frameworks, and tools mentioned. Be comprehensive but accurate.
-"""
+        return "JOB DESCRIPTION:\n" + job_text
     
     def parse_job_description(self, job_text: str) -> Dict[str, Any]:
         """Parse job description text using Groq API"""
-        # Validate inputs
-        if not job_text or not job_text.strip():
+        early_result, cache_key = self._check_request(job_text)
+        if early_result is not None:
+            return early_result
+        
+        try:
+            logger.info("Sending request to Groq API...")
+            
+            # Make API call
+            while True:
+                _rate_limiter.acquire()
+                response = self._session.post(
+                    self.base_url,
+                    headers=self._headers,
+                    data=self._request_body(job_text),
+                    timeout=30,
+                    stream=True
+                )
+                self._pause_if_limited(response.headers)
+                if not self._rejects_json_mode(response):
+                    break
+                response.close()
+            
+            with response:
+                if response.status_code != 200:
+                    return {
+                        "success": False,
+                        "error": f"API error: {response.status_code} - {response.text}"
+                    }
+                
+                # Read server-sent events (parsed straight from bytes). Without JSON mode
+                # reading stops once the JSON object is complete, so trailing text is never
+                # waited for; in JSON mode the reply is the object, and reading it to [DONE]
+                # leaves the pooled connection reusable.
+                pieces = []
+                scanner = None if self._json_mode else JSONObjectScanner()
+                for line in response.iter_lines():
+                    if line.startswith(b"data: ") and self._feed_event(line[6:], pieces, scanner):
+                        break
+            
+            return self._build_result("".join(pieces), scanner, cache_key)
+                
+        except requests.exceptions.Timeout:
             return {
                 "success": False,
-                "error": "Job description text is empty"
+                "error": "Request timeout - please try again"
             }
-        
-        if self.api_key == "YOUR_GROQ_API_KEY_HERE":
+        except requests.exceptions.RequestException as e:
             return {
                 "success": False,
-                "error": "Please set your Groq API key. Replace YOUR_GROQ_API_KEY_HERE with your actual key."
+                "error": f"Network error: {str(e)}"
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Unexpected error: {str(e)}"
             }
+    
+    def async_client(self):
+        """
+        httpx.AsyncClient for parse_job_description_async, or None without httpx.
+        
+        Concurrent parses through one client share its connections; with the h2
+        package installed they are multiplexed over a single HTTP/2 connection.
+        The caller closes it (await client.aclose()).
+        """
+        if not HTTPX_AVAILABLE:
+            return None
+        return httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=30,
+            # The pool limits belong on the transport: httpx ignores limits= when a transport is passed
+            transport=httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE, retries=3,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+            ),
+            headers=self._headers
+        )
+    
+    async def parse_job_description_async(self, job_text: str, client=None) -> Dict[str, Any]:
+        """
+        Same as parse_job_description, awaitable from an event loop
+        
+        Uses `client` (see async_client) when given, a short-lived client otherwise;
+        without httpx the blocking parse runs in a worker thread.
+        """
+        if not HTTPX_AVAILABLE:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.parse_job_description, job_text)
         
+        early_result, cache_key = self._check_request(job_text)
+        if early_result is not None:
+            return early_result
+        
+        if client is not None:
+            return await self._parse_async(client, job_text, cache_key)
+        client = self.async_client()
         try:
-            # Prepare API request
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            prompt = self.create_parsing_prompt(job_text)
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are an expert job posting analyzer. Extract structured information and return only valid JSON."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.1,
-                "max_tokens": 2000,
-                "stream": False
-            }
-            
-            logger.info(f"Sending request to Groq API...")
-            
-            # Make API call
-            response = requests.post(
-                self.base_url,
-                headers=headers,
-                json=payload,
-                timeout=30
-            )
+            return await self._parse_async(client, job_text, cache_key)
+        finally:
+            await client.aclose()
+    
+    async def _parse_async(self, client, job_text: str, cache_key: str) -> Dict[str, Any]:
+        """Stream one parse through an httpx client"""
+        try:
+            logger.info("Sending request to Groq API...")
             
-            if response.status_code == 200:
-                response_data = response.json()
-                content = response_data["choices"][0]["message"]["content"]
-                logger.info(f"Received response from Groq API")
-                
-                # Extract and parse JSON
-                json_data = self._extract_json_from_response(content)
-                if json_data:
-                    try:
-                        parsed_data = json.loads(json_data)
-                        return {
-                            "success": True,
-                            "data": parsed_data,
-                            "model": self.model,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    except json.JSONDecodeError as e:
+            loop = asyncio.get_running_loop()
+            while True:
+                await loop.run_in_executor(None, _rate_limiter.acquire)
+                async with client.stream("POST", self.base_url, content=self._request_body(job_text)) as response:
+                    self._pause_if_limited(response.headers)
+                    if response.status_code != 200:
+                        await response.aread()
+                        if self._rejects_json_mode(response):
+                            continue
                         return {
                             "success": False,
-                            "error": f"Invalid JSON in response: {str(e)}",
-                            "raw_response": content
+                            "error": f"API error: {response.status_code} - {response.text}"
                         }
-                else:
-                    return {
-                        "success": False,
-                        "error": "No valid JSON found in response",
-                        "raw_response": content
-                    }
-            else:
-                return {
-                    "success": False,
-                    "error": f"API error: {response.status_code} - {response.text}"
-                }
+                    
+                    pieces = []
+                    scanner = None if self._json_mode else JSONObjectScanner()
+                    async for line in response.aiter_lines():
+                        if line.startswith("data: ") and self._feed_event(line[6:], pieces, scanner):
+                            break
                 
-        except requests.exceptions.Timeout:
+                return self._build_result("".join(pieces), scanner, cache_key)
+            
+        except httpx.TimeoutException:
             return {
                 "success": False,
                 "error": "Request timeout - please try again"
             }
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             return {
                 "success": False,
                 "error": f"Network error: {str(e)}"
@@ -166,113 +283,249 @@ IMPORTANT: Return ONLY valid JSON. Extract ALL technical skills, programming lan
                 "error": f"Unexpected error: {str(e)}"
             }
     
+    def _pause_if_limited(self, headers) -> None:
+        """Hold back every Groq request in the process when a response says the limit is used up"""
+        pause = _rate_limit_pause(headers)
+        if pause:
+            logger.warning("Groq rate limit reached, pausing requests for %.1fs", pause)
+            _rate_limiter.pause(pause)
+    
+    def _check_request(self, job_text: str):
+        """Validate a parse request and look it up in the cache.
+        
+        Returns (result, cache_key); result is an error or cached parse to return
+        as-is, or None if Groq has to be asked.
+        """
+        # Validate inputs
+        if not job_text or not job_text.strip():
+            return {
+                "success": False,
+                "error": "Job description text is empty"
+            }, ""
+        
+        if self.api_key == "YOUR_GROQ_API_KEY_HERE":
+            return {
+                "success": False,
+                "error": "Please set your Groq API key. Replace YOUR_GROQ_API_KEY_HERE with your actual key."
+            }, ""
+        
+        # The same posting (up to whitespace) with the same prompt and model: reuse the earlier parse
+        cache_key = self._cache_key(job_text)
+        if self._cache is not None:
+            cached = self._cache.get(cache_key, PARSER_PROMPT_VERSION, self.model)
+            if cached is not None:
+                self.stats["hits"] += 1
+                logger.info("Using cached job description parse (%.12s)", cache_key)
+                return {**cached, "cache_hit": True}, cache_key
+            self.stats["misses"] += 1
+        
+        # A request that cannot fit the context window would only fail after the round trip
+        prompt_tokens = count_tokens(_SYSTEM_MESSAGE["content"]) + count_tokens(self.create_parsing_prompt(job_text))
+        if prompt_tokens + PARSER_MAX_TOKENS > MAX_REQUEST_TOKENS:
+            return {
+                "success": False,
+                "error": f"Job description too long: about {prompt_tokens} prompt tokens, "
+                         f"limit is {MAX_REQUEST_TOKENS - PARSER_MAX_TOKENS}",
+                "tokens": prompt_tokens
+            }, cache_key
+        
+        return None, cache_key
+    
+    def _request_body(self, job_text: str) -> bytes:
+        """Serialized streaming chat completion request for one job description"""
+        payload = {
+            "model": self.model,
+            "messages": [
+                _SYSTEM_MESSAGE,
+                {
+                    "role": "user",
+                    "content": self.create_parsing_prompt(job_text)
+                }
+            ],
+            "temperature": 0.1,
+            "max_tokens": PARSER_MAX_TOKENS,
+            "stream": True
+        }
+        if self._json_mode:
+            payload["response_format"] = {"type": "json_object"}
+        return _json_dumps(payload)
+    
+    def _rejects_json_mode(self, response) -> bool:
+        """True (and JSON mode switched off) if Groq refused response_format,
+        meaning the request should be sent again without it"""
+        if response.status_code == 400 and self._json_mode and "response_format" in response.text:
+            logger.warning("%s does not support JSON mode, retrying without it", self.model)
+            self._json_mode = False
+            return True
+        return False
+    
+    def _feed_event(self, data, pieces: list, scanner: Optional[JSONObjectScanner]) -> bool:
+        """Add the content of one server-sent event (bytes or str after "data: ");
+        returns True once the stream is done or (with a scanner) the JSON object is complete"""
+        if data == b"[DONE]" or data == "[DONE]":
+            return True
+        piece = stream_delta_content(data)
+        if piece:
+            pieces.append(piece)
+            return scanner is not None and scanner.feed(piece)
+        return False
+    
+    def _build_result(self, content: str, scanner: Optional[JSONObjectScanner], cache_key: str) -> Dict[str, Any]:
+        """Parse the streamed reply into a result, caching it on success"""
+        logger.info("Received response from Groq API")
+        
+        # Extract and parse JSON
+        try:
+            parsed_data = self._load_json((scanner is not None and scanner.json_text) or content)
+        except json.JSONDecodeError as e:
+            return {
+                "success": False,
+                "error": f"Invalid JSON in response: {str(e)}",
+                "raw_response": content
+            }
+        if parsed_data is None:
+            return {
+                "success": False,
+                "error": "No valid JSON found in response",
+                "raw_response": content
+            }
+        result = {
+            "success": True,
+            "data": parsed_data,
+            "model": self.model,
+            "timestamp": datetime.now().isoformat()
+        }
+        self._cache_set(cache_key, result)
+        return result
+    
+    def _cache_key(self, job_text: str) -> str:
+        """Hash of the job text with whitespace collapsed, used as the cache key"""
+        cleaned = " ".join(job_text.split())
+        return hashlib.sha256(cleaned.encode("utf-8")).hexdigest()
+    
+    def _cache_set(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """Store a successful parse in the cache, if enabled"""
+        if self._cache is None:
+            return
+        try:
+            self._cache.set(cache_key, PARSER_PROMPT_VERSION, self.model, result)
+        except Exception as e:
+            logger.warning("Could not cache job description parse: %s", e)
+    
+    def _load_json(self, content: str) -> Optional[Any]:
+        """Parse the JSON object in a reply, or return None if there is none"""
+        # Usually the reply is just the object, so try it as-is before scanning for it
+        try:
+            parsed = _json_loads(content)
+            if isinstance(parsed, dict):
+                return parsed
+        except json.JSONDecodeError:
+            pass
+        
+        json_data = self._extract_json_from_response(content)
+        return _json_loads(json_data) if json_data else None
+    
     def _extract_json_from_response(self, content: str) -> Optional[str]:
         """Extract JSON from API response content"""
-        # Method 1: Look for JSON in code blocks
-        if "```json" in content:
-            start = content.find("```json") + 7
+        # Method 1: The entire content looks like JSON (the usual reply)
+        stripped = content.strip()
+        if stripped.startswith('{') and stripped.endswith('}'):
+            return stripped
+        
+        # Method 2: Look for JSON in code blocks
+        start = content.find("```json")
+        if start != -1:
+            start += 7
             end = content.find("```", start)
             if end != -1:
                 return content[start:end].strip()
         
-        # Method 2: Look for JSON between first { and last }
-        start = content.find('{')
-        end = content.rfind('}') + 1
-        if start != -1 and end > start:
-            return content[start:end]
-        
-        # Method 3: Try entire content if it looks like JSON
-        content = content.strip()
-        if content.startswith('{') and content.endswith('}'):
-            return content
-        
-        return None
+        # Method 3: The first complete object, matching braces outside string
+        # literals (a stray "}" in text after the object is not included)
+        scanner = JSONObjectScanner()
+        scanner.feed(content)
+        return scanner.json_text or None
     
     def display_parsed_job(self, result: Dict[str, Any]) -> None:
         """Display parsed job description in a formatted way"""
+        # Collected and printed with a single write rather than one print per line
+        lines = []
         if not result["success"]:
-            print(f"\n❌ PARSING FAILED:")
-            print(f"   Error: {result['error']}")
+            lines.append(f"\n❌ PARSING FAILED:")
+            lines.append(f"   Error: {result['error']}")
             if "raw_response" in result:
-                print(f"\n📄 Raw Response:")
-                print(f"   {result['raw_response'][:300]}...")
-            print(f"\n🔧 Troubleshooting:")
-            print(f"   1. Check your Groq API key is set correctly")
-            print(f"   2. Verify internet connection")
-            print(f"   3. Ensure job description text is valid")
+                lines.append(f"\n📄 Raw Response:")
+                lines.append(f"   {result['raw_response'][:300]}...")
+            lines.append(f"\n🔧 Troubleshooting:")
+            lines.append(f"   1. Check your Groq API key is set correctly")
+            lines.append(f"   2. Verify internet connection")
+            lines.append(f"   3. Ensure job description text is valid")
+            print("\n".join(lines))
             return
         
         data = result["data"]
         model = result.get("model", "unknown")
         
-        print(f"\n✅ JOB PARSING SUCCESS!")
-        print(f"🤖 Model: {model}")
-        print(f"⏰ Parsed at: {result.get('timestamp', 'unknown')}")
-        print("=" * 50)
+        lines.append(f"\n✅ JOB PARSING SUCCESS!")
+        lines.append(f"🤖 Model: {model}")
+        lines.append(f"⏰ Parsed at: {result.get('timestamp', 'unknown')}")
+        lines.append("=" * 50)
         
         # Basic job info
-        print(f"\n💼 JOB DETAILS:")
-        print(f"   Title: {data.get('job_title', 'N/A')}")
-        print(f"   Company: {data.get('company_name', 'N/A')}")
-        print(f"   Location: {data.get('location', 'N/A')}")
-        print(f"   Type: {data.get('employment_type', 'N/A')}")
-        print(f"   Remote: {data.get('remote_work', 'N/A')}")
+        lines.append(_JOB_DETAILS_TEMPLATE.format_map(_FieldsOrNA(data)))
         if data.get('salary_info'):
-            print(f"   Salary: {data['salary_info']}")
+            lines.append(f"   Salary: {data['salary_info']}")
         if data.get('experience_required'):
-            print(f"   Experience: {data['experience_required']}")
+            lines.append(f"   Experience: {data['experience_required']}")
         
         # Required skills
         required_skills = data.get('required_skills', [])
         if required_skills:
-            print(f"\n🛠️ REQUIRED SKILLS ({len(required_skills)}):")
-            for skill in required_skills:
-                print(f"   • {skill}")
+            lines.append(f"\n🛠️ REQUIRED SKILLS ({len(required_skills)}):")
+            lines.extend(f"   • {skill}" for skill in required_skills)
         
         # Preferred skills
         preferred_skills = data.get('preferred_skills', [])
         if preferred_skills:
-            print(f"\n⭐ PREFERRED SKILLS ({len(preferred_skills)}):")
-            for skill in preferred_skills[:5]:  # Show first 5
-                print(f"   • {skill}")
+            lines.append(f"\n⭐ PREFERRED SKILLS ({len(preferred_skills)}):")
+            lines.extend(f"   • {skill}" for skill in preferred_skills[:5])  # Show first 5
             if len(preferred_skills) > 5:
-                print(f"   ... and {len(preferred_skills) - 5} more")
+                lines.append(f"   ... and {len(preferred_skills) - 5} more")
         
         # Education
         education = data.get('education_requirements', [])
         if education:
-            print(f"\n🎓 EDUCATION:")
-            for edu in education:
-                print(f"   • {edu}")
+            lines.append(f"\n🎓 EDUCATION:")
+            lines.extend(f"   • {edu}" for edu in education)
         
         # Responsibilities
         responsibilities = data.get('key_responsibilities', [])
         if responsibilities:
-            print(f"\n📋 KEY RESPONSIBILITIES ({len(responsibilities)}):")
-            for resp in responsibilities[:4]:  # Show first 4
-                print(f"   • {resp}")
+            lines.append(f"\n📋 KEY RESPONSIBILITIES ({len(responsibilities)}):")
+            lines.extend(f"   • {resp}" for resp in responsibilities[:4])  # Show first 4
             if len(responsibilities) > 4:
-                print(f"   ... and {len(responsibilities) - 4} more")
+                lines.append(f"   ... and {len(responsibilities) - 4} more")
         
         # Benefits
         benefits = data.get('benefits', [])
         if benefits:
-            print(f"\n🎁 BENEFITS ({len(benefits)}):")
-            for benefit in benefits[:3]:  # Show first 3
-                print(f"   • {benefit}")
+            lines.append(f"\n🎁 BENEFITS ({len(benefits)}):")
+            lines.extend(f"   • {benefit}" for benefit in benefits[:3])  # Show first 3
             if len(benefits) > 3:
-                print(f"   ... and {len(benefits) - 3} more")
+                lines.append(f"   ... and {len(benefits) - 3} more")
         
         # Application info
         app_info = data.get('application_info', {})
         if any(app_info.values()):
-            print(f"\n📧 APPLICATION INFO:")
+            lines.append(f"\n📧 APPLICATION INFO:")
             if app_info.get('deadline'):
-                print(f"   Deadline: {app_info['deadline']}")
+                lines.append(f"   Deadline: {app_info['deadline']}")
             if app_info.get('contact'):
-                print(f"   Contact: {app_info['contact']}")
+                lines.append(f"   Contact: {app_info['contact']}")
             if app_info.get('process'):
-                print(f"   Process: {app_info['process']}")
+                lines.append(f"   Process: {app_info['process']}")
+        
+        print("\n".join(lines))
 
 def main():
     """Main function for testing the job parser"""
@@ -5,21 +5,52 @@ Handles multiple input sources with safe file reading
 
 import json
 import os
+import codecs
+import hashlib
+import mmap
+import re
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import logging
-from datetime import datetime
+import time
 from job_description_parser import JobDescriptionParser
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Patterns used by JobProcessor._clean_text
+_WHITESPACE_RE = re.compile(r'\s+')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Job description files at least this large are read through a memory map
+MMAP_MIN_BYTES = 1 << 20
+
+# Characters dropped from saved filenames: anything but letters, digits, space, "-" and "_"
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w \-]+')
+
+# Job descriptions parsed in parallel by batch_process (each is mostly waiting on Groq)
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", 10))
+
+@functools.lru_cache(maxsize=None)
+def _ensure_output_dir(output_dir: str) -> None:
+    """Create the save_result directory, at most once per directory and process"""
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
 class JobProcessor:
     """Process job descriptions from various sources"""
     
-    def __init__(self, api_key: str = None):
-        self.parser = JobDescriptionParser(api_key=api_key)
+    def __init__(self, api_key: str = None, session=None):
+        self.parser = JobDescriptionParser(api_key=api_key, session=session)
         logger.info("JobProcessor initialized")
     
     def process_text(self, job_text: str, source: str = "text_input") -> Dict[str, Any]:
@@ -31,42 +62,71 @@ class JobProcessor:
                 "source": source
             }
         
-        logger.info(f"Processing job text from: {source}")
+        logger.info("Processing job text from: %s", source)
         
         # Clean the text
         cleaned_text = self._clean_text(job_text)
         
         # Parse with Groq
         result = self.parser.parse_job_description(cleaned_text)
+        return self._add_text_info(result, source, job_text, cleaned_text)
+    
+    async def process_text_async(self, job_text: str, source: str = "text_input", client=None) -> Dict[str, Any]:
+        """Same as process_text, awaitable; `client` is an optional parser.async_client()"""
+        if not job_text or not job_text.strip():
+            return {
+                "success": False,
+                "error": "Job description text is empty",
+                "source": source
+            }
+        
+        logger.info("Processing job text from: %s", source)
+        
+        cleaned_text = self._clean_text(job_text)
+        result = await self.parser.parse_job_description_async(cleaned_text, client)
+        return self._add_text_info(result, source, job_text, cleaned_text)
+    
+    def _add_text_info(self, result: Dict[str, Any], source: str, job_text: str,
+                       cleaned_text: str) -> Dict[str, Any]:
+        """Record the source and text lengths on a parse result"""
         result["source"] = source
         result["original_length"] = len(job_text)
         result["cleaned_length"] = len(cleaned_text)
-        
         return result
     
     def process_file(self, file_path: str) -> Dict[str, Any]:
         """Process job description from file with safe reading"""
-        if not os.path.exists(file_path):
+        try:
+            job_text, error = self._load_job_file(file_path)
+            if error:
+                return error
+            
+            # Process the text
+            return self.process_text(job_text, source=f"file:{file_path}")
+            
+        except Exception as e:
             return {
                 "success": False,
-                "error": f"File not found: {file_path}",
+                "error": f"Error reading file: {str(e)}",
                 "source": f"file:{file_path}"
             }
-        
+    
+    def load_text(self, file_path: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Cleaned job description text of a file, or ("", error result) if it cannot be read"""
+        job_text, error = self._load_job_file(file_path)
+        if error:
+            return "", error
+        return self._clean_text(job_text), None
+    
+    async def process_file_async(self, file_path: str, client=None) -> Dict[str, Any]:
+        """Same as process_file, awaitable (the file is read in a worker thread)"""
         try:
-            logger.info(f"Reading file: {file_path}")
+            loop = asyncio.get_running_loop()
+            job_text, error = await loop.run_in_executor(None, self._load_job_file, file_path)
+            if error:
+                return error
             
-            # Safe file reading
-            job_text = self._read_file_safely(file_path)
-            if not job_text:
-                return {
-                    "success": False,
-                    "error": "File is empty or could not be read",
-                    "source": f"file:{file_path}"
-                }
-            
-            # Process the text
-            return self.process_text(job_text, source=f"file:{file_path}")
+            return await self.process_text_async(job_text, source=f"file:{file_path}", client=client)
             
         except Exception as e:
             return {
@@ -75,89 +135,209 @@ class JobProcessor:
                 "source": f"file:{file_path}"
             }
     
+    def _load_job_file(self, file_path: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Read a job description file; returns (text, None) or ("", error result)"""
+        logger.info("Reading file: %s", file_path)
+        
+        # Safe file reading (opening it is the existence check)
+        try:
+            job_text = self._read_file_safely(file_path)
+        except FileNotFoundError:
+            return "", {
+                "success": False,
+                "error": f"File not found: {file_path}",
+                "source": f"file:{file_path}"
+            }
+        if not job_text:
+            return "", {
+                "success": False,
+                "error": "File is empty or could not be read",
+                "source": f"file:{file_path}"
+            }
+        
+        return job_text, None
+    
     def _read_file_safely(self, file_path: str) -> str:
-        """Read file with safe encoding handling"""
-        # Try different encodings in order of preference
-        encodings = ['utf-8', 'utf-8-sig', 'latin1', 'cp1252']
-        
-        for encoding in encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    content = f.read()
-                logger.info(f"Successfully read file with {encoding} encoding")
-                return content
-            except UnicodeDecodeError:
-                logger.debug(f"Failed to read with {encoding} encoding")
-                continue
-            except Exception as e:
-                logger.debug(f"Error with {encoding}: {str(e)}")
-                continue
-        
-        # Last resort: read with error replacement
+        """Read file with safe encoding handling (raises FileNotFoundError if missing)"""
+        # Read the bytes once and decode in memory rather than re-reading per encoding.
+        # Large files are decoded straight from a read-only memory map, so their raw
+        # bytes are never copied onto the heap next to the decoded text.
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-            logger.warning("Read file with character replacement")
-            return content
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as raw:
+                        return self._decode_text(raw)
+                raw = f.read()
+        except FileNotFoundError:
+            raise
         except Exception as e:
-            logger.error(f"Could not read file: {str(e)}")
+            logger.error("Could not read file: %s", e)
             return ""
+        
+        return self._decode_text(raw)
+    
+    def _decode_text(self, raw) -> str:
+        """Decode file contents (bytes or a memory map)"""
+        # A byte order mark names the encoding; otherwise try UTF-8 and fall back to
+        # latin1, which decodes any byte sequence
+        head = raw[:3]
+        if head == codecs.BOM_UTF8:
+            encoding = 'utf-8-sig'
+        elif head[:2] in (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE):
+            encoding = 'utf-16'
+        else:
+            encoding = 'utf-8'
+        
+        try:
+            content = str(raw, encoding)
+        except UnicodeDecodeError:
+            logger.debug("Failed to read with %s encoding", encoding)
+            encoding = 'latin1'
+            content = str(raw, encoding)
+        
+        logger.info("Successfully read file with %s encoding", encoding)
+        return content
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize job description text"""
         if not text:
             return ""
         
-        # Basic text cleaning
-        import re
-        
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        # Remove excessive whitespace (this also folds line breaks into single spaces)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Remove HTML tags if present
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Clean up line breaks
-        text = re.sub(r'\n\s*\n', '\n\n', text)
+        text = _HTML_TAG_RE.sub('', text)
         
         return text.strip()
     
-    def batch_process(self, jobs: List[Dict[str, str]]) -> Dict[str, Any]:
-        """Process multiple jobs in batch"""
+    def batch_process(self, jobs: List[Dict[str, str]], max_workers: int = JOB_WORKERS,
+                      save_dir: Optional[str] = None) -> Dict[str, Any]:
+        """Process multiple jobs in batch, up to `max_workers` at a time
+        (duplicate jobs are parsed once); with save_dir each parsed job is saved there"""
+        if not jobs:
+            return self._summarize_batch([])
+        
+        keys, unique = self._dedupe_jobs(jobs)
+        
+        # map() yields results in job order
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique)))) as executor:
+            unique_results = list(executor.map(self._process_job, unique, [jobs[i] for i in unique]))
+        
+        return self._summarize_batch(self._expand_duplicates(jobs, keys, unique, unique_results), save_dir)
+    
+    async def batch_process_async(self, jobs: List[Dict[str, str]], concurrency: int = JOB_WORKERS,
+                                  save_dir: Optional[str] = None) -> Dict[str, Any]:
+        """Same as batch_process, awaitable from an event loop with at most
+        `concurrency` jobs in flight (sharing one HTTP client when httpx is installed)"""
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        client = self.parser.async_client()
+        
+        async def process_job(index: int, job_input: Dict[str, str]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._process_job_async(index, job_input, client)
+        
+        keys, unique = self._dedupe_jobs(jobs)
+        try:
+            unique_results = await asyncio.gather(*[process_job(i, jobs[i]) for i in unique])
+        finally:
+            if client is not None:
+                await client.aclose()
+        return self._summarize_batch(self._expand_duplicates(jobs, keys, unique, unique_results), save_dir)
+    
+    def _job_key(self, i: int, job_input: Dict[str, str]) -> Tuple[str, str]:
+        """Identity of a batch job: its cleaned text, its file, or (for unknown types) its position"""
+        job_type = job_input.get("type", "text")
+        source = job_input.get("source", "")
+        if job_type == "text":
+            return ("text", hashlib.sha256(self._clean_text(source).encode("utf-8")).hexdigest())
+        if job_type == "file":
+            return ("file", os.path.realpath(source))
+        return ("job", str(i))
+    
+    def _dedupe_jobs(self, jobs: List[Dict[str, str]]) -> Tuple[List[Tuple[str, str]], List[int]]:
+        """Key of every job, and the indexes of the first job with each distinct key"""
+        keys = [self._job_key(i, job_input) for i, job_input in enumerate(jobs)]
+        first = {}
+        for i, key in enumerate(keys):
+            first.setdefault(key, i)
+        unique = list(first.values())
+        if len(unique) < len(jobs):
+            logger.info("Batch has %d duplicate jobs, parsing %d", len(jobs) - len(unique), len(unique))
+        return keys, unique
+    
+    def _expand_duplicates(self, jobs: List[Dict[str, str]], keys: List[Tuple[str, str]],
+                           unique: List[int], unique_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Results for every job (in job order) from the results of the unique jobs"""
+        result_by_key = {keys[i]: result for i, result in zip(unique, unique_results)}
+        job_results = []
+        for i, key in enumerate(keys):
+            result = result_by_key[key]
+            if key[0] == "text" and result.get("source") != f"batch_{i+1}":
+                result = {**result, "source": f"batch_{i+1}"}
+            job_results.append(result)
+        return job_results
+    
+    def _process_job(self, i: int, job_input: Dict[str, str]) -> Dict[str, Any]:
+        """Process the i-th (0-based) job of a batch"""
+        job_type = job_input.get("type", "text")
+        source = job_input.get("source", "")
+        
+        logger.info("Processing job %d - Type: %s", i + 1, job_type)
+        
+        if job_type == "text":
+            return self.process_text(source, f"batch_{i+1}")
+        elif job_type == "file":
+            return self.process_file(source)
+        else:
+            return {
+                "success": False,
+                "error": f"Unknown job type: {job_type}",
+                "source": source
+            }
+    
+    async def _process_job_async(self, i: int, job_input: Dict[str, str], client=None) -> Dict[str, Any]:
+        """Async counterpart of _process_job"""
+        job_type = job_input.get("type", "text")
+        source = job_input.get("source", "")
+        
+        logger.info("Processing job %d - Type: %s", i + 1, job_type)
+        
+        if job_type == "text":
+            return await self.process_text_async(source, f"batch_{i+1}", client)
+        elif job_type == "file":
+            return await self.process_file_async(source, client)
+        else:
+            return {
+                "success": False,
+                "error": f"Unknown job type: {job_type}",
+                "source": source
+            }
+    
+    def _summarize_batch(self, job_results: List[Dict[str, Any]], save_dir: Optional[str] = None) -> Dict[str, Any]:
+        """Build the batch result from per-job results (in job order), saving
+        successful ones to save_dir if given"""
         results = {
-            "total": len(jobs),
+            "total": len(job_results),
             "successful": 0,
             "failed": 0,
             "results": []
         }
         
-        for i, job_input in enumerate(jobs):
-            job_type = job_input.get("type", "text")
-            source = job_input.get("source", "")
-            
-            logger.info(f"Processing job {i+1}/{len(jobs)} - Type: {job_type}")
-            
-            if job_type == "text":
-                result = self.process_text(source, f"batch_{i+1}")
-            elif job_type == "file":
-                result = self.process_file(source)
-            else:
-                result = {
-                    "success": False,
-                    "error": f"Unknown job type: {job_type}",
-                    "source": source
-                }
-            
+        for i, result in enumerate(job_results):
             if result["success"]:
                 results["successful"] += 1
                 job_title = result["data"].get("job_title", "Unknown")
                 company = result["data"].get("company_name", "Unknown")
-                results["results"].append({
+                summary = {
                     "index": i + 1,
                     "status": "success",
                     "title": job_title,
                     "company": company
-                })
+                }
+                if save_dir:
+                    summary["output_path"] = self.save_result(result, save_dir, name_suffix=f"_{i + 1}")
+                results["results"].append(summary)
             else:
                 results["failed"] += 1
                 results["results"].append({
@@ -168,15 +348,16 @@ class JobProcessor:
         
         return results
     
-    def save_result(self, result: Dict[str, Any], output_dir: str = "parsed_jobs") -> str:
-        """Save parsing result to JSON file"""
+    def save_result(self, result: Dict[str, Any], output_dir: str = "parsed_jobs", name_suffix: str = "") -> str:
+        """Save parsing result to JSON file (name_suffix keeps batch results saved
+        in the same second apart)"""
         if not result["success"]:
             logger.error("Cannot save failed parsing result")
             return ""
         
         try:
             # Create output directory
-            Path(output_dir).mkdir(parents=True, exist_ok=True)
+            _ensure_output_dir(str(output_dir))
             
             # Generate filename
             data = result["data"]
@@ -184,22 +365,26 @@ class JobProcessor:
             company = data.get("company_name", "company")
             
             # Clean filename
-            safe_title = "".join(c for c in job_title if c.isalnum() or c in (' ', '-', '_')).strip()
-            safe_company = "".join(c for c in company if c.isalnum() or c in (' ', '-', '_')).strip()
+            safe_title = _UNSAFE_FILENAME_RE.sub('', job_title).strip()
+            safe_company = _UNSAFE_FILENAME_RE.sub('', company).strip()
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{safe_company}_{safe_title}_{timestamp}.json"
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            filename = f"{safe_company}_{safe_title}_{timestamp}{name_suffix}.json"
             output_path = Path(output_dir) / filename
             
-            # Save to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            # Save to file (orjson writes UTF-8 bytes directly, like ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                content = orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                content = json.dumps(result, indent=2, ensure_ascii=False).encode('utf-8')
+            with open(output_path, 'wb') as f:
+                f.write(content)
             
-            logger.info(f"Result saved to: {output_path}")
+            logger.info("Result saved to: %s", output_path)
             return str(output_path)
             
         except Exception as e:
-            logger.error(f"Error saving result: {str(e)}")
+            logger.error("Error saving result: %s", e)
             return ""
 
 def main():
@@ -207,7 +392,8 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description="Job Description Processor")
-    parser.add_argument("input", help="Job description text or file path")
+    parser.add_argument("input", nargs="+",
+                       help="Job description text or file path (several are parsed concurrently)")
     parser.add_argument("--type", default="auto", choices=["text", "file", "auto"],
                        help="Input type (auto detects if file exists)")
     parser.add_argument("--api-key", help="Groq API key")
@@ -219,17 +405,31 @@ def main():
     # Initialize processor
     processor = JobProcessor(api_key=args.api_key)
     
-    # Determine input type
-    if args.type == "auto":
-        input_type = "file" if os.path.exists(args.input) else "text"
-    else:
-        input_type = args.type
+    # Determine input types
+    input_types = [("file" if os.path.exists(job_input) else "text") if args.type == "auto" else args.type
+                   for job_input in args.input]
+    
+    # Several jobs are parsed concurrently from one event loop
+    if len(args.input) > 1:
+        batch = asyncio.run(processor.batch_process_async(
+            [{"type": input_type, "source": job_input} for input_type, job_input in zip(input_types, args.input)],
+            save_dir=args.output_dir if args.save else None
+        ))
+        print(f"\n📊 Parsed {batch['successful']}/{batch['total']} job descriptions")
+        for job in batch["results"]:
+            if job["status"] == "success":
+                print(f"   {job['index']}. ✅ {job['title']} at {job['company']}")
+                if job.get("output_path"):
+                    print(f"      💾 Saved to: {job['output_path']}")
+            else:
+                print(f"   {job['index']}. ❌ {job['error']}")
+        return
     
     # Process job
-    if input_type == "file":
-        result = processor.process_file(args.input)
+    if input_types[0] == "file":
+        result = processor.process_file(args.input[0])
     else:
-        result = processor.process_text(args.input)
+        result = processor.process_text(args.input[0])
     
     # Display results
     processor.parser.display_parsed_job(result)
@@ -249,6 +449,7 @@ def main():
     print(f"\n🔧 Usage examples:")
     print(f'   python job_processor.py "job description text here"')
     print(f'   python job_processor.py job.txt --type file --save')
+    print(f'   python job_processor.py job1.txt job2.txt job3.txt')
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
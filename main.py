@@ -16,19 +16,27 @@ python main.py resume.pdf job.txt --api-key your_groq_key --format docx
 """
 
 import argparse
+import asyncio
+import hashlib
+import shutil
 import sys
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from datetime import datetime
+import threading
+import time
 
-# Import our custom modules
+# Import our custom modules (resume_generator is imported on first use, see resume_generator)
 try:
+    from groq_resume_extractor import (LLMResponseCache, DEFAULT_CACHE_PATH, PROMPT_VERSION, count_tokens,
+                                       create_groq_session)
     from groq_resume_processor import GroqResumeProcessor
-    from job_processor import JobProcessor
-    from resume_generator import CommandLineResumeGenerator
+    from job_description_parser import PARSER_PROMPT_VERSION
+    from job_processor import JobProcessor, JOB_WORKERS
 except ImportError as e:
     print(f"❌ ERROR: Missing required module: {e}")
     print("\nMake sure all these files are in the same directory:")
@@ -44,17 +52,153 @@ except ImportError as e:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Threads that write DOCX/PDF files while the next Groq request is in flight
+RENDER_WORKERS = 4
+
+# Version of the cached process_cv/process_job_description results; bump it
+# when the CV field mapping changes so stale mapped CVs are not reused
+RESULT_CACHE_VERSION = "1"
+
+# Finished resumes are reused for the same CV, job description and format until
+# one of these versions or resume_generator.output_version (tailoring prompts,
+# model and renderer) changes
+OUTPUT_CACHE_VERSION = f"output/{PROMPT_VERSION}/{PARSER_PROMPT_VERSION}/{RESULT_CACHE_VERSION}"
+
+# CV plus job description tokens up to which run(fast=True) tailors the resume with one
+# Groq request instead of separate extraction, parsing and tailoring requests
+FAST_PATH_MAX_TOKENS = int(os.environ.get("FAST_PATH_MAX_TOKENS", 6000))
+
+# Generator personal_info fields and the extractor personal_details fields they come from
+_PERSONAL_INFO_FIELDS = (
+    ("name", "name"),
+    ("email", "email"),
+    ("phone", "phone"),
+    ("location", "address"),
+    ("linkedin", "linkedin"),
+    ("portfolio", "website"),
+)
+
+# Accepted CV formats, and job description formats that parse best
+_CV_EXTS = frozenset({'.pdf', '.docx', '.doc'})
+_JOB_EXTS = frozenset({'.txt', '.md'})
+
+# Input files are hashed for the result cache in chunks of this size
+HASH_CHUNK_BYTES = 1 << 20
+
+def _file_sha256(path: str) -> str:
+    """Hex SHA-256 of a file's content, read in chunks rather than all at once"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(functools.partial(f.read, HASH_CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# Key the Groq clients fall back to when none is passed and none was edited into them
+_API_KEY_PLACEHOLDER = "YOUR_GROQ_API_KEY_HERE"
+
+# Systems shared per API key by ResumeCustomizationSystem.get
+_instances = {}
+_instances_lock = threading.Lock()
+
 class ResumeCustomizationSystem:
     """Main system for customizing resumes based on job descriptions"""
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, cache_path: str = DEFAULT_CACHE_PATH):
         """Initialize the system with Groq API key"""
         self.api_key = api_key
-        self.resume_processor = GroqResumeProcessor(groq_api_key=api_key)
-        self.job_processor = JobProcessor(api_key=api_key)
-        self.resume_generator = CommandLineResumeGenerator(api_key=api_key)
+        # Results by file content (None when the cache database cannot be opened)
+        self._cache = None
+        try:
+            self._cache = LLMResponseCache(cache_path)
+        except Exception as e:
+            logger.warning("Result cache disabled: %s", e)
+        # Copies of generated resumes, next to the cache database
+        self._output_cache_dir = (os.path.join(os.path.dirname(self._cache.path), "outputs")
+                                  if self._cache is not None else None)
+        # One connection pool to Groq for CV extraction, job parsing and tailoring
+        self._session = create_groq_session()
+        self.resume_processor = GroqResumeProcessor(groq_api_key=api_key, session=self._session)
+        self.job_processor = JobProcessor(api_key=api_key, session=self._session)
+        self._resume_generator = None
+        # Set by get() for systems in the shared registry
+        self._shared = False
+        self.render_pool = ThreadPoolExecutor(max_workers=RENDER_WORKERS)
+        # Job descriptions are parsed here while the CV is being extracted
+        self.job_pool = ThreadPoolExecutor(max_workers=JOB_WORKERS)
+        # Progress goes to the console when run interactively, to the log otherwise
+        self._interactive = sys.stdout.isatty()
         logger.info("Resume Customization System initialized")
     
+    def _progress(self, message: str, *args) -> None:
+        """Report a pipeline step (formatted only when it is printed or logged)"""
+        if self._interactive:
+            print(message % args if args else message)
+        else:
+            logger.info(message.lstrip("\n"), *args)
+    
+    @classmethod
+    def get(cls, api_key: str = None) -> "ResumeCustomizationSystem":
+        """
+        System for an API key, created on the first call and shared afterwards, so
+        servers and repeated main() calls reuse its clients, connections and pools.
+        Shared systems stay open: their close() (and with-block exit) does nothing.
+        """
+        with _instances_lock:
+            system = _instances.get(api_key)
+            if system is None:
+                system = _instances[api_key] = cls(api_key=api_key)
+                system._shared = True
+            return system
+    
+    @property
+    def resume_generator(self):
+        """Resume generator, created on first use (extraction-only callers never import python-docx)"""
+        if self._resume_generator is None:
+            # Threads sharing a system (see get) must not each create a generator
+            with _instances_lock:
+                if self._resume_generator is None:
+                    from resume_generator import CommandLineResumeGenerator
+                    self._resume_generator = CommandLineResumeGenerator(
+                        api_key=self.api_key, session=self._session, cache_path=self._cache and self._cache.path
+                    )
+        return self._resume_generator
+    
+    def close(self) -> None:
+        """Wait for pending work, then release the worker threads and HTTP connections
+        (not for systems shared through get, which other callers may still be using)"""
+        if self._shared:
+            return
+        self.job_pool.shutdown()
+        self.render_pool.shutdown()
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _api_key_error(self) -> Optional[Dict[str, Any]]:
+        """Error result when a Groq client has no API key, so runs fail before any file is processed"""
+        if self.api_key:
+            return None
+        # The generator's key is checked without creating it (that would import it and warn)
+        if self._resume_generator is not None:
+            generator_key = self._resume_generator.api_key
+        else:
+            from resume_generator import CommandLineResumeGenerator
+            generator_key = CommandLineResumeGenerator.default_api_key
+        keys = (("groq_resume_extractor.py", self.resume_processor.groq_extractor.api_key),
+                ("job_description_parser.py", self.job_processor.parser.api_key),
+                ("resume_generator.py", generator_key))
+        missing = [module for module, key in keys if key == _API_KEY_PLACEHOLDER]
+        if not missing:
+            return None
+        return {
+            "success": False,
+            "error": f"No Groq API key: use --api-key, set GROQ_API_KEY or edit the key in {', '.join(missing)}"
+        }
+    
     def validate_inputs(self, cv_file: str, job_file: str) -> Dict[str, Any]:
         """Validate input files"""
         errors = []
@@ -63,26 +207,55 @@ class ResumeCustomizationSystem:
         if not os.path.exists(cv_file):
             errors.append(f"CV file not found: {cv_file}")
         else:
-            cv_ext = Path(cv_file).suffix.lower()
-            if cv_ext not in ['.pdf', '.docx', '.doc']:
+            cv_ext = os.path.splitext(cv_file)[1].lower()
+            if cv_ext not in _CV_EXTS:
                 errors.append(f"Unsupported CV format: {cv_ext}. Use PDF or DOCX.")
         
         # Check job description file
         if not os.path.exists(job_file):
             errors.append(f"Job description file not found: {job_file}")
         else:
-            job_ext = Path(job_file).suffix.lower()
-            if job_ext not in ['.txt', '.md']:
-                logger.warning(f"Job file format {job_ext} may not be optimal. Text files work best.")
+            job_ext = os.path.splitext(job_file)[1].lower()
+            if job_ext not in _JOB_EXTS:
+                logger.warning("Job file format %s may not be optimal. Text files work best.", job_ext)
         
         return {
             "valid": len(errors) == 0,
             "errors": errors
         }
     
+    def _cached(self, path: str, version: str, model_id: str, process) -> Dict[str, Any]:
+        """
+        Return process(path), reusing the stored result when a file with the same
+        content was already processed (conversion, extraction and mapping are all skipped)
+        """
+        if self._cache is None:
+            return process(path)
+        try:
+            file_hash = _file_sha256(path)
+        except OSError:
+            return process(path)
+        
+        result = self._cache.get(file_hash, version, model_id)
+        if result is not None:
+            logger.info("Using cached result for %s", path)
+            return result
+        
+        result = process(path)
+        if result["success"]:
+            self._cache.set(file_hash, version, model_id, result)
+        return result
+    
     def process_cv(self, cv_file: str) -> Dict[str, Any]:
-        """Extract structured data from CV"""
-        logger.info(f"Processing CV: {cv_file}")
+        """Extract structured data from CV (cached by file content)"""
+        return self._cached(
+            cv_file, f"cv-file/{PROMPT_VERSION}/{RESULT_CACHE_VERSION}",
+            self.resume_processor.groq_extractor.model, self._process_cv
+        )
+    
+    def _process_cv(self, cv_file: str) -> Dict[str, Any]:
+        """Extract structured data from CV and map it to the generator format"""
+        logger.info("Processing CV: %s", cv_file)
         result = self.resume_processor.process_resume(cv_file)
         
         if not result["success"]:
@@ -95,40 +268,33 @@ class ResumeCustomizationSystem:
         cv_data = result["extracted_data"]
         
         # Map fields from extractor format to generator format
+        personal_details = cv_data["personal_details"]
+        technical_skills = cv_data["skills"].get("technical_skills", [])
         mapped_data = {
-            "personal_info": {
-                "name": cv_data["personal_details"].get("name", ""),
-                "email": cv_data["personal_details"].get("email", ""),
-                "phone": cv_data["personal_details"].get("phone", ""),
-                "location": cv_data["personal_details"].get("address", ""),
-                "linkedin": cv_data["personal_details"].get("linkedin", ""),
-                "portfolio": cv_data["personal_details"].get("website", "")
-            },
+            "personal_info": {field: personal_details.get(source, "") for field, source in _PERSONAL_INFO_FIELDS},
             "professional_summary": cv_data.get("summary", ""),
-            "core_competencies": cv_data["skills"].get("technical_skills", []),
-            "professional_experience": [],
+            "core_competencies": technical_skills,
+            "professional_experience": [
+                {
+                    "position": exp.get("position", ""),
+                    "company": exp.get("company", ""),
+                    "location": exp.get("location", ""),
+                    "duration": f"{exp.get('start_date', '')} - {exp.get('end_date', '')}",
+                    "achievements": [exp.get("description", "")]
+                }
+                for exp in cv_data.get("work_experience", [])
+            ],
             "education": cv_data.get("education", []),
             "technical_skills": {
                 "programming_languages": [],
                 "frameworks_tools": [],
                 "databases": [],
-                "other_technical": cv_data["skills"].get("technical_skills", [])
+                "other_technical": technical_skills
             },
             "projects": cv_data.get("projects", []),
             "certifications": cv_data.get("certifications", [])
         }
         
-        # Convert work experience
-        for exp in cv_data.get("work_experience", []):
-            mapped_exp = {
-                "position": exp.get("position", ""),
-                "company": exp.get("company", ""),
-                "location": exp.get("location", ""),
-                "duration": f"{exp.get('start_date', '')} - {exp.get('end_date', '')}",
-                "achievements": [exp.get("description", "")]
-            }
-            mapped_data["professional_experience"].append(mapped_exp)
-        
         return {
             "success": True,
             "data": mapped_data,
@@ -136,8 +302,19 @@ class ResumeCustomizationSystem:
         }
     
     def process_job_description(self, job_file: str) -> Dict[str, Any]:
+        """Parse job description into structured data (cached by file content)"""
+        result = self._cached(
+            job_file, f"jd-file/{PARSER_PROMPT_VERSION}/{RESULT_CACHE_VERSION}",
+            self.job_processor.parser.model, self._process_job_description
+        )
+        # A cached result may come from a copy of the file stored elsewhere
+        if "source" in result:
+            result["source"] = f"file:{job_file}"
+        return result
+    
+    def _process_job_description(self, job_file: str) -> Dict[str, Any]:
         """Parse job description into structured data"""
-        logger.info(f"Processing job description: {job_file}")
+        logger.info("Processing job description: %s", job_file)
         result = self.job_processor.process_file(job_file)
         
         if not result["success"]:
@@ -148,10 +325,11 @@ class ResumeCustomizationSystem:
         
         return result
     
-    def generate_tailored_resume(self, cv_data: Dict[str, Any], job_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate tailored resume using AI"""
+    def generate_tailored_resume(self, cv_data: Dict[str, Any], job_data: Dict[str, Any],
+                                 use_cache: bool = True) -> Dict[str, Any]:
+        """Generate tailored resume using AI (use_cache=False tailors it anew)"""
         logger.info("Generating tailored resume with AI...")
-        result = self.resume_generator.tailor_resume(cv_data, job_data["data"])
+        result = self.resume_generator.tailor_resume(cv_data, job_data["data"], use_cache=use_cache)
         
         if not result["success"]:
             return {
@@ -163,7 +341,7 @@ class ResumeCustomizationSystem:
     
     def create_output_file(self, tailored_resume: Dict[str, Any], output_path: str, format_type: str) -> Dict[str, Any]:
         """Create final resume file"""
-        logger.info(f"Creating {format_type.upper()} file: {output_path}")
+        logger.info("Creating %s file: %s", format_type.upper(), output_path)
         resume_data = tailored_resume["tailored_resume"]
         
         if format_type.lower() == "docx":
@@ -176,80 +354,316 @@ class ResumeCustomizationSystem:
                 "error": f"Unsupported output format: {format_type}"
             }
     
-    def run(self, cv_file: str, job_file: str, output_name: str = None, format_type: str = "docx") -> Dict[str, Any]:
-        """Run the complete resume customization pipeline"""
-        print("🚀 INTELLIGENT RESUME TAILORING SYSTEM")
-        print("=" * 50)
+    def run(self, cv_file: str, job_file: str, output_name: str = None, format_type: str = "docx",
+            reuse_output: bool = True, fast: bool = False) -> Dict[str, Any]:
+        """
+        Run the complete resume customization pipeline. With reuse_output=False the
+        resume is tailored again and rendered anew rather than reused from an earlier
+        run with the same files (the new one replaces it in the caches). With fast=True short inputs are tailored with a
+        single Groq request, skipping structured CV extraction and job parsing.
+        """
+        if self._interactive:
+            print("🚀 INTELLIGENT RESUME TAILORING SYSTEM")
+            print("=" * 50)
         
         # Step 1: Validate inputs
-        print("\n1️⃣ Validating input files...")
+        self._progress("\n1️⃣ Validating input files...")
         validation = self.validate_inputs(cv_file, job_file)
         if not validation["valid"]:
             return {
                 "success": False,
                 "errors": validation["errors"]
             }
-        print("✅ Input files validated")
+        self._progress("✅ Input files validated")
+        
+        # The same CV and job description were turned into this format before
+        output_key = self._output_key(cv_file, job_file, format_type, fast)
+        if output_key is not None and reuse_output:
+            output_path = self._output_path(cv_file, job_file, output_name, format_type)
+            cached = self._restore_output(output_key, output_path, format_type, fast)
+            if cached is not None:
+                self._progress("♻️ Reusing the resume generated earlier for these files")
+                self._progress("\n🎉 SUCCESS! Resume customization completed\n📄 Input CV: %s\n💼 Target Job: %s at %s"
+                               "\n📝 Output: %s (%.1f KB)",
+                               cv_file, cached["job_title"], cached["company"], output_path,
+                               cached["file_info"].get('file_size_kb', 0))
+                return cached
+        
+        # Without an API key every remaining step would fail at its first Groq request
+        key_error = self._api_key_error()
+        if key_error is not None:
+            return key_error
+        
+        # Steps 2-4: in fast mode short inputs are tailored with a single Groq request,
+        # anything else (or a failed short request) goes through the full pipeline
+        tailored_result = self._tailor_short_inputs(cv_file, job_file, reuse_output) if fast else None
+        if tailored_result is None:
+            tailored_result = self._tailor_in_steps(cv_file, job_file, reuse_output)
+        if not tailored_result["success"]:
+            return tailored_result
+        job_title = tailored_result["job_title"]
+        company = tailored_result["company"]
+        
+        # Step 5: Create output file
+        self._progress("\n5️⃣ Creating %s file...", format_type.upper())
+        
+        output_path = self._output_path(cv_file, job_file, output_name, format_type)
+        file_result = self.create_output_file(tailored_result, output_path, format_type)
+        
+        if not file_result["success"]:
+            return file_result
+        
+        self._progress("✅ Resume created: %s", output_path)
+        
+        # Success summary
+        self._progress("\n🎉 SUCCESS! Resume customization completed\n📄 Input CV: %s\n💼 Target Job: %s at %s"
+                       "\n📝 Output: %s (%.1f KB)",
+                       cv_file, job_title, company, output_path, file_result.get('file_size_kb', 0))
+        
+        result = {
+            "success": True,
+            "output_file": output_path,
+            "job_title": job_title,
+            "company": company,
+            "candidate_name": tailored_result["candidate_name"],
+            "file_info": file_result
+        }
+        if output_key is not None:
+            self._store_output(output_key, output_path, format_type, result, fast)
+        return result
+    
+    def _tailor_in_steps(self, cv_file: str, job_file: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Extract the CV, parse the job description and tailor the resume (steps 2-4)"""
+        # Steps 2 and 3 are independent Groq calls: start the job description
+        # in the background so it is parsed while the CV is extracted
+        job_future = self.job_pool.submit(self.process_job_description, job_file)
         
         # Step 2: Process CV
-        print("\n2️⃣ Extracting data from CV...")
+        self._progress("\n2️⃣ Extracting data from CV...")
         cv_result = self.process_cv(cv_file)
         if not cv_result["success"]:
             return cv_result
-        print(f"✅ CV processed - extracted data for {cv_result['data']['personal_info']['name']}")
+        candidate_name = cv_result['data']['personal_info']['name']
+        self._progress("✅ CV processed - extracted data for %s", candidate_name)
         
         # Step 3: Process job description
-        print("\n3️⃣ Analyzing job description...")
-        job_result = self.process_job_description(job_file)
+        self._progress("\n3️⃣ Analyzing job description...")
+        job_result = job_future.result()
         if not job_result["success"]:
             return job_result
         
         job_title = job_result["data"].get("job_title", "target position")
         company = job_result["data"].get("company_name", "target company")
-        print(f"✅ Job analyzed - {job_title} at {company}")
+        self._progress("✅ Job analyzed - %s at %s", job_title, company)
         
         # Step 4: Generate tailored resume
-        print("\n4️⃣ Tailoring resume with AI...")
-        tailored_result = self.generate_tailored_resume(cv_result["data"], job_result)
+        self._progress("\n4️⃣ Tailoring resume with AI...")
+        tailored_result = self.generate_tailored_resume(cv_result["data"], job_result, use_cache)
         if not tailored_result["success"]:
             return tailored_result
-        print("✅ Resume tailored successfully")
+        self._progress("✅ Resume tailored successfully")
         
-        # Step 5: Create output file
-        print(f"\n5️⃣ Creating {format_type.upper()} file...")
+        tailored_result.update(job_title=job_title, company=company, candidate_name=candidate_name)
+        return tailored_result
+    
+    def _tailor_short_inputs(self, cv_file: str, job_file: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Tailor the resume straight from the CV and job description text with one
+        Groq request, when both together are under FAST_PATH_MAX_TOKENS.
+        Returns None when the inputs are too long or the request fails.
+        """
+        doc_result = self.resume_processor.doc_converter.extract_from_file(cv_file)
+        resume_text = (doc_result.get("text") or "").strip() if doc_result.get("success", True) else ""
+        job_text, error = self.job_processor.load_text(job_file)
+        if error or len(resume_text) < 50 or not job_text:
+            return None
+        if count_tokens(resume_text) + count_tokens(job_text) > FAST_PATH_MAX_TOKENS:
+            return None
+        
+        self._progress("\n2️⃣ Tailoring resume from the CV and job description in one request...")
+        tailored_result = self.resume_generator.tailor_resume_from_text(resume_text, job_text,
+                                                                        doc_result.get("raw_text"), use_cache)
+        if not tailored_result["success"]:
+            logger.warning("Single-request tailoring failed (%s), using the full pipeline", tailored_result["error"])
+            return None
+        
+        job_data = tailored_result["job_data"]
+        job_title = job_data.get("job_title") or "target position"
+        company = job_data.get("company_name") or "target company"
+        candidate_name = tailored_result["tailored_resume"].get("personal_info", {}).get("name", "")
+        self._progress("✅ Resume tailored for %s at %s", job_title, company)
         
-        # Generate output filename if not provided
+        tailored_result.update(job_title=job_title, company=company, candidate_name=candidate_name)
+        return tailored_result
+    
+    def _output_path(self, cv_file: str, job_file: str, output_name: Optional[str], format_type: str) -> str:
+        """Output file path, named after the inputs and the current time if no name is given"""
         if not output_name:
             cv_name = Path(cv_file).stem
             job_name = Path(job_file).stem
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             output_name = f"{cv_name}_tailored_for_{job_name}_{timestamp}"
         
-        output_path = f"{output_name}.{format_type.lower()}"
-        file_result = self.create_output_file(tailored_result, output_path, format_type)
+        return f"{output_name}.{format_type.lower()}"
+    
+    def _output_key(self, cv_file: str, job_file: str, format_type: str, fast: bool = False) -> Optional[str]:
+        """Cache key of the resume for these input files, format and mode (None if a file cannot be read)"""
+        try:
+            key = f"{_file_sha256(cv_file)}:{_file_sha256(job_file)}:{format_type.lower()}"
+            if fast:
+                key += ":fast"
+        except OSError:
+            return None
+        return hashlib.sha256(key.encode()).hexdigest()
+    
+    def _output_version(self, format_type: str, fast: bool = False) -> str:
+        """Cache version of finished resumes in this format (fast: made by the single-request path)"""
+        from resume_generator import output_version
+        return f"{OUTPUT_CACHE_VERSION}/{output_version(format_type, text=fast)}"
+    
+    def _output_artifact(self, output_key: str, format_type: str) -> str:
+        """Path of the cached copy of a generated resume"""
+        return os.path.join(self._output_cache_dir, f"{output_key}.{format_type.lower()}")
+    
+    def _restore_output(self, output_key: str, output_path: str, format_type: str,
+                        fast: bool = False) -> Optional[Dict[str, Any]]:
+        """Copy a previously generated resume to output_path and return its run() result, if cached"""
+        if self._cache is None:
+            return None
+        result = self._cache.get(output_key, self._output_version(format_type, fast), "tailored-resume")
+        if result is None:
+            return None
+        try:
+            shutil.copyfile(self._output_artifact(output_key, format_type), output_path)
+        except OSError:
+            return None
         
-        if not file_result["success"]:
-            return file_result
+        result["output_file"] = output_path
+        result["file_info"]["output_path"] = output_path
+        result["cached"] = True
+        return result
+    
+    def _store_output(self, output_key: str, output_path: str, format_type: str, result: Dict[str, Any],
+                      fast: bool = False) -> None:
+        """Keep a copy of a generated resume for later runs with the same inputs"""
+        if self._cache is None:
+            return
+        try:
+            os.makedirs(self._output_cache_dir, exist_ok=True)
+            shutil.copyfile(output_path, self._output_artifact(output_key, format_type))
+            self._cache.set(output_key, self._output_version(format_type, fast), "tailored-resume", result)
+        except Exception as e:
+            logger.warning("Could not cache generated resume: %s", e)
+    
+    def run_batch(self, cv_file: str, job_files: List[str], output_names: List[str],
+                  format_type: str = "docx") -> List[Dict[str, Any]]:
+        """
+        Run the pipeline for one CV against several job descriptions.
         
-        print(f"✅ Resume created: {output_path}")
+        The job descriptions are parsed concurrently while the CV is extracted
+        (once), and the CV is tailored to all jobs through
+        tailor_resume_batch, so the resume is sent to Groq once per group of
+        jobs rather than once per job. Each group's output files are written on
+        render_pool while the next group is being tailored. Returns one
+        run()-style result per job.
+        """
+        key_error = self._api_key_error()
+        if key_error is not None:
+            return [key_error for _ in job_files]
         
-        # Success summary
-        print("\n🎉 SUCCESS! Resume customization completed")
-        print(f"📄 Input CV: {cv_file}")
-        print(f"💼 Target Job: {job_title} at {company}")
-        print(f"📝 Output: {output_path} ({file_result.get('file_size_kb', 0):.1f} KB)")
+        results = [None] * len(job_files)
         
-        return {
-            "success": True,
-            "output_file": output_path,
-            "job_title": job_title,
-            "company": company,
-            "candidate_name": cv_result["data"]["personal_info"]["name"],
-            "file_info": file_result
-        }
+        # Parse the valid job descriptions concurrently, alongside the CV extraction
+        job_futures = []
+        for index, job_file in enumerate(job_files):
+            validation = self.validate_inputs(cv_file, job_file)
+            if not validation["valid"]:
+                results[index] = {
+                    "success": False,
+                    "errors": validation["errors"],
+                    "error": "; ".join(validation["errors"])
+                }
+                continue
+            job_futures.append((index, self.job_pool.submit(self.process_job_description, job_file)))
+        
+        if not job_futures:
+            return results
+        
+        cv_result = self.process_cv(cv_file)
+        if not cv_result["success"]:
+            return [result or cv_result for result in results]
+        
+        jobs = []
+        for index, job_future in job_futures:
+            job_result = job_future.result()
+            if not job_result["success"]:
+                results[index] = job_result
+                continue
+            jobs.append((index, job_result["data"]))
+        
+        if not jobs:
+            return results
+        
+        logger.info("Tailoring %s for %d job(s)", Path(cv_file).name, len(jobs))
+        
+        from resume_generator import BATCH_JOBS_PER_REQUEST
+        
+        # Render each group's files in the background while the next group is tailored
+        renders = []
+        for start in range(0, len(jobs), BATCH_JOBS_PER_REQUEST):
+            group = jobs[start:start + BATCH_JOBS_PER_REQUEST]
+            tailored_results = self.resume_generator.tailor_resume_batch(
+                cv_result["data"], [job_data for _, job_data in group]
+            )
+            
+            for (index, job_data), tailored_result in zip(group, tailored_results):
+                if not tailored_result["success"]:
+                    results[index] = {
+                        "success": False,
+                        "error": f"Resume tailoring failed: {tailored_result['error']}"
+                    }
+                    continue
+                
+                output_path = f"{output_names[index]}.{format_type.lower()}"
+                future = self.render_pool.submit(self.create_output_file, tailored_result, output_path, format_type)
+                renders.append((index, job_data, output_path, future))
+        
+        for index, job_data, output_path, future in renders:
+            file_result = future.result()
+            if not file_result["success"]:
+                results[index] = file_result
+                continue
+            
+            self._progress("✅ Resume created: %s", output_path)
+            results[index] = {
+                "success": True,
+                "output_file": output_path,
+                "job_title": job_data.get("job_title", "target position"),
+                "company": job_data.get("company_name", "target company"),
+                "candidate_name": cv_result["data"]["personal_info"]["name"],
+                "file_info": file_result
+            }
+        
+        return results
+    
+    async def run_async(self, cv_file: str, job_file: str, output_name: str = None, format_type: str = "docx") -> Dict[str, Any]:
+        """Run the pipeline in a worker thread so multiple runs can overlap their Groq calls"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.run, cv_file, job_file, output_name, format_type)
+        )
+    
+    async def run_batch_async(self, cv_file: str, job_files: List[str], output_names: List[str],
+                              format_type: str = "docx") -> List[Dict[str, Any]]:
+        """Run run_batch in a worker thread so several CVs can be tailored concurrently"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.run_batch, cv_file, job_files, output_names, format_type)
+        )
 
-def main():
-    """Main function for command line usage"""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Command line parser, built once per process (main() may be called repeatedly)"""
     parser = argparse.ArgumentParser(
         description="Intelligent Resume Tailoring System",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -272,8 +686,17 @@ Examples:
     parser.add_argument("--api-key", help="Groq API key")
     parser.add_argument("--verbose", "-v", action="store_true",
                        help="Enable verbose logging")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Tailor and generate a new resume even if one was made earlier for the same "
+                            "files (the CV extraction and job description parse are still reused)")
+    parser.add_argument("--fast", action="store_true",
+                       help="Tailor short inputs with a single Groq request (skips structured CV extraction)")
     
-    args = parser.parse_args()
+    return parser
+
+def main(argv: List[str] = None):
+    """Main function for command line usage (argv defaults to sys.argv[1:])"""
+    args = _build_parser().parse_args(argv)
     
     # Set logging level
     if args.verbose:
@@ -291,7 +714,7 @@ Examples:
     
     # Initialize system
     try:
-        system = ResumeCustomizationSystem(api_key=api_key)
+        system = ResumeCustomizationSystem.get(api_key)
     except Exception as e:
         print(f"❌ System initialization failed: {e}")
         sys.exit(1)
@@ -302,7 +725,9 @@ Examples:
             cv_file=args.cv_file,
             job_file=args.job_file,
             output_name=args.output,
-            format_type=args.format
+            format_type=args.format,
+            reuse_output=not args.no_cache,
+            fast=args.fast
         )
         
         if result["success"]:
@@ -11,12 +11,33 @@ python resume_generator.py resume_data.json job_requirements.json --format docx
 
 import json
 import argparse
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import io
 import sys
 import os
+import re
+import shutil
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from xml.sax.saxutils import escape
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
 
 # Import our core components
 try:
@@ -25,84 +46,116 @@ except ImportError:
     print("❌ ERROR: requests not installed. Run: pip install requests")
     sys.exit(1)
 
-try:
+# Streamed replies are scanned for the end of the JSON object like the extractor's,
+# and tailored resumes are kept in its SQLite response cache
+from groq_resume_extractor import (JSONObjectScanner, LLMResponseCache, DEFAULT_CACHE_PATH, create_groq_session,
+                                   stream_delta_content, _extract_personal_details, _rate_limiter,
+                                   _rate_limit_pause)
+
+# python-docx (which pulls in lxml) and ReportLab are only looked up here and
+# imported on first use, so --help, tailoring and single-format runs skip them
+DOCX_AVAILABLE = importlib.util.find_spec("docx") is not None
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+
+@functools.lru_cache(maxsize=1)
+def _import_docx() -> None:
+    """Import the python-docx names used for DOCX output into this module"""
+    global Document, Pt, WD_ALIGN_PARAGRAPH, WD_STYLE_TYPE
     from docx import Document
-    from docx.shared import Inches, Pt
+    from docx.shared import Pt
     from docx.enum.text import WD_ALIGN_PARAGRAPH
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+    from docx.enum.style import WD_STYLE_TYPE
+
+@functools.lru_cache(maxsize=1)
+def _import_reportlab() -> None:
+    """Import the ReportLab names used for PDF output into this module"""
+    global letter, ParagraphStyle, getSampleStyleSheet, inch, Paragraph, SimpleDocTemplate, Spacer
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-class CommandLineResumeGenerator:
-    """Command-line resume generator using Groq API"""
-    
-    def __init__(self, api_key: str = None):
-        # API key can be provided via command line or hardcoded here
-        self.api_key = api_key or "YOUR_GROQ_API_KEY_HERE"  # Replace with your key
-        self.model = "qwen-3-32b"
-        self.base_url = "https://api.groq.com/openai/v1/chat/completions"
-        
-        if self.api_key == "YOUR_GROQ_API_KEY_HERE":
-            print("⚠️ WARNING: Using default API key placeholder. Set your key with --api-key or edit the code.")
-    
-    def load_json_file(self, file_path: str) -> Dict[str, Any]:
-        """Load and validate JSON file"""
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            logger.info(f"✅ Loaded JSON file: {file_path}")
-            return data
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in {file_path}: {str(e)}")
-        except Exception as e:
-            raise Exception(f"Error reading {file_path}: {str(e)}")
-    
-    def create_tailoring_prompt(self, resume_data: Dict[str, Any], job_data: Dict[str, Any]) -> str:
-        """Create optimized prompt for resume tailoring"""
-        # Extract key information
-        candidate_name = resume_data.get("personal_info", {}).get("name", "Candidate")
-        job_title = job_data.get("job_title", "Target Position")
-        
-        # Get skills from job
-        required_skills = job_data.get("required_skills", [])
-        preferred_skills = job_data.get("preferred_skills", [])
-        responsibilities = job_data.get("key_responsibilities", [])
-        
-        return f"""You are an expert resume writer. Create a tailored, ATS-friendly resume that aligns the candidate's experience with the job requirements.
+# orjson parses model replies several times faster than the json module
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
 
-CANDIDATE DATA:
-{json.dumps(resume_data, indent=2)}
+# Values that carry no information for the model, only prompt tokens
+_EMPTY_VALUES = (None, "", [], {})
 
-JOB REQUIREMENTS:
-Position: {job_title}
-Required Skills: {', '.join(required_skills[:15])}
-Preferred Skills: {', '.join(preferred_skills[:10])}
-Key Responsibilities: {'; '.join(responsibilities[:5])}
+def _drop_empty(value: Any) -> Any:
+    """Copy of a JSON value without empty strings, lists, objects and nulls (at any depth)"""
+    if isinstance(value, dict):
+        pruned = {key: _drop_empty(item) for key, item in value.items()}
+        return {key: item for key, item in pruned.items() if item not in _EMPTY_VALUES}
+    if isinstance(value, list):
+        pruned = [_drop_empty(item) for item in value]
+        return [item for item in pruned if item not in _EMPTY_VALUES]
+    return value
 
-INSTRUCTIONS:
-1. Reorganize experience to highlight job-relevant achievements
-2. Integrate target keywords naturally throughout the resume
-3. Emphasize quantified achievements that align with job responsibilities
-4. Ensure ATS-friendly formatting with clear sections
-5. Write compelling content while maintaining authenticity
+def _prompt_json(obj: Any) -> str:
+    """Compact JSON of resume data for prompts: no indentation and no empty fields,
+    with non-ASCII text kept as is (all of which means fewer prompt tokens)"""
+    obj = _drop_empty(obj)
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
 
-Return ONLY this JSON structure:
-{{
-  "personal_info": {{
+# JSON object in a reply: the contents of a ```json code block anywhere in it, or
+# else everything from the first '{' to the last '}' (searched separately, since one
+# alternation would take a brace before the code block)
+_JSON_FENCE_RE = re.compile(r"```json\s*(\{.*?\})\s*```", re.DOTALL)
+_JSON_SPAN_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Reasoning the model may write before its answer; braces in it are not the reply's JSON
+_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+
+# Bump when the tailoring prompts or request parameters change so cached
+# tailored resumes are not reused
+TAILORING_PROMPT_VERSION = "tailor-v3"
+
+# Groq model resumes are tailored with
+TAILORING_MODEL = "qwen-3-32b"
+
+# Bump when the DOCX, PDF or markdown output changes, so finished resumes
+# cached by callers (see output_version) are rendered again
+RENDER_VERSION = "2"
+
+def _tailoring_key(resume_data: Dict[str, Any], job_data: Dict[str, Any]) -> str:
+    """Cache key of a (resume, job) pair; key order inside the data does not matter"""
+    if ORJSON_AVAILABLE:
+        content = orjson.dumps([resume_data, job_data], option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    else:
+        content = json.dumps([resume_data, job_data], sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+# Output tokens and seconds allowed for one tailored resume
+RESUME_MAX_TOKENS = 4000
+RESUME_TIMEOUT = 60
+
+# Most output tokens a batch request asks for (Groq rejects a max_tokens above the
+# model's completion limit) and the longest a batch request may take
+BATCH_MAX_TOKENS = 16384
+BATCH_TIMEOUT = 180
+
+# Jobs tailored per Groq request in tailor_resume_batch, as many resumes as fit in BATCH_MAX_TOKENS
+BATCH_JOBS_PER_REQUEST = BATCH_MAX_TOKENS // RESUME_MAX_TOKENS
+
+# JSON structure of the personal info in a tailored resume; only the raw-text
+# prompt asks for it, the other prompts copy it from the candidate data
+_PERSONAL_INFO_SCHEMA = """  "personal_info": {
     "name": "Full Name",
     "email": "email@domain.com",
     "phone": "phone number",
     "location": "City, State",
     "linkedin": "LinkedIn URL if available",
     "portfolio": "Portfolio URL if available"
-  }},
+  }"""
+
+# JSON structure of the sections the model rewrites, shared by the single and batch prompts
+TAILORED_SECTIONS_SCHEMA = """{
   "professional_summary": "Compelling 3-4 sentence summary tailored to the target job",
   "core_competencies": [
     "Skill 1 (prioritized for job relevance)",
@@ -110,7 +163,7 @@ Return ONLY this JSON structure:
     "Up to 12 most relevant skills"
   ],
   "professional_experience": [
-    {{
+    {
       "position": "Job Title",
       "company": "Company Name",
       "location": "City, State",
@@ -120,133 +173,778 @@ Return ONLY this JSON structure:
         "• Quantified result with metrics (numbers, percentages, amounts)",
         "• Achievement demonstrating skills needed for target position"
       ]
-    }}
+    }
   ],
   "education": [
-    {{
+    {
       "degree": "Degree Type",
       "field": "Field of Study",
       "institution": "School Name",
       "graduation_year": "Year"
-    }}
+    }
   ],
-  "technical_skills": {{
+  "technical_skills": {
     "programming_languages": ["Languages relevant to job"],
     "frameworks_tools": ["Frameworks/tools matching job"],
     "databases": ["Database technologies if applicable"],
     "other_technical": ["Other relevant technical skills"]
-  }},
+  },
   "projects": [
-    {{
+    {
       "name": "Project Name",
       "description": "Description emphasizing job-relevant skills",
       "technologies": ["Technologies matching job requirements"]
-    }}
+    }
   ],
   "certifications": [
-    {{
+    {
       "name": "Certification Name",
       "issuer": "Issuing Organization",
       "date": "Date if recent/relevant"
-    }}
+    }
+  ]
+}"""
+
+# JSON structure of one complete tailored resume
+TAILORED_RESUME_SCHEMA = "{\n" + _PERSONAL_INFO_SCHEMA + "," + TAILORED_SECTIONS_SCHEMA[1:]
+
+# Raw-text tailoring only asks the model for the name and location; contact details
+# are found in the resume text with regexes so they cannot be made up
+_TEXT_PERSONAL_INFO_SCHEMA = """  "personal_info": {
+    "name": "Full Name",
+    "location": "City, State"
+  }"""
+_TEXT_TAILORED_RESUME_SCHEMA = "{\n" + _TEXT_PERSONAL_INFO_SCHEMA + "," + TAILORED_SECTIONS_SCHEMA[1:]
+
+# Generator personal_info fields filled from _extract_personal_details, and their source fields
+_TEXT_CONTACT_FIELDS = (("email", "email"), ("phone", "phone"), ("linkedin", "linkedin"), ("portfolio", "website"))
+
+# JSON Schema of a tailored resume: the types the DOCX/PDF/markdown renderers rely on
+# (they skip sections that are null or missing, but not ones of the wrong type)
+_STRING_ARRAY = {"type": "array", "items": {"type": "string"}}
+
+def _nullable(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a schema that also accepts null"""
+    return {**schema, "type": [schema["type"], "null"]}
+
+TAILORED_RESUME_JSON_SCHEMA = {
+    "type": "object",
+    "required": ["personal_info"],
+    "properties": {
+        "personal_info": {"type": "object"},
+        "professional_summary": {"type": ["string", "null"]},
+        "core_competencies": _nullable(_STRING_ARRAY),
+        "professional_experience": _nullable({
+            "type": "array",
+            "items": {"type": "object", "properties": {"achievements": _STRING_ARRAY}},
+        }),
+        "education": _nullable({"type": "array", "items": {"type": "object"}}),
+        "technical_skills": _nullable({"type": "object", "additionalProperties": _STRING_ARRAY}),
+        "projects": _nullable({
+            "type": "array",
+            "items": {"type": "object", "properties": {"technologies": _STRING_ARRAY}},
+        }),
+        "certifications": _nullable({"type": "array", "items": {"type": "object"}}),
+    },
+}
+
+_SCHEMA_TYPES = {"object": dict, "array": list, "string": str, "null": type(None)}
+
+def _check_schema(schema: Dict[str, Any], data: Any, path: str = "data") -> None:
+    """Validate data against the subset of JSON Schema used above (without fastjsonschema);
+    raises ValueError like fastjsonschema's validators"""
+    expected = schema.get("type")
+    if isinstance(expected, str):
+        expected = [expected]
+    if expected and not isinstance(data, tuple(_SCHEMA_TYPES[name] for name in expected)):
+        raise ValueError(f"{path} must be {' or '.join(expected)}")
+    if isinstance(data, dict):
+        for key in schema.get("required", ()):
+            if key not in data:
+                raise ValueError(f"{path} must contain ['{key}'] properties")
+        properties = schema.get("properties", {})
+        extra = schema.get("additionalProperties")
+        for key, value in data.items():
+            subschema = properties.get(key, extra)
+            if isinstance(subschema, dict):
+                _check_schema(subschema, value, f"{path}.{key}")
+    elif isinstance(data, list) and "items" in schema:
+        for index, item in enumerate(data):
+            _check_schema(schema["items"], item, f"{path}[{index}]")
+
+# Compiled once: fastjsonschema generates a plain Python validator for the schema
+if FASTJSONSCHEMA_AVAILABLE:
+    _validate_tailored_resume = fastjsonschema.compile(TAILORED_RESUME_JSON_SCHEMA)
+else:
+    _validate_tailored_resume = functools.partial(_check_schema, TAILORED_RESUME_JSON_SCHEMA)
+
+def _tailored_resume_error(tailored_resume: Any) -> Optional[str]:
+    """Why a tailored resume from the model cannot be rendered, or None if it can"""
+    try:
+        _validate_tailored_resume(tailored_resume)
+    except ValueError as e:
+        return str(e)
+    return None
+
+# Steps shared by the single and batch tailoring prompts
+_TAILORING_STEPS = """1. Reorganize experience to highlight job-relevant achievements
+2. Integrate target keywords naturally throughout the resume
+3. Emphasize quantified achievements that align with job responsibilities
+4. Ensure ATS-friendly formatting with clear sections
+5. Write compelling content while maintaining authenticity"""
+
+# Tailoring prompts start with these static instructions and put the candidate
+# and job data last, so requests share a byte-identical prefix that Groq's
+# prompt caching can reuse (and a batch run's requests also share the CV)
+_TAILORING_PROMPT_PREFIX = f"""You are an expert resume writer. Create a tailored, ATS-friendly resume that aligns the candidate's experience with the job requirements given after the candidate data.
+
+INSTRUCTIONS:
+{_TAILORING_STEPS}
+
+Return ONLY this JSON structure:
+{TAILORED_SECTIONS_SCHEMA}
+"""
+
+_BATCH_TAILORING_PROMPT_PREFIX = f"""You are an expert resume writer. Create one tailored, ATS-friendly resume for each job listed after the candidate data, aligning the candidate's experience with that job's requirements.
+
+INSTRUCTIONS (apply to each job separately):
+{_TAILORING_STEPS}
+
+Each tailored resume must use this JSON structure:
+{TAILORED_SECTIONS_SCHEMA}
+
+Return ONLY this JSON, with one entry per job:
+{{
+  "resumes": [
+    {{"job_index": 1, "resume": {{ tailored resume for JOB 1 }}}}
   ]
 }}
+"""
+
+# Single-request variant for short inputs: the model reads the raw resume and job
+# description text and returns the job's title and company with the tailored resume
+_TEXT_TAILORING_PROMPT_PREFIX = f"""You are an expert resume writer. Read the candidate's resume and the job description given as raw text below, identify the job's title, company, required skills and key responsibilities, and create a tailored, ATS-friendly resume that aligns the candidate's experience with that job.
+
+INSTRUCTIONS:
+{_TAILORING_STEPS}
+
+Return ONLY this JSON:
+{{
+  "job": {{"job_title": "Job title", "company_name": "Company name"}},
+  "resume": {_TEXT_TAILORED_RESUME_SCHEMA}
+}}
+"""
+
+# Sections tailored by separate parallel requests in sectioned mode: the tailored
+# fields of each, the candidate fields its prompt includes (None for all but
+# personal_info) and its output token budget
+_TAILORING_SECTIONS = {
+    "summary": (("professional_summary", "core_competencies", "technical_skills"), None, 1200),
+    "experience": (("professional_experience",), ("professional_experience",), 2500),
+    "background": (("education", "projects", "certifications"),
+                   ("education", "projects", "certifications"), 1500),
+}
+
+_TAILORED_SECTIONS_FIELDS = json.loads(TAILORED_SECTIONS_SCHEMA)
+
+def _section_prompt_prefix(fields) -> str:
+    """Static start of a section's tailoring prompt (shared by all its requests)"""
+    schema = json.dumps({field: _TAILORED_SECTIONS_FIELDS[field] for field in fields}, indent=2, ensure_ascii=False)
+    return f"""You are an expert resume writer. Tailor the following sections of the candidate's resume, given as candidate data below, to the job requirements given after it: {', '.join(fields)}.
+
+INSTRUCTIONS:
+{_TAILORING_STEPS}
+
+Return ONLY this JSON structure:
+{schema}
+"""
+
+_SECTION_PROMPT_PREFIXES = {
+    section: _section_prompt_prefix(fields) for section, (fields, _, _) in _TAILORING_SECTIONS.items()
+}
+
+def _without_personal_info(resume_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Candidate data for tailoring prompts: the model does not see (or echo back) personal_info"""
+    return {key: value for key, value in resume_data.items() if key != "personal_info"}
+
+def _with_personal_info(tailored_resume: Dict[str, Any], resume_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Tailored resume with the candidate's personal_info copied in, ahead of the tailored sections"""
+    tailored = {key: value for key, value in tailored_resume.items() if key != "personal_info"}
+    return {"personal_info": resume_data.get("personal_info") or {}, **tailored}
+
+def _text_personal_info(model_info: Any, contact_text: str) -> Dict[str, str]:
+    """personal_info of a raw-text tailoring result: name and location from the model,
+    contact details from the (uncleaned) resume text"""
+    model_info = model_info if isinstance(model_info, dict) else {}
+    details = _extract_personal_details(contact_text)
+    personal_info = {"name": model_info.get("name") or "", "location": model_info.get("location") or ""}
+    personal_info.update((field, details.get(source, "")) for field, source in _TEXT_CONTACT_FIELDS)
+    return personal_info
+
+def _job_requirements(job_data: Dict[str, Any]) -> str:
+    """Job requirements lines of the tailoring prompts"""
+    return f"""Position: {job_data.get("job_title", "Target Position")}
+Required Skills: {', '.join(job_data.get("required_skills", [])[:15])}
+Preferred Skills: {', '.join(job_data.get("preferred_skills", [])[:10])}
+Key Responsibilities: {'; '.join(job_data.get("key_responsibilities", [])[:5])}"""
+
+def _contact_line(personal: Dict[str, Any]) -> str:
+    """Contact line of every output format: email, phone and location joined by ' | '"""
+    parts = []
+    for field in ("email", "phone", "location"):
+        value = personal.get(field)
+        if value:
+            parts.append(value)
+    return " | ".join(parts)
+
+# Tectonic (XeTeX with a cached format file) starts in a fraction of a second,
+# where xelatex reloads its format and packages for every PDF
+@functools.lru_cache(maxsize=1)
+def _latex_engine() -> str:
+    """LaTeX engine Pandoc renders PDFs with: tectonic if installed, else xelatex"""
+    return "tectonic" if shutil.which("tectonic") else "xelatex"
+
+def _tailoring_prompt_version(sectioned: bool) -> str:
+    """Cache version of tailored resumes from the single or sectioned prompts"""
+    return f"{TAILORING_PROMPT_VERSION}/sectioned" if sectioned else TAILORING_PROMPT_VERSION
+
+
+# Raw-text tailoring uses its own prompt, so its cache entries get their own version
+TEXT_TAILORING_PROMPT_VERSION = f"{TAILORING_PROMPT_VERSION}/text-v2"
+
+def output_version(format_type: str, pdf_engine: str = "auto", sectioned: bool = False, text: bool = False) -> str:
+    """What a finished resume file depends on besides its inputs: the tailoring
+    prompts (text=True: the raw-text prompt too), model and renderer. Caches of
+    generated files (main.py's) key on it."""
+    prompt_version = _tailoring_prompt_version(sectioned)
+    if text:
+        prompt_version += f"+{TEXT_TAILORING_PROMPT_VERSION}"
+    version = f"{prompt_version}/{TAILORING_MODEL}/render-{RENDER_VERSION}"
+    if format_type.lower() == "pdf":
+        # The renderers "auto" can pick from, and Pandoc's LaTeX engine
+        renderers = "reportlab+pandoc" if REPORTLAB_AVAILABLE else "pandoc"
+        version += f"/pdf-{pdf_engine}/{renderers}/{_latex_engine()}"
+    return version
+
+def _pdf_text(value: Any) -> str:
+    """A resume field as ReportLab paragraph markup (null fields from the model become empty)"""
+    return escape("" if value is None else str(value))
+
+def _fits_standard_fonts(resume_data: Dict[str, Any]) -> bool:
+    """Whether ReportLab's built-in fonts (WinAnsi encoding, roughly cp1252) can show
+    all of a resume's text; other scripts need the Pandoc/XeTeX path"""
+    try:
+        json.dumps(resume_data, ensure_ascii=False).encode("cp1252")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+def _pdf_uses_pandoc(resume_data: Dict[str, Any], engine: str) -> bool:
+    """Whether generate_pdf renders this resume with Pandoc rather than ReportLab"""
+    if engine == "pandoc":
+        return True
+    return engine == "auto" and not (REPORTLAB_AVAILABLE and _fits_standard_fonts(resume_data))
+
+@functools.lru_cache(maxsize=1)
+def _pdf_styles() -> Dict[str, Any]:
+    """Paragraph styles of ReportLab PDFs (11pt text, like the Pandoc output), built once"""
+    sample = getSampleStyleSheet()
+    body = ParagraphStyle("ResumeBody", parent=sample["Normal"], fontSize=11, leading=14, spaceAfter=2)
+    return {
+        "name": ParagraphStyle("ResumeName", parent=sample["Title"], fontSize=18, leading=22),
+        "heading": ParagraphStyle("ResumeHeading", parent=sample["Heading2"], fontSize=13, spaceBefore=10),
+        "body": body,
+        "bullet": ParagraphStyle("ResumeBullet", parent=body, leftIndent=14, bulletIndent=4),
+    }
+
+class CommandLineResumeGenerator:
+    """Command-line resume generator using Groq API"""
+    
+    # Saved empty DOCX with the resume styles (see _new_docx)
+    _docx_template: Optional[bytes] = None
+    
+    # Key used when none is passed in; replace with your key
+    default_api_key = "YOUR_GROQ_API_KEY_HERE"
+    
+    def __init__(self, api_key: str = None, session: "requests.Session" = None,
+                 cache_path: Optional[str] = DEFAULT_CACHE_PATH, sectioned: bool = False):
+        # API key can be provided via command line or hardcoded in default_api_key
+        self.api_key = api_key or self.default_api_key
+        self.model = TAILORING_MODEL
+        self.base_url = "https://api.groq.com/openai/v1/chat/completions"
+        # Tailor each resume section with its own small parallel request
+        # (latency of the slowest section instead of one long generation)
+        self.sectioned = sectioned
+        self._prompt_version = _tailoring_prompt_version(sectioned)
+        # Keep-alive connections (retrying transient Groq errors), shared with the
+        # other Groq clients when a session is passed in
+        self._session = session if session is not None else create_groq_session(pool_maxsize=4)
+        # Tailored resumes by (resume, job) content (None disables caching)
+        self._cache = None
+        if cache_path:
+            try:
+                self._cache = LLMResponseCache(cache_path)
+            except Exception as e:
+                logger.warning(f"Tailoring cache disabled: {e}")
+        
+        if self.api_key == "YOUR_GROQ_API_KEY_HERE":
+            print("⚠️ WARNING: Using default API key placeholder. Set your key with --api-key or edit the code.")
+    
+    def load_json_file(self, file_path: str) -> Dict[str, Any]:
+        """Load and validate JSON file"""
+        # Opened without checking for it first (open reports a missing file itself)
+        try:
+            with open(file_path, 'rb') as f:
+                data = _json_loads(f.read())
+            logger.info(f"✅ Loaded JSON file: {file_path}")
+            return data
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in {file_path}: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Error reading {file_path}: {str(e)}")
+    
+    def create_tailoring_prompt(self, resume_data: Dict[str, Any], job_data: Dict[str, Any]) -> str:
+        """Create optimized prompt for resume tailoring"""
+        return f"""{_TAILORING_PROMPT_PREFIX}
+CANDIDATE DATA:
+{_prompt_json(_without_personal_info(resume_data))}
+
+JOB REQUIREMENTS:
+{_job_requirements(job_data)}
 
 Return ONLY valid JSON. Focus on job relevance and ATS optimization."""
     
-    def tailor_resume(self, resume_data: Dict[str, Any], job_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate tailored resume using Groq API"""
+    def create_section_prompt(self, section: str, resume_data: Dict[str, Any], job_data: Dict[str, Any]) -> str:
+        """Create the prompt tailoring one section (see _TAILORING_SECTIONS), with only
+        the candidate data that section needs"""
+        _, inputs, _ = _TAILORING_SECTIONS[section]
+        if inputs is None:
+            candidate = _without_personal_info(resume_data)
+        else:
+            candidate = {key: resume_data[key] for key in inputs if key in resume_data}
+        return f"""{_SECTION_PROMPT_PREFIXES[section]}
+CANDIDATE DATA:
+{_prompt_json(candidate)}
+
+JOB REQUIREMENTS:
+{_job_requirements(job_data)}
+
+Return ONLY valid JSON. Focus on job relevance and ATS optimization."""
+    
+    def create_batch_tailoring_prompt(self, resume_data: Dict[str, Any], jobs: List[Dict[str, Any]]) -> str:
+        """Create one prompt that tailors the resume to several jobs at once"""
+        job_sections = []
+        for index, job_data in enumerate(jobs, 1):
+            job_sections.append(f"JOB {index}:\n{_job_requirements(job_data)}")
+        
+        return f"""{_BATCH_TAILORING_PROMPT_PREFIX}
+CANDIDATE DATA:
+{_prompt_json(_without_personal_info(resume_data))}
+
+{chr(10).join(job_sections)}
+
+Return ONLY valid JSON with {len(jobs)} entries in "resumes". Focus on job relevance and ATS optimization."""
+    
+    def _chat_completion(self, prompt: str, max_tokens: int, timeout: int) -> Dict[str, Any]:
+        """Send a tailoring prompt to Groq and return the raw message content"""
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        payload = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are an expert resume writer specializing in ATS optimization. Return only valid JSON."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.3,
+            "max_tokens": max_tokens,
+            "stream": True
+        }
+        
+        # Tailoring shares the extractor's and parser's per-process Groq rate limit
+        _rate_limiter.acquire()
+        # Streamed, so the timeout applies between chunks rather than to the whole reply
+        with self._session.post(self.base_url, headers=headers, json=payload, timeout=timeout,
+                                stream=True) as response:
+            # Out of quota (or told to back off): pause every thread sharing the limiter
+            pause = _rate_limit_pause(response.headers)
+            if pause:
+                logger.warning(f"Groq rate limit reached, pausing requests for {pause:.1f}s")
+                _rate_limiter.pause(pause)
+            if response.status_code != 200:
+                return {
+                    "success": False,
+                    "error": f"API error: {response.status_code} - {response.text}"
+                }
+            
+            # A server that ignores "stream" sends the whole completion at once
+            if not response.headers.get("Content-Type", "").startswith("text/event-stream"):
+                return {
+                    "success": True,
+                    "content": _json_loads(response.content)["choices"][0]["message"]["content"]
+                }
+            
+            return {
+                "success": True,
+                "content": self._read_stream(response)
+            }
+    
+    def _read_stream(self, response) -> str:
+        """
+        Collect the message content of a streamed reply. A reply that starts with
+        a JSON object ends at that object (trailing text is dropped); anything else
+        (e.g. a <think> block first) is returned whole. The stream is always read
+        to the end so the pooled connection can be reused.
+        """
+        pieces = []
+        scanner = None  # created once the reply is seen to start with "{"
+        started = False
+        lines = response.iter_lines()
+        for line in lines:
+            if not line.startswith(b"data: "):
+                continue
+            data = line[6:]
+            if data == b"[DONE]":
+                break
+            piece = stream_delta_content(data)
+            if not piece:
+                continue
+            
+            pieces.append(piece)
+            complete = False
+            if scanner is not None:
+                complete = scanner.feed(piece)
+            elif not started:
+                text = "".join(pieces).lstrip()
+                if text:
+                    started = True
+                    if text[0] == "{":
+                        scanner = JSONObjectScanner()
+                        complete = scanner.feed(text)
+            if complete:
+                for _ in lines:
+                    pass
+                return scanner.json_text
+        
+        return "".join(pieces)
+    
+    def tailor_resume(self, resume_data: Dict[str, Any], job_data: Dict[str, Any],
+                      use_cache: bool = True) -> Dict[str, Any]:
+        """Generate tailored resume using Groq API (use_cache=False asks Groq even if a
+        tailored resume is cached; the new one replaces it)"""
         if self.api_key == "YOUR_GROQ_API_KEY_HERE":
             return {
                 "success": False,
                 "error": "API key not set. Use --api-key option or edit the code."
             }
         
+        cache_key = _tailoring_key(resume_data, job_data)
+        cached = self._cache_get(cache_key) if use_cache else None
+        if cached is not None:
+            logger.info(f"Using cached tailored resume ({cache_key[:16]})")
+            return cached
+        
+        if self.sectioned:
+            print(f"🤖 Tailoring resume sections with Groq {self.model}...")
+            result = self._tailor_sections(resume_data, job_data)
+            if result["success"]:
+                print("✅ Resume tailoring completed successfully")
+                self._cache_set(cache_key, result)
+            return result
+        
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             prompt = self.create_tailoring_prompt(resume_data, job_data)
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are an expert resume writer specializing in ATS optimization. Return only valid JSON."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.3,
-                "max_tokens": 4000,
-                "stream": False
-            }
             
             print(f"🤖 Tailoring resume with Groq {self.model}...")
-            response = requests.post(self.base_url, headers=headers, json=payload, timeout=60)
+            response = self._chat_completion(prompt, max_tokens=RESUME_MAX_TOKENS, timeout=RESUME_TIMEOUT)
             
-            if response.status_code == 200:
-                response_data = response.json()
-                content = response_data["choices"][0]["message"]["content"]
-                
+            if response["success"]:
                 # Extract JSON
-                json_data = self._extract_json(content)
-                if json_data:
-                    try:
-                        tailored_resume = json.loads(json_data)
-                        print("✅ Resume tailoring completed successfully")
-                        return {
-                            "success": True,
-                            "tailored_resume": tailored_resume,
-                            "model": self.model
-                        }
-                    except json.JSONDecodeError as e:
-                        return {
-                            "success": False,
-                            "error": f"Invalid JSON response: {str(e)}"
-                        }
-                else:
+                try:
+                    tailored_resume = self._load_json(response["content"])
+                except json.JSONDecodeError as e:
+                    return {
+                        "success": False,
+                        "error": f"Invalid JSON response: {str(e)}"
+                    }
+                if not isinstance(tailored_resume, dict):
                     return {
                         "success": False,
                         "error": "No valid JSON found in response"
                     }
+                tailored_resume = _with_personal_info(tailored_resume, resume_data)
+                schema_error = _tailored_resume_error(tailored_resume)
+                if schema_error:
+                    return {
+                        "success": False,
+                        "error": f"Invalid tailored resume: {schema_error}"
+                    }
+                print("✅ Resume tailoring completed successfully")
+                result = {
+                    "success": True,
+                    "tailored_resume": tailored_resume,
+                    "model": self.model
+                }
+                self._cache_set(cache_key, result)
+                return result
             else:
+                return response
+                
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Resume tailoring failed: {str(e)}"
+            }
+    
+    def tailor_section(self, section: str, resume_data: Dict[str, Any], job_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Tailor the fields of one section (see _TAILORING_SECTIONS) with its own small request"""
+        try:
+            _, _, max_tokens = _TAILORING_SECTIONS[section]
+            prompt = self.create_section_prompt(section, resume_data, job_data)
+            response = self._chat_completion(prompt, max_tokens=max_tokens, timeout=RESUME_TIMEOUT)
+            if not response["success"]:
+                return response
+            try:
+                data = self._load_json(response["content"])
+            except json.JSONDecodeError as e:
+                return {"success": False, "error": f"Invalid JSON response: {str(e)}"}
+            if not isinstance(data, dict):
+                return {"success": False, "error": "No valid JSON found in response"}
+            return {"success": True, "data": data}
+        except Exception as e:
+            return {"success": False, "error": f"Resume tailoring failed: {str(e)}"}
+    
+    def _tailor_sections(self, resume_data: Dict[str, Any], job_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Tailor all sections with parallel requests and merge them into one resume"""
+        sections = list(_TAILORING_SECTIONS)
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            responses = list(executor.map(
+                lambda section: self.tailor_section(section, resume_data, job_data), sections
+            ))
+        
+        tailored = {}
+        for section, response in zip(sections, responses):
+            if not response["success"]:
+                return {**response, "error": f"{section}: {response['error']}"}
+            fields, _, _ = _TAILORING_SECTIONS[section]
+            for field in fields:
+                tailored[field] = response["data"].get(field, type(_TAILORED_SECTIONS_FIELDS[field])())
+        
+        # Keep the schema's field order
+        tailored = _with_personal_info({field: tailored[field] for field in _TAILORED_SECTIONS_FIELDS}, resume_data)
+        schema_error = _tailored_resume_error(tailored)
+        if schema_error:
+            return {"success": False, "error": f"Invalid tailored resume: {schema_error}"}
+        return {"success": True, "tailored_resume": tailored, "model": self.model}
+    
+    def tailor_resume_from_text(self, resume_text: str, job_text: str, contact_text: Optional[str] = None,
+                                use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Tailor a resume straight from resume and job description text with one
+        Groq request (no separate extraction and parsing requests). Meant for
+        short inputs; the result also has "job_data" with the job title and company.
+        Contact details are looked up in contact_text (the uncleaned document
+        text) if given, else in resume_text. use_cache works as in tailor_resume.
+        """
+        if self.api_key == "YOUR_GROQ_API_KEY_HERE":
+            return {
+                "success": False,
+                "error": "API key not set. Use --api-key option or edit the code."
+            }
+        
+        cache_key = _tailoring_key({"text": resume_text}, {"text": job_text})
+        cached = self._cache_get(cache_key, TEXT_TAILORING_PROMPT_VERSION) if use_cache else None
+        if cached is not None:
+            logger.info(f"Using cached tailored resume ({cache_key[:16]})")
+            return cached
+        
+        try:
+            prompt = f"""{_TEXT_TAILORING_PROMPT_PREFIX}
+RESUME TEXT:
+{resume_text}
+
+JOB DESCRIPTION:
+{job_text}
+
+Return ONLY valid JSON. Focus on job relevance and ATS optimization."""
+            
+            print(f"🤖 Tailoring resume with Groq {self.model}...")
+            response = self._chat_completion(prompt, max_tokens=RESUME_MAX_TOKENS, timeout=RESUME_TIMEOUT)
+            if not response["success"]:
+                return response
+            
+            parsed = self._load_json(response["content"])
+            if parsed is None or not isinstance(parsed.get("resume"), dict):
                 return {
                     "success": False,
-                    "error": f"API error: {response.status_code} - {response.text}"
+                    "error": "No tailored resume found in response"
                 }
-                
+            
+            tailored_resume = _with_personal_info(parsed["resume"], {
+                "personal_info": _text_personal_info(parsed["resume"].get("personal_info"),
+                                                     contact_text or resume_text)
+            })
+            schema_error = _tailored_resume_error(tailored_resume)
+            if schema_error:
+                return {
+                    "success": False,
+                    "error": f"Invalid tailored resume: {schema_error}"
+                }
+            
+            job_data = parsed.get("job")
+            print("✅ Resume tailoring completed successfully")
+            result = {
+                "success": True,
+                "tailored_resume": tailored_resume,
+                "job_data": job_data if isinstance(job_data, dict) else {},
+                "model": self.model
+            }
+            self._cache_set(cache_key, result, TEXT_TAILORING_PROMPT_VERSION)
+            return result
+            
         except Exception as e:
             return {
                 "success": False,
                 "error": f"Resume tailoring failed: {str(e)}"
             }
     
+    def tailor_resume_batch(self, resume_data: Dict[str, Any], jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Tailor one resume to several jobs, sending the resume once per group of
+        up to BATCH_JOBS_PER_REQUEST jobs instead of once per job.
+        
+        Returns one tailor_resume-style result per job, in order. Jobs missing
+        from a batch response are retried individually with tailor_resume.
+        In sectioned mode each job is tailored on its own with tailor_resume.
+        """
+        if len(jobs) <= 1 or self.sectioned:
+            return [self.tailor_resume(resume_data, job_data) for job_data in jobs]
+        
+        if self.api_key == "YOUR_GROQ_API_KEY_HERE":
+            return [{
+                "success": False,
+                "error": "API key not set. Use --api-key option or edit the code."
+            } for _ in jobs]
+        
+        # Only jobs without a cached tailored resume are sent to Groq
+        results = [None] * len(jobs)
+        cache_keys = [_tailoring_key(resume_data, job_data) for job_data in jobs]
+        pending = []
+        for index, cache_key in enumerate(cache_keys):
+            results[index] = self._cache_get(cache_key)
+            if results[index] is None:
+                pending.append(index)
+        if len(pending) < len(jobs):
+            logger.info(f"Using {len(jobs) - len(pending)} cached tailored resume(s)")
+        
+        for start in range(0, len(pending), BATCH_JOBS_PER_REQUEST):
+            group = pending[start:start + BATCH_JOBS_PER_REQUEST]
+            group_results = self._tailor_group(resume_data, [jobs[index] for index in group])
+            for index, result in zip(group, group_results):
+                if result["success"]:
+                    self._cache_set(cache_keys[index], result)
+                results[index] = result
+        return results
+    
+    def _cache_get(self, cache_key: str, prompt_version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Cached tailoring result for a (resume, job) key, if caching is enabled"""
+        if self._cache is None:
+            return None
+        try:
+            return self._cache.get(cache_key, prompt_version or self._prompt_version, self.model)
+        except Exception as e:
+            logger.warning(f"Could not read tailoring cache: {e}")
+            return None
+    
+    def _cache_set(self, cache_key: str, result: Dict[str, Any], prompt_version: Optional[str] = None) -> None:
+        """Store a successful tailoring result, if caching is enabled"""
+        if self._cache is None:
+            return
+        try:
+            self._cache.set(cache_key, prompt_version or self._prompt_version, self.model, result)
+        except Exception as e:
+            logger.warning(f"Could not cache tailored resume: {e}")
+    
+    def _tailor_group(self, resume_data: Dict[str, Any], jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Tailor one resume to a group of jobs with a single Groq request"""
+        if len(jobs) == 1:
+            return [self.tailor_resume(resume_data, jobs[0])]
+        
+        try:
+            prompt = self.create_batch_tailoring_prompt(resume_data, jobs)
+            
+            print(f"🤖 Tailoring resume for {len(jobs)} jobs with Groq {self.model}...")
+            response = self._chat_completion(prompt, max_tokens=min(RESUME_MAX_TOKENS * len(jobs), BATCH_MAX_TOKENS),
+                                             timeout=min(RESUME_TIMEOUT * len(jobs), BATCH_TIMEOUT))
+            if response["success"]:
+                parsed = self._load_json(response["content"])
+                entries = parsed.get("resumes") if isinstance(parsed, dict) else None
+                if not isinstance(entries, list):
+                    logger.warning("Batch response has no list of resumes, tailoring each job individually")
+                    entries = []
+            else:
+                logger.warning(f"Batch request failed ({response['error']}), tailoring each job individually")
+                entries = []
+        except Exception as e:
+            logger.warning(f"Batch request failed ({e}), tailoring each job individually")
+            entries = []
+        
+        # Invalid resumes are treated as missing and retried individually
+        tailored = {}
+        for entry in entries:
+            if (isinstance(entry, dict) and isinstance(entry.get("job_index"), int)
+                    and isinstance(entry.get("resume"), dict)):
+                tailored_resume = _with_personal_info(entry["resume"], resume_data)
+                if _tailored_resume_error(tailored_resume) is None:
+                    tailored[entry.get("job_index")] = tailored_resume
+        
+        results = []
+        for index, job_data in enumerate(jobs, 1):
+            if index in tailored:
+                results.append({
+                    "success": True,
+                    "tailored_resume": tailored[index],
+                    "model": self.model
+                })
+            else:
+                logger.warning(f"Batch response missing or invalid for job {index}, tailoring it individually")
+                results.append(self.tailor_resume(resume_data, job_data))
+        
+        print(f"✅ Resume tailoring completed for {len(jobs)} jobs")
+        return results
+    
+    def _load_json(self, content: str) -> Any:
+        """Parse the JSON object in a response, or return None if there is none"""
+        # Usually the response is just the object, so try it as-is before scanning for it
+        try:
+            parsed = _json_loads(content)
+            if isinstance(parsed, dict):
+                return parsed
+        except json.JSONDecodeError:
+            pass
+        
+        json_data = self._extract_json(content)
+        return _json_loads(json_data) if json_data else None
+    
     def _extract_json(self, content: str) -> str:
-        """Extract JSON from response content"""
-        # Look for JSON in code blocks
-        if "```json" in content:
-            start = content.find("```json") + 7
-            end = content.find("```", start)
-            if end != -1:
-                return content[start:end].strip()
-        
-        # Find JSON between braces
-        start = content.find('{')
-        end = content.rfind('}') + 1
-        if start != -1 and end > start:
-            return content[start:end]
-        
-        # Try entire content
-        content = content.strip()
-        if content.startswith('{') and content.endswith('}'):
-            return content
-        
-        return ""
+        """Extract JSON from response content (ignoring any <think> blocks)"""
+        if "<think>" in content:
+            content = _THINK_RE.sub("", content)
+        match = _JSON_FENCE_RE.search(content)
+        if match:
+            return match.group(1)
+        match = _JSON_SPAN_RE.search(content)
+        return match.group(0) if match else ""
     
     def generate_docx(self, resume_data: Dict[str, Any], output_path: str) -> Dict[str, Any]:
         """Generate DOCX document"""
@@ -257,10 +955,8 @@ Return ONLY valid JSON. Focus on job relevance and ATS optimization."""
             }
         
         try:
-            doc = Document()
-            
-            # Set document styles
-            self._setup_docx_styles(doc)
+            _import_docx()
+            doc = self._new_docx()
             
             # Add resume sections
             self._add_personal_section(doc, resume_data.get("personal_info", {}))
@@ -272,9 +968,10 @@ Return ONLY valid JSON. Focus on job relevance and ATS optimization."""
             self._add_projects_section(doc, resume_data.get("projects", []))
             self._add_certifications_section(doc, resume_data.get("certifications", []))
             
-            # Save document
-            doc.save(output_path)
-            file_size = os.path.getsize(output_path) / 1024
+            # Save document (the open file's position gives its size without a stat)
+            with open(output_path, 'wb') as f:
+                doc.save(f)
+                file_size = f.tell() / 1024
             
             print(f"✅ DOCX generated: {output_path} ({file_size:.1f} KB)")
             
@@ -291,35 +988,138 @@ Return ONLY valid JSON. Focus on job relevance and ATS optimization."""
                 "error": f"DOCX generation failed: {str(e)}"
             }
     
-    def generate_pdf(self, resume_data: Dict[str, Any], output_path: str) -> Dict[str, Any]:
+    def generate_pdf(self, resume_data: Dict[str, Any], output_path: str, engine: str = "auto") -> Dict[str, Any]:
+        """
+        Generate PDF document
+        
+        engine: "reportlab" renders in-process, "pandoc" converts markdown with
+        pandoc and tectonic (or xelatex); "auto" uses ReportLab when it is installed
+        and its built-in fonts cover the resume's text, Pandoc otherwise
+        """
+        if _pdf_uses_pandoc(resume_data, engine):
+            return self._generate_pdf_pandoc(resume_data, output_path)
+        
+        if not REPORTLAB_AVAILABLE:
+            return {
+                "success": False,
+                "error": "reportlab not available. Install with: pip install reportlab"
+            }
+        
+        try:
+            _import_reportlab()
+            # Built into an open file, whose position then gives the size without a stat
+            with open(output_path, 'wb') as f:
+                doc = SimpleDocTemplate(f, pagesize=letter, leftMargin=inch, rightMargin=inch,
+                                        topMargin=inch, bottomMargin=inch)
+                doc.build(self._pdf_story(resume_data))
+                file_size = f.tell() / 1024
+            
+            print(f"✅ PDF generated: {output_path} ({file_size:.1f} KB)")
+            
+            return {
+                "success": True,
+                "output_path": output_path,
+                "format": "PDF",
+                "file_size_kb": file_size
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"PDF generation failed: {str(e)}"
+            }
+    
+    def _pdf_story(self, resume_data: Dict[str, Any]) -> list:
+        """ReportLab flowables for a resume, in the same sections and order as _generate_markdown"""
+        styles = _pdf_styles()
+        story = []
+        
+        def heading(title: str) -> None:
+            story.append(Paragraph(title, styles["heading"]))
+        
+        # Personal info
+        personal = resume_data.get("personal_info", {})
+        if personal.get("name"):
+            story.append(Paragraph(_pdf_text(personal["name"]), styles["name"]))
+        
+        # Contact
+        contact = _contact_line(personal)
+        if contact:
+            story.append(Paragraph(f"<b>{_pdf_text(contact)}</b>", styles["body"]))
+        
+        # Summary
+        if resume_data.get("professional_summary"):
+            heading("Professional Summary")
+            story.append(Paragraph(_pdf_text(resume_data["professional_summary"]), styles["body"]))
+        
+        # Skills
+        skills = resume_data.get("core_competencies", [])
+        if skills:
+            heading("Core Competencies")
+            story.append(Paragraph(_pdf_text(" • ".join(skills)), styles["body"]))
+        
+        # Experience
+        experience = resume_data.get("professional_experience", [])
+        if experience:
+            heading("Professional Experience")
+            for job in experience:
+                story.append(Paragraph(
+                    f"<b>{_pdf_text(job.get('position'))} | {_pdf_text(job.get('company'))}</b>", styles["body"]
+                ))
+                story.append(Paragraph(
+                    f"<i>{_pdf_text(job.get('duration'))} | {_pdf_text(job.get('location'))}</i>", styles["body"]
+                ))
+                for achievement in job.get('achievements', []):
+                    # The model often writes its own bullet; the paragraph already has one
+                    if achievement.startswith(("• ", "- ")):
+                        achievement = achievement[2:]
+                    story.append(Paragraph(_pdf_text(achievement), styles["bullet"], bulletText="•"))
+                story.append(Spacer(1, 6))
+        
+        # Education
+        education = resume_data.get("education", [])
+        if education:
+            heading("Education")
+            for edu in education:
+                story.append(Paragraph(
+                    f"<b>{_pdf_text(edu.get('degree'))} in {_pdf_text(edu.get('field'))}</b>", styles["body"]
+                ))
+                story.append(Paragraph(
+                    f"<i>{_pdf_text(edu.get('institution'))} | {_pdf_text(edu.get('graduation_year'))}</i>",
+                    styles["body"]
+                ))
+        
+        return story
+    
+    def _generate_pdf_pandoc(self, resume_data: Dict[str, Any], output_path: str) -> Dict[str, Any]:
         """Generate PDF using Pandoc"""
         try:
             # Generate markdown content
             markdown_content = self._generate_markdown(resume_data)
             
-            # Create temporary markdown file
-            temp_md = output_path.replace('.pdf', '_temp.md')
-            with open(temp_md, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
-            
-            # Convert to PDF using Pandoc
+            # Convert to PDF using Pandoc, piping the markdown in rather than
+            # writing and deleting a temporary file
             import subprocess
+            engine = _latex_engine()
             pandoc_cmd = [
-                'pandoc', temp_md, '-o', output_path,
-                '--pdf-engine=xelatex',
+                'pandoc', '-f', 'markdown', '-o', output_path,
+                f'--pdf-engine={engine}',
                 '-V', 'geometry:margin=1in',
                 '-V', 'fontsize=11pt',
                 '-V', 'linestretch=1.1'
             ]
             
-            result = subprocess.run(pandoc_cmd, capture_output=True, text=True, timeout=30)
+            result = subprocess.run(pandoc_cmd, input=markdown_content, capture_output=True,
+                                    text=True, encoding='utf-8', timeout=30)
             
-            # Clean up temp file
-            if os.path.exists(temp_md):
-                os.remove(temp_md)
+            # One stat both confirms the PDF was written and gives its size
+            try:
+                output_stat = os.stat(output_path) if result.returncode == 0 else None
+            except FileNotFoundError:
+                output_stat = None
             
-            if result.returncode == 0 and os.path.exists(output_path):
-                file_size = os.path.getsize(output_path) / 1024
+            if output_stat is not None:
+                file_size = output_stat.st_size / 1024
                 print(f"✅ PDF generated: {output_path} ({file_size:.1f} KB)")
                 
                 return {
@@ -328,6 +1128,12 @@ Return ONLY valid JSON. Focus on job relevance and ATS optimization."""
                     "format": "PDF",
                     "file_size_kb": file_size
                 }
+            elif f"{engine} not found" in result.stderr:
+                return {
+                    "success": False,
+                    "error": f"{engine} not found. Install Tectonic (https://tectonic-typesetting.github.io), "
+                             "or a TeX distribution with xelatex"
+                }
             else:
                 return {
                     "success": False,
@@ -345,29 +1151,48 @@ Return ONLY valid JSON. Focus on job relevance and ATS optimization."""
                 "error": f"PDF generation failed: {str(e)}"
             }
     
+    def _new_docx(self):
+        """Empty document with the resume styles, loaded from a styled template
+        that is built once per process (cheaper than styling each document)"""
+        template = CommandLineResumeGenerator._docx_template
+        if template is None:
+            doc = Document()
+            self._setup_docx_styles(doc)
+            buffer = io.BytesIO()
+            doc.save(buffer)
+            template = CommandLineResumeGenerator._docx_template = buffer.getvalue()
+        return Document(io.BytesIO(template))
+    
     def _setup_docx_styles(self, doc):
         """Setup document styles"""
         # Normal style
         normal_style = doc.styles['Normal']
         normal_style.font.name = 'Arial'
         normal_style.font.size = Pt(11)
+        
+        # Section headings and the name get their formatting from styles
+        # registered once here instead of from font edits on every run
+        heading_style = doc.styles.add_style('ResumeHeading', WD_STYLE_TYPE.PARAGRAPH)
+        heading_style.base_style = normal_style
+        heading_style.font.name = 'Arial'
+        heading_style.font.size = Pt(12)
+        heading_style.font.bold = True
+        
+        name_style = doc.styles.add_style('ResumeName', WD_STYLE_TYPE.PARAGRAPH)
+        name_style.base_style = normal_style
+        name_style.font.size = Pt(16)
+        name_style.font.bold = True
+        name_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
     
     def _add_personal_section(self, doc, personal_info):
         """Add personal information"""
         if personal_info.get("name"):
-            name_para = doc.add_paragraph(personal_info["name"])
-            name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            name_para.runs[0].font.size = Pt(16)
-            name_para.runs[0].font.bold = True
+            doc.add_paragraph(personal_info["name"], style='ResumeName')
         
         # Contact info
-        contact_parts = []
-        for field in ['email', 'phone', 'location']:
-            if personal_info.get(field):
-                contact_parts.append(personal_info[field])
-        
-        if contact_parts:
-            contact_para = doc.add_paragraph(" | ".join(contact_parts))
+        contact = _contact_line(personal_info)
+        if contact:
+            contact_para = doc.add_paragraph(contact)
             contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         
         doc.add_paragraph()  # Spacing
@@ -375,18 +1200,14 @@ Return ONLY valid JSON. Focus on job relevance and ATS optimization."""
     def _add_summary_section(self, doc, summary):
         """Add professional summary"""
         if summary:
-            heading = doc.add_paragraph("PROFESSIONAL SUMMARY")
-            heading.runs[0].font.bold = True
-            heading.runs[0].font.size = Pt(12)
+            doc.add_paragraph("PROFESSIONAL SUMMARY", style='ResumeHeading')
             doc.add_paragraph(summary)
             doc.add_paragraph()
     
     def _add_skills_section(self, doc, competencies):
         """Add core competencies"""
         if competencies:
-            heading = doc.add_paragraph("CORE COMPETENCIES")
-            heading.runs[0].font.bold = True
-            heading.runs[0].font.size = Pt(12)
+            doc.add_paragraph("CORE COMPETENCIES", style='ResumeHeading')
             skills_text = " • ".join(competencies)
             doc.add_paragraph(skills_text)
             doc.add_paragraph()
@@ -394,9 +1215,9 @@ Return ONLY valid JSON. Focus on job relevance and ATS optimization."""
     def _add_experience_section(self, doc, experience):
         """Add professional experience"""
         if experience:
-            heading = doc.add_paragraph("PROFESSIONAL EXPERIENCE")
-            heading.runs[0].font.bold = True
-            heading.runs[0].font.size = Pt(12)
+            doc.add_paragraph("PROFESSIONAL EXPERIENCE", style='ResumeHeading')
+            # Looked up once rather than by name for every bullet
+            bullet_style = doc.styles['List Bullet']
             
             for job in experience:
                 # Job header
@@ -411,16 +1232,14 @@ Return ONLY valid JSON. Focus on job relevance and ATS optimization."""
                 
                 # Achievements
                 for achievement in job.get('achievements', []):
-                    doc.add_paragraph(achievement, style='List Bullet')
+                    doc.add_paragraph(achievement, style=bullet_style)
                 
                 doc.add_paragraph()  # Spacing between jobs
     
     def _add_education_section(self, doc, education):
         """Add education"""
         if education:
-            heading = doc.add_paragraph("EDUCATION")
-            heading.runs[0].font.bold = True
-            heading.runs[0].font.size = Pt(12)
+            doc.add_paragraph("EDUCATION", style='ResumeHeading')
             
             for edu in education:
                 edu_text = f"{edu.get('degree', '')} in {edu.get('field', '')}"
@@ -436,9 +1255,7 @@ Return ONLY valid JSON. Focus on job relevance and ATS optimization."""
     def _add_technical_skills_section(self, doc, tech_skills):
         """Add technical skills"""
         if tech_skills:
-            heading = doc.add_paragraph("TECHNICAL SKILLS")
-            heading.runs[0].font.bold = True
-            heading.runs[0].font.size = Pt(12)
+            doc.add_paragraph("TECHNICAL SKILLS", style='ResumeHeading')
             
             for category, skills in tech_skills.items():
                 if skills:
@@ -451,9 +1268,7 @@ Return ONLY valid JSON. Focus on job relevance and ATS optimization."""
     def _add_projects_section(self, doc, projects):
         """Add projects"""
         if projects:
-            heading = doc.add_paragraph("PROJECTS")
-            heading.runs[0].font.bold = True
-            heading.runs[0].font.size = Pt(12)
+            doc.add_paragraph("PROJECTS", style='ResumeHeading')
             
             for project in projects:
                 project_para = doc.add_paragraph()
@@ -472,64 +1287,49 @@ Return ONLY valid JSON. Focus on job relevance and ATS optimization."""
     def _add_certifications_section(self, doc, certifications):
         """Add certifications"""
         if certifications:
-            heading = doc.add_paragraph("CERTIFICATIONS")
-            heading.runs[0].font.bold = True
-            heading.runs[0].font.size = Pt(12)
+            doc.add_paragraph("CERTIFICATIONS", style='ResumeHeading')
+            bullet_style = doc.styles['List Bullet']
             
             for cert in certifications:
                 cert_text = f"{cert.get('name', '')} - {cert.get('issuer', '')}"
                 if cert.get('date'):
                     cert_text += f" ({cert['date']})"
-                doc.add_paragraph(cert_text, style='List Bullet')
+                doc.add_paragraph(cert_text, style=bullet_style)
             
             doc.add_paragraph()
     
     def _generate_markdown(self, resume_data: Dict[str, Any]) -> str:
         """Generate markdown for PDF conversion"""
+        # Blocks of one or more lines each, joined once at the end
         lines = []
         
         # Personal info
         personal = resume_data.get("personal_info", {})
         if personal.get("name"):
-            lines.append(f"# {personal['name']}")
-            lines.append("")
+            lines.append(f"# {personal['name']}\n")
         
         # Contact
-        contact_info = []
-        for field in ['email', 'phone', 'location']:
-            if personal.get(field):
-                contact_info.append(personal[field])
-        
-        if contact_info:
-            lines.append(f"**{' | '.join(contact_info)}**")
-            lines.append("")
+        contact = _contact_line(personal)
+        if contact:
+            lines.append(f"**{contact}**\n")
         
         # Summary
         if resume_data.get("professional_summary"):
-            lines.append("## Professional Summary")
-            lines.append("")
-            lines.append(resume_data["professional_summary"])
-            lines.append("")
+            lines.append(f"## Professional Summary\n\n{resume_data['professional_summary']}\n")
         
         # Skills
         skills = resume_data.get("core_competencies", [])
         if skills:
-            lines.append("## Core Competencies")
-            lines.append("")
-            lines.append(" • ".join(skills))
-            lines.append("")
+            lines.append(f"## Core Competencies\n\n{' • '.join(skills)}\n")
         
         # Experience
         experience = resume_data.get("professional_experience", [])
         if experience:
-            lines.append("## Professional Experience")
-            lines.append("")
+            lines.append("## Professional Experience\n")
             
             for job in experience:
-                lines.append(f"**{job.get('position', '')} | {job.get('company', '')}**")
-                lines.append(f"*{job.get('duration', '')} | {job.get('location', '')}*")
-                lines.append("")
-                
+                lines.append(f"**{job.get('position', '')} | {job.get('company', '')}**\n"
+                             f"*{job.get('duration', '')} | {job.get('location', '')}*\n")
                 for achievement in job.get('achievements', []):
                     lines.append(f"- {achievement}")
                 lines.append("")
@@ -537,16 +1337,118 @@ Return ONLY valid JSON. Focus on job relevance and ATS optimization."""
         # Education
         education = resume_data.get("education", [])
         if education:
-            lines.append("## Education")
-            lines.append("")
+            lines.append("## Education\n")
             
             for edu in education:
-                lines.append(f"**{edu.get('degree', '')} in {edu.get('field', '')}**")
-                lines.append(f"*{edu.get('institution', '')} | {edu.get('graduation_year', '')}*")
-                lines.append("")
+                lines.append(f"**{edu.get('degree', '')} in {edu.get('field', '')}**\n"
+                             f"*{edu.get('institution', '')} | {edu.get('graduation_year', '')}*\n")
         
         return "\n".join(lines)
 
+# Pairs tailored at once in --batch mode (each mostly waits on its Groq request)
+BATCH_WORKERS = 8
+
+def _default_output_name(resume_data: Dict[str, Any]) -> str:
+    """Output filename (without extension) from the candidate's name and the current time"""
+    candidate_name = resume_data.get("personal_info", {}).get("name", "resume")
+    safe_name = "".join(c for c in candidate_name if c.isalnum() or c in (' ', '-', '_')).strip()
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"{safe_name}_tailored_{timestamp}"
+
+def _render_outputs(generator: CommandLineResumeGenerator, tailored_resume: Dict[str, Any],
+                    base_output: str, format_type: str, pdf_engine: str) -> List[Dict[str, Any]]:
+    """Write the tailored resume as DOCX and/or PDF; returns one result per file"""
+    renderers = []
+    if format_type in ["docx", "both"]:
+        renderers.append(("DOCX", generator.generate_docx, f"{base_output}.docx"))
+    if format_type in ["pdf", "both"]:
+        renderers.append(("PDF", functools.partial(generator.generate_pdf, engine=pdf_engine),
+                          f"{base_output}.pdf"))
+    
+    # With --format both a Pandoc PDF (a subprocess) is rendered while python-docx
+    # builds the DOCX; ReportLab and python-docx are both pure Python and hold the
+    # GIL, so they run one after the other
+    overlap = format_type == "both" and _pdf_uses_pandoc(tailored_resume, pdf_engine)
+    with ThreadPoolExecutor(max_workers=len(renderers) if overlap else 1) as executor:
+        futures = []
+        for label, render, output_path in renderers:
+            print(f"📄 Generating {label}: {output_path}")
+            futures.append((label, executor.submit(render, tailored_resume, output_path)))
+        
+        results = []
+        for label, future in futures:
+            file_result = future.result()
+            if not file_result["success"]:
+                print(f"❌ {label} generation failed: {file_result['error']}")
+            results.append(file_result)
+    return results
+
+def _run_batch(generator: CommandLineResumeGenerator, args, results_out) -> int:
+    """
+    Tailor every (resume, job) pair listed in the --batch NDJSON file, each line
+    like {"resume": "a.json", "job": "b.json", "output": "name"} ("output" is
+    optional). Pairs run concurrently on the one generator, so its Groq session,
+    cache and DOCX template are shared. One NDJSON result per pair is written to
+    results_out as it finishes.
+    
+    Returns the number of failed pairs.
+    """
+    with open(args.batch, 'rb') as f:
+        lines = [line for line in f.read().splitlines() if line.strip()]
+    
+    # Resume and job files are loaded up front, each once however many pairs use it
+    pairs = []
+    loaded = {}
+    for line_number, line in enumerate(lines, 1):
+        try:
+            pair = _json_loads(line)
+            for path in (pair["resume"], pair["job"]):
+                if not isinstance(path, str):
+                    raise TypeError(f"file paths must be strings, got {path!r}")
+                if path not in loaded:
+                    try:
+                        loaded[path] = generator.load_json_file(path)
+                    except Exception as e:
+                        loaded[path] = e
+        except Exception as e:
+            pairs.append((line_number, None, f"Invalid batch entry: {e}"))
+            continue
+        pairs.append((line_number, pair, None))
+    
+    def run_pair(line_number, pair, error):
+        if pair is None:
+            return {"line": line_number, "success": False, "error": error}
+        result = {"line": line_number, "resume": pair["resume"], "job": pair["job"]}
+        resume_data, job_data = loaded[pair["resume"]], loaded[pair["job"]]
+        for data in (resume_data, job_data):
+            if isinstance(data, Exception):
+                return {**result, "success": False, "error": str(data)}
+        
+        tailoring_result = generator.tailor_resume(resume_data, job_data)
+        if not tailoring_result["success"]:
+            return {**result, "success": False, "error": tailoring_result["error"]}
+        
+        base_output = pair.get("output") or f"{_default_output_name(resume_data)}_{line_number}"
+        file_results = _render_outputs(generator, tailoring_result["tailored_resume"], base_output,
+                                       args.format, args.pdf_engine)
+        outputs = [file_result["output_path"] for file_result in file_results if file_result["success"]]
+        if not outputs:
+            return {**result, "success": False,
+                    "error": "; ".join(file_result["error"] for file_result in file_results)}
+        return {**result, "success": True, "outputs": outputs}
+    
+    failures = 0
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(run_pair, *entry) for entry in pairs]
+        for future in as_completed(futures):
+            result = future.result()
+            failures += not result["success"]
+            results_out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            results_out.flush()
+    
+    print(f"🎉 Batch finished: {len(pairs) - failures} of {len(pairs)} pair(s) succeeded")
+    return failures
+
 def main():
     """Main command-line interface"""
     parser = argparse.ArgumentParser(
@@ -557,11 +1459,12 @@ Examples:
   python resume_generator.py resume.json job.json --format pdf
   python resume_generator.py data/resume.json data/job.json --output tailored_resume --format docx
   python resume_generator.py resume.json job.json --format pdf --api-key gsk_your_key_here
+  python resume_generator.py --batch pairs.jsonl --format docx > results.jsonl
 """
     )
     
-    parser.add_argument("resume_json", help="Path to resume data JSON file")
-    parser.add_argument("job_json", help="Path to job requirements JSON file")
+    parser.add_argument("resume_json", nargs="?", help="Path to resume data JSON file")
+    parser.add_argument("job_json", nargs="?", help="Path to job requirements JSON file")
     parser.add_argument("--output", "-o", default=None,
                        help="Output filename (without extension)")
     parser.add_argument("--format", "-f", choices=["pdf", "docx", "both"],
@@ -570,18 +1473,55 @@ Examples:
                        help="Groq API key (or edit code to hardcode)")
     parser.add_argument("--verbose", "-v", action="store_true",
                        help="Enable verbose logging")
+    parser.add_argument("--pdf-engine", choices=["auto", "reportlab", "pandoc"], default="auto",
+                       help="PDF renderer (default: ReportLab if installed, else Pandoc)")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Always call Groq instead of reusing a cached tailored resume")
+    parser.add_argument("--sectioned", action="store_true",
+                       help="Tailor each resume section with its own parallel request")
+    parser.add_argument("--batch", metavar="PAIRS_JSONL", default=None,
+                       help='Tailor every pair in an NDJSON file of {"resume": ..., "job": ..., "output": ...} '
+                            'lines, writing one NDJSON result per pair to stdout')
+    parser.add_argument("--workers", type=int, default=BATCH_WORKERS,
+                       help=f"Pairs tailored concurrently with --batch (default: {BATCH_WORKERS})")
     
     args = parser.parse_args()
+    if args.batch is None and (args.resume_json is None or args.job_json is None):
+        parser.error("resume_json and job_json are required unless --batch is given")
+    if args.batch is not None and args.resume_json is not None:
+        parser.error("--batch takes the resume and job files from the batch file, not as arguments")
+    if args.batch is not None and args.output is not None:
+        parser.error('--batch takes output names from each entry\'s "output" field, not --output')
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
     
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    cache_path = None if args.no_cache else DEFAULT_CACHE_PATH
+    
+    if args.batch:
+        # stdout carries only the NDJSON results; progress messages go to stderr
+        results_out = sys.stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            print("🚀 RESUME GENERATOR - Module 3 (batch)")
+            print("=" * 40)
+            try:
+                generator = CommandLineResumeGenerator(api_key=args.api_key, cache_path=cache_path,
+                                                       sectioned=args.sectioned)
+                failures = _run_batch(generator, args, results_out)
+            except OSError as e:
+                print(f"❌ FILE ERROR: {str(e)}")
+                sys.exit(1)
+        sys.exit(1 if failures else 0)
+    
     print("🚀 RESUME GENERATOR - Module 3")
     print("=" * 40)
     
     try:
         # Initialize generator
-        generator = CommandLineResumeGenerator(api_key=args.api_key)
+        generator = CommandLineResumeGenerator(api_key=args.api_key, cache_path=cache_path,
+                                               sectioned=args.sectioned)
         
         # Load JSON files
         print(f"📚 Loading resume data: {args.resume_json}")
@@ -591,13 +1531,7 @@ Examples:
         job_data = generator.load_json_file(args.job_json)
         
         # Generate output filename if not provided
-        if args.output:
-            base_output = args.output
-        else:
-            candidate_name = resume_data.get("personal_info", {}).get("name", "resume")
-            safe_name = "".join(c for c in candidate_name if c.isalnum() or c in (' ', '-', '_')).strip()
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            base_output = f"{safe_name}_tailored_{timestamp}"
+        base_output = args.output or _default_output_name(resume_data)
         
         # Tailor resume
         print(f"🤖 Tailoring resume using Groq {generator.model}...")
@@ -610,27 +1544,8 @@ Examples:
         tailored_resume = tailoring_result["tailored_resume"]
         
         # Generate documents
-        success_count = 0
-        
-        if args.format in ["docx", "both"]:
-            output_path = f"{base_output}.docx"
-            print(f"📄 Generating DOCX: {output_path}")
-            docx_result = generator.generate_docx(tailored_resume, output_path)
-            
-            if docx_result["success"]:
-                success_count += 1
-            else:
-                print(f"❌ DOCX generation failed: {docx_result['error']}")
-        
-        if args.format in ["pdf", "both"]:
-            output_path = f"{base_output}.pdf"
-            print(f"📄 Generating PDF: {output_path}")
-            pdf_result = generator.generate_pdf(tailored_resume, output_path)
-            
-            if pdf_result["success"]:
-                success_count += 1
-            else:
-                print(f"❌ PDF generation failed: {pdf_result['error']}")
+        file_results = _render_outputs(generator, tailored_resume, base_output, args.format, args.pdf_engine)
+        success_count = sum(1 for file_result in file_results if file_result["success"])
         
         # Summary
         if success_count > 0:
@@ -661,4 +1576,4 @@ Examples:
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()